@@ -42,7 +42,9 @@ class ChoiceItem(item.Item):
 		self.color = copy.copy(color)
 
 	def draw(self, surface):
-		super(ChoiceItem, self).draw(surface)
+		dirty_rect = super(ChoiceItem, self).draw(surface)
 
 		# Draw the font surface in the middle of this item.
 		surface.blit(self.font_surface, ((self.rect.x + (self.rect.width - self.font_surface.get_width()) / 2) + 0.5 * settings.GAME_SCALE, self.rect.y + (self.rect.height - self.font_surface.get_height()) / 2))
+
+		return dirty_rect
@@ -4,6 +4,7 @@ __license__ = "All Rights Reserved"
 import pygame
 import copy
 import math
+import other.assets as assets
 import objects.shadow as shadow
 import gui.item as item
 import settings.settings as settings
@@ -23,14 +24,14 @@ class ImageItem(item.Item):
 		# Values can be stored here, for when you want to retrieve it later (via chosing the item, for instance).
 		self.value = None
 
-		# Load the image from the path.
-		self.image = pygame.image.load(path)
-
-		# Scale image to settings.GAME_SCALE.
-		self.image = pygame.transform.scale(self.image, (self.image.get_width() * settings.GAME_SCALE, self.image.get_height() * settings.GAME_SCALE))
+		# Load the image from the path, scaled to settings.GAME_SCALE. It's only actually loaded the first time, but we get our own copy,
+		# since some menus colorize the image.
+		self.image = assets.get_image(path).copy()
 
 	def draw(self, surface):
-		super(ImageItem, self).draw(surface)
+		dirty_rect = super(ImageItem, self).draw(surface)
 
 		# Finally, blit the image to the given surface (on top of everything else drawn in here).
 		surface.blit(self.image, ((self.rect.x + (self.rect.width - self.image.get_width()) / 2), self.rect.y + (self.rect.height - self.image.get_height()) / 2))
+
+		return dirty_rect
@@ -109,6 +109,10 @@ class Item(object):
 		self.shadow_rect.y = self.y + self.shadow_offset_y + self.y_nudge
 			
 	def draw(self, surface):
+		# Draws the item and returns the rect of the screen that we've drawn to. We simply include the borders whether they are drawn
+		# or not, they're only slightly larger than the item itself.
+		dirty_rect = self.shadow_rect.unionall([self.rect, self.selected_rect, self.chosen_rect])
+
 		# Draw the shadow.
 		surface.fill(self.shadow_color, self.shadow_rect)
 
@@ -134,5 +138,7 @@ class Item(object):
 			self.surface.fill(self.disabled_color)
 			surface.blit(self.surface, self.rect)
 
+		return dirty_rect
+
 	def draw_before_disabled(self, surface):
 		pass
\ No newline at end of file
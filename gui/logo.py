@@ -3,6 +3,7 @@ __license__ = "All Rights Reserved"
 
 import pygame
 from libs import pyganim
+import other.assets as assets
 import settings.settings as settings
 
 """
@@ -22,24 +23,33 @@ class Logo:
 	x = 0
 	y = 0
 
-	# Creates a pyganim object from the logo images. 
-	logo = pyganim.PygAnimation([("res/logo/mBreakTitle_01.png", 1.55),
-								("res/logo/mBreakTitle_02.png", 0.075),
-								("res/logo/mBreakTitle_03.png", 0.075),
-								("res/logo/mBreakTitle_04.png", 0.075),
-								("res/logo/mBreakTitle_05.png", 0.075),
-								("res/logo/mBreakTitle_06.png", 0.075),
-								("res/logo/mBreakTitle_07.png", 0.075),
-								("res/logo/mBreakTitle_01.png", 1.55),
-								("res/logo/mBreakTitle_07.png", 0.075),
-								("res/logo/mBreakTitle_06.png", 0.075),
-								("res/logo/mBreakTitle_05.png", 0.075),
-								("res/logo/mBreakTitle_04.png", 0.075),
-								("res/logo/mBreakTitle_03.png", 0.075),
-								("res/logo/mBreakTitle_02.png", 0.075)])
+	# The logo images, and how long each one is shown. They're loaded along with everything else (see assets.start_loading), unscaled
+	# since we scale the logo when we draw it.
+	frames = [("res/logo/mBreakTitle_01.png", 1.55),
+				("res/logo/mBreakTitle_02.png", 0.075),
+				("res/logo/mBreakTitle_03.png", 0.075),
+				("res/logo/mBreakTitle_04.png", 0.075),
+				("res/logo/mBreakTitle_05.png", 0.075),
+				("res/logo/mBreakTitle_06.png", 0.075),
+				("res/logo/mBreakTitle_07.png", 0.075),
+				("res/logo/mBreakTitle_01.png", 1.55),
+				("res/logo/mBreakTitle_07.png", 0.075),
+				("res/logo/mBreakTitle_06.png", 0.075),
+				("res/logo/mBreakTitle_05.png", 0.075),
+				("res/logo/mBreakTitle_04.png", 0.075),
+				("res/logo/mBreakTitle_03.png", 0.075),
+				("res/logo/mBreakTitle_02.png", 0.075)]
+	for path, duration in frames:
+		assets.declare_image(path, 1)
+	del path, duration
+
+	# The pyganim object created from the logo images, the first time a logo is created.
+	logo = None
 
 	def __init__(self):
-		# Store a copy of the pyganim object.
+		# Create the pyganim object if we haven't already, and store a copy of it.
+		if Logo.logo is None:
+			Logo.logo = pyganim.PygAnimation([(assets.get_image(path, 1), duration) for path, duration in Logo.frames])
 		self.logo = Logo.logo.getCopy()
 
 		# Set the current scale of the object to the standard scale (also scaled by settings.GAME_SCALE).
@@ -76,5 +86,5 @@ class Logo:
 		temp_logo_x = self.x
 		temp_logo_y = self.y
 
-		# Draw the logo.
-		window_surface.blit(temp_logo, (temp_logo_x, temp_logo_y))
\ No newline at end of file
+		# Draw the logo, and return the rect of the screen that we've drawn to.
+		return window_surface.blit(temp_logo, (temp_logo_x, temp_logo_y))
\ No newline at end of file
@@ -2,6 +2,7 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import other.assets as assets
 import settings.settings as settings
 
 """
@@ -14,9 +15,8 @@ clicked the corresponding function is called.
 
 class Menu(object):
 
-	# Initialize the mixer (so we can load a sound) and load the sound effect.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effect = pygame.mixer.Sound("res/sounds/select.ogg")
+	# The sound effect we play (loaded the first time it is played).
+	sound_effect = assets.Sound("res/sounds/select.ogg")
 
 	def __init__(self, x = 0, y = 0, position = 0):
 		# Setup a list to contain all the menu items.
@@ -120,6 +120,8 @@ class Menu(object):
 			self.previous_selected_item = None
 
 	def draw(self, surface):
-		# Simply draws all the items of this menu to the given surface.
+		# Simply draws all the items of this menu to the given surface, and returns a list of the rects that the items have drawn to.
+		dirty_rects = []
 		for item in self.items:
-			item.draw(surface)
\ No newline at end of file
+			dirty_rects.append(item.draw(surface))
+		return dirty_rects
\ No newline at end of file
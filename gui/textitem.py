@@ -173,6 +173,12 @@ class TextItem(item.Item):
 		return self.on
 
 	def draw(self, surface):
+		# Draws the text and returns the rect of the screen that we've drawn to (the text and its shadow). The off text can be wider
+		# than the on text, so we make sure to cover both.
+		width = max(self.font.size(self.string)[0], self.font.size(self.off_string)[0])
+		dirty_rect = pygame.Rect(self.x, self.y + self.y_nudge, width, self.get_height())
+		dirty_rect.union_ip(dirty_rect.move(self.shadow_offset_x, self.shadow_offset_y))
+
 		# First we determine what shadow to blit, and then blit that. We do this before we blit the text so the shadow is under the text.
 		if self.is_on_off:
 			if self.on:
@@ -198,3 +204,5 @@ class TextItem(item.Item):
 				surface.blit(self.off_surface, (self.x, self.y + self.y_nudge))
 		else:
 			surface.blit(self.surface, (self.x, self.y + self.y_nudge))
+
+		return dirty_rect
@@ -2,12 +2,36 @@ __author__ = "Olof Karlsson"
 __version__ = "0.2"
 __license__ = "All Rights Reserved"
 
+import argparse
+import other.capture as capture
+
+# If we're asked to profile the game (see capture), we start before anything else is imported, so that importing the game and loading
+# the settings is profiled as well. The capture module only uses the standard library, so it's fine to import it this early.
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Starts mBreak.")
+	parser.add_argument("--profile", action = "store_true", help = "profile the game with cProfile until the first match is over, and write it to a .pstats file")
+	arguments = parser.parse_args()
+	if arguments.profile:
+		capture.start("mBreak")
+
 import pygame
 from pygame.locals import *
 import objects.camera as camera
 import settings.settings as settings
 import objects.gameclock as gameclock
 import settings.graphics as graphics
+import other.display as display
+import other.assets as assets
+import screens.scenemanager as scenemanager
+
+# Load the settings. This has to be done before any of the game objects are imported, since they use the settings (GAME_SCALE, for
+# example) when they're loaded.
+settings.load()
+graphics.load()
+
+# If we're drawing the game at its own resolution, we set that up now for the same reason.
+if graphics.NATIVE_RENDER:
+	settings.set_game_scale(1)
 
 # We start the splash screen after everything is setup, so we import it here.
 import screens.splash as splash
@@ -19,27 +43,26 @@ creating a window_surface and other such stuff.
 
 When everything is setup, it starts the splash screen.
 
+Run it with --profile to profile the game with cProfile, from the very first import until the first match is over (see capture).
+
 """
 
 def main():
-	# Initiates the PyGame module.
+	# Initiates the PyGame module. The mixer is initialized with our settings (see assets) along with everything else.
+	assets.pre_init_mixer()
 	pygame.init()
 
 	# Instantiates a PyGame Clock.
 	main_clock = gameclock.GameClock()
 
-	# Load the settings.
-	settings.load()
-	graphics.load()
-
 	# Display modes, these are by standard double buffering (for performance reasons) and hardware acceleration (works if fullscreen is enabled).
 	if graphics.FULLSCREEN:
 		display_modes = DOUBLEBUF | HWSURFACE | FULLSCREEN
 	else:
 		display_modes = DOUBLEBUF | HWSURFACE
 
-	# Setup the window surface to be used.
-	window_surface = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), display_modes)
+	# Setup the window, and the surface that we draw to.
+	window_surface = display.create(display_modes)
 
 	# Initialize the camera.
 	camera.create_camera(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
@@ -57,8 +80,17 @@ def main():
 	# Set the window caption.
 	pygame.display.set_caption(settings.WINDOW_CAPTION)
 
-	# Start the splash screen.
-	splash.Splash(window_surface, main_clock)
+	# Start loading the images and sounds in the background, so that they're ready once the splash screen is done.
+	assets.start_loading()
+
+	# Start the splash screen, and keep running scenes until there are none left.
+	scenemanager.push(splash.Splash(window_surface, main_clock))
+	scenemanager.run()
 
-# Start the game!
-main()
+# Start the game! Unless we've been imported (like other.startup does), in which case whoever imported us calls main().
+if __name__ == "__main__":
+	try:
+		main()
+	finally:
+		# If the game is quit before the first match is over, we still write what we've profiled so far.
+		capture.stop()
@@ -5,9 +5,10 @@ import pygame
 import copy
 import math
 import random
-import other.useful as useful
+import other.assets as assets
+import other.counters as counters
+import other.tintcache as tintcache
 import objects.paddle as paddle
-import objects.particle as particle
 import objects.trace as trace
 import objects.shadow as shadow
 import objects.effects.flash as flash
@@ -25,33 +26,61 @@ that is used when drawing the ball, an angle at which they are traveling and the
 attributes than that, as you can see below).
 
 When a ball collides with either a block, another ball or a paddle (or the edges of the game area) they each ball is responsible
-for their own collision handling. I would argue the collision handling is very rigid, as I've played a few hundred games and haven't
-seen any odd side effects.
+for their own collision handling. Instead of moving a little bit at a time and checking if we overlap anything, each update we sweep
+the ball along the path it's about to travel and find the first thing it would hit on the way. We move up to that point, bounce, and
+then keep on sweeping with the movement that's left. This way we never tunnel through anything, no matter how fast the ball is going,
+and we never end up overlapping a bunch of blocks at the same time.
+
+Balls colliding with other balls is the one exception. Checking every ball against every other ball gets really slow when there are a
+lot of balls around (multiball!), so instead the game calls collide_balls() once every update, after all the balls have moved. It finds
+every pair of overlapping balls in one go, and each pair is then handled once, for both balls at the same time.
 
 Anyway, the code is commented pretty thoroughly, so read on if you're interested!
 
 """
 
-def convert():
-	# Same here as with powerups, arguably this could be put in the constructor (as it's safe to call this method more than once)
-	# but I worry about performance (pygame uses SDL (not SDL 2.0) which uses the CPU for everything, so it's pretty performance heavy).
-	Ball.image.convert()
+def find_ball_pairs(ball_group):
+	# Returns a list of every pair of balls in the given group that overlap each other, with each pair only appearing once. We do this
+	# with "sweep and prune": we sort the balls by their left edge and walk through them from left to right, while keeping a list of
+	# the balls that we haven't walked past yet (that is, the ones whose right edge is to the right of the ball we're looking at). We
+	# only ever have to compare a ball to the balls in that list, since all the others are too far to the left to overlap it.
+	pairs = []
+	active_balls = []
+	for ball in sorted(ball_group.sprites(), key = lambda ball: ball.rect.left):
+		active_balls = [other_ball for other_ball in active_balls if other_ball.rect.right > ball.rect.left]
+		for other_ball in active_balls:
+			if other_ball.rect.colliderect(ball.rect):
+				pairs.append((other_ball, ball))
+		active_balls.append(ball)
+	return pairs
+
+def collide_balls(ball_group):
+	# Finds all the balls in the given group that overlap each other, and makes them bounce off each other.
+	for ball_one, ball_two in find_ball_pairs(ball_group):
+		# Separating one pair might already have separated another pair, so we make sure they still overlap.
+		if ball_one.rect.colliderect(ball_two.rect):
+			ball_one.collide_with_ball(ball_two)
+
+def prewarm(color):
+	# Colorizes the image (and the shadow) for a player with the given color ahead of time, so that spawning the first ball for that
+	# player doesn't have to do it.
+	shadow.get_image(tintcache.colorize(Ball.image, color))
 
 class Ball(pygame.sprite.Sprite):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/ball/ball.png")
+	image = assets.Image("res/ball/ball.png")
 
-	# Initialize the mixer (so we can load a sound) and load the sound effect.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effect = pygame.mixer.Sound("res/sounds/ball.ogg")
+	# The sound effect we play (loaded the first time it is played).
+	sound_effect = assets.Sound("res/sounds/ball.ogg")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	speed = 1.5 * settings.GAME_FPS * settings.GAME_SCALE
 	max_speed = 5 * settings.GAME_FPS * settings.GAME_SCALE
-	speed_step = 0.75 * settings.GAME_FPS * settings.GAME_SCALE
+	max_collisions_per_update = 8 # If we hit more things than this in a single update, we skip the rest of the movement for that update.
+	time_of_impact_tolerance = 0.000001 # Things we hit within this amount of time of each other are considered to be hit at the same time.
 	paddle_nudge_distance = 1.34 * settings.GAME_SCALE
 	least_allowed_vertical_angle = 0.32 # Exists to prevent the balls from getting stuck bouncing up and down in the middle of the gamefield.
 	trace_spawn_rate = 0.53 * settings.GAME_FPS
@@ -75,9 +104,6 @@ class Ball(pygame.sprite.Sprite):
 	hit_effect_final_color = pygame.Color(255, 255, 255, 0)
 	hit_effect_tick_amount = 8 * settings.GAME_FPS
 
-	# Scale image to match the game scale.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, x, y, angle, owner):
 		# We start by calling the superconstructor.
 		pygame.sprite.Sprite.__init__(self)
@@ -89,9 +115,6 @@ class Ball(pygame.sprite.Sprite):
 		self.x = x
 		self.y = y
 
-		# Keep track of the balls position in the previous frame, used for collision handling.
-		self.previous = pygame.rect.Rect(self.x, self.y, Ball.width, Ball.height)
-
 		# Set the angle variable.
 		self.angle = angle
 
@@ -100,7 +123,6 @@ class Ball(pygame.sprite.Sprite):
 
 		# Set the speed variable.
 		self.speed = Ball.speed
-		self.tick_speed = self.speed
 
 		# Store the current level of smash stack.
 		self.smash_stack = 0
@@ -111,13 +133,8 @@ class Ball(pygame.sprite.Sprite):
 		# Create one image attribute per player.
 		self.player_images = {}
 		for player in groups.Groups.player_group:
-			player_image = Ball.image.copy()
-			
-			# Colorize the image to the color of the player.
-			useful.colorize_image(player_image, player.color)
-			
-			# Finally, add this image to the list of player images.
-			self.player_images[player] = player_image
+			# Colorize the image to the color of the player. This image is shared by all the balls of that color.
+			self.player_images[player] = tintcache.colorize(Ball.image, player.color)
 
 		# Create the image attribute that is drawn to the surface.
 		self.image = self.player_images[self.owner]
@@ -163,115 +180,53 @@ class Ball(pygame.sprite.Sprite):
 	def update(self, main_clock):
 		# We assume we haven't collided with anything yet.
 		self.collided = False
+		counters.add("ball updates")
 
-		speed_handled = 0
-		while speed_handled < self.speed:
-			# Setup the speed values to use for this iteration.
-			if self.speed - speed_handled >= Ball.speed_step:
-				self.tick_speed = Ball.speed_step
-			else:
-				self.tick_speed = self.speed - speed_handled
-
-			# Check collision with paddles.
-			self.check_collision_paddles()
-					
-			# Check collision with other balls.
-			self.check_collision_balls()
-
-			# Check collision with blocks.
-			self.check_collision_blocks()
-
-			# Check collision with powerups.
-			self.check_collision_powerups()
-
-			# Here we check if the angle of the ball is in the restricted areas. We do this to make sure that the balls don't get stuck
-			# bouncing up and down in the middle of the gamefield, since that makes for a very boring game.
-			if self.angle > (math.pi / 2) - Ball.least_allowed_vertical_angle and self.angle < (math.pi / 2) + Ball.least_allowed_vertical_angle:
-				if self.angle > (math.pi / 2):
-					self.angle = (math.pi / 2) + Ball.least_allowed_vertical_angle
-				elif self.angle < (math.pi / 2):
-					self.angle = (math.pi / 2) - Ball.least_allowed_vertical_angle
-				else:
-					# If the angle is EXACTLY pi/2, we just randomly decide what angle to "nudge" the ball to.
-					self.angle += random.randrange(-1, 2, 2) * Ball.least_allowed_vertical_angle
-			elif self.angle > ((3 * math.pi) / 2) - Ball.least_allowed_vertical_angle and self.angle < ((3 * math.pi) / 2) + Ball.least_allowed_vertical_angle:			
-				if self.angle > ((3 * math.pi) / 2):
-					self.angle = ((3 * math.pi) / 2) + Ball.least_allowed_vertical_angle
-				elif self.angle < ((3 * math.pi) / 2):
-					self.angle = ((3 * math.pi) / 2) - Ball.least_allowed_vertical_angle
-				else:
-					# If the angle is EXACTLY 3pi/2, we just randomly decide what angle to "nudge" the ball to.
-					self.angle += random.randrange(-1, 2, 2) * Ball.least_allowed_vertical_angle
-
-			# Constrain angle to 0 < angle < 2pi. Even though angles over 2pi or under 0 work fine when translating the angles to x and y positions, 
-			# such angles mess with our ability to calculate other stuff. So we just make sure that the angle is between 0 and 2pi.
-			if self.angle > (2 * math.pi):
-				self.angle -= (2 * math.pi)
-			elif self.angle < 0:
-				self.angle += (2 * math.pi)
-
-			# We make sure that speed isn't over max_speed.
-			if self.speed > self.max_speed:
-				self.speed = self.max_speed
-
-			# Move the ball with speed in consideration.
-			self.x = self.x + (math.cos(self.angle) * self.tick_speed * main_clock.delta_time)
-			self.y = self.y + (math.sin(self.angle) * self.tick_speed * main_clock.delta_time)
-			self.rect.x = self.x
-			self.rect.y = self.y
-
-			# Check collision with x-edges.
-			if self.rect.x < settings.LEVEL_X:
-				# We hit the left wall.
-				self.hit_wall()
+		# A paddle might have moved into us since the last update, so we check that first.
+		self.check_collision_paddles()
 
-				# Reverse angle on x-axis.
-				self.angle = math.pi - self.angle
-
-				# Constrain ball to screen size.
-				self.x = settings.LEVEL_X
-				self.rect.x = self.x
-			elif self.rect.x + self.rect.width > settings.LEVEL_MAX_X:
-				# We hit the right wall.
-				self.hit_wall()
+		# Make sure the angle and the speed are okay before we start moving.
+		self.constrain_angle()
+		if self.speed > self.max_speed:
+			self.speed = self.max_speed
 
-				# Reverse angle on x-axis.
-				self.angle = math.pi - self.angle
+		# This is how much of this update's movement we have left to do, from 1 (all of it) to 0 (nothing).
+		movement_left = 1.0
+		collisions = 0
+		while movement_left > 0 and collisions < Ball.max_collisions_per_update:
+			counters.add("ball substeps")
 
-				# Constrain ball to screen size.
-				self.x = settings.LEVEL_MAX_X - self.rect.width			
-				self.rect.x = self.x
+			# Calculate how far we want to move on each axis.
+			distance = self.speed * main_clock.delta_time * movement_left
+			delta_x = math.cos(self.angle) * distance
+			delta_y = math.sin(self.angle) * distance
 
-			# Check collision with y-edges.
-			if self.rect.y < settings.LEVEL_Y:
-				# We hit the top wall.
-				self.hit_wall()
+			# Find out what we'll hit first on the way (if anything), and when.
+			time_of_impact, hits = self.find_first_hits(delta_x, delta_y)
 
-				# Reverse angle on y-axis.
-				self.angle = -self.angle
+			# Move up to the point of impact (or all the way if we didn't hit anything). Powerups don't stop us, so we simply
+			# check for them along the way.
+			start_rect = self.rect.copy()
+			self.move(delta_x * time_of_impact, delta_y * time_of_impact)
+			self.check_collision_powerups(start_rect.union(self.rect))
 
-				# Constrain ball to screen size.
-				self.y = settings.LEVEL_Y
-				self.rect.y = self.y
-			elif self.rect.y + self.rect.height > settings.LEVEL_MAX_Y:
-				# We hit the bottom wall.
-				self.hit_wall()
+			if len(hits) == 0:
+				break
 
-				# Reverse angle on y-axis.
-				self.angle = -self.angle
+			# Bounce off whatever we hit. This changes our angle, so we make sure it's still okay.
+			self.handle_hits(hits)
+			self.constrain_angle()
 
-				# Constrain ball to screen size.
-				self.y = settings.LEVEL_MAX_Y - self.rect.height
-				self.rect.y = self.y
+			movement_left *= 1 - time_of_impact
+			collisions += 1
 
-			# If we have collided with anything, play the sound effect.
-			if self.collided:
-				sound = Ball.sound_effect.play()
-				if not sound is None:
-					sound.set_volume(settings.SOUND_VOLUME)
+		# Bouncing off a paddle or another ball places us next to it, which might be outside the level if it's close to a wall. If so,
+		# we move back inside. If we're moving towards the wall, the next update will bounce us off it.
+		self.constrain_to_level()
 
-			# Increase the amount of speed that we've handled this turn.
-			speed_handled += self.tick_speed
+		# If we have collided with anything, play the sound effect.
+		if self.collided:
+			self.play_sound_effect()
 
 		# We check if it's time to spawn a trace.
 		self.trace_spawn_time += main_clock.get_time()
@@ -281,6 +236,194 @@ class Ball(pygame.sprite.Sprite):
 				trace.Trace(self)
 				self.trace_spawn_time = 0
 
+	def play_sound_effect(self):
+		counters.add("sounds played")
+		sound = Ball.sound_effect.play()
+		if not sound is None:
+			sound.set_volume(settings.SOUND_VOLUME)
+
+	def constrain_angle(self):
+		# Here we check if the angle of the ball is in the restricted areas. We do this to make sure that the balls don't get stuck
+		# bouncing up and down in the middle of the gamefield, since that makes for a very boring game.
+		if self.angle > (math.pi / 2) - Ball.least_allowed_vertical_angle and self.angle < (math.pi / 2) + Ball.least_allowed_vertical_angle:
+			if self.angle > (math.pi / 2):
+				self.angle = (math.pi / 2) + Ball.least_allowed_vertical_angle
+			elif self.angle < (math.pi / 2):
+				self.angle = (math.pi / 2) - Ball.least_allowed_vertical_angle
+			else:
+				# If the angle is EXACTLY pi/2, we just randomly decide what angle to "nudge" the ball to.
+				self.angle += random.randrange(-1, 2, 2) * Ball.least_allowed_vertical_angle
+		elif self.angle > ((3 * math.pi) / 2) - Ball.least_allowed_vertical_angle and self.angle < ((3 * math.pi) / 2) + Ball.least_allowed_vertical_angle:			
+			if self.angle > ((3 * math.pi) / 2):
+				self.angle = ((3 * math.pi) / 2) + Ball.least_allowed_vertical_angle
+			elif self.angle < ((3 * math.pi) / 2):
+				self.angle = ((3 * math.pi) / 2) - Ball.least_allowed_vertical_angle
+			else:
+				# If the angle is EXACTLY 3pi/2, we just randomly decide what angle to "nudge" the ball to.
+				self.angle += random.randrange(-1, 2, 2) * Ball.least_allowed_vertical_angle
+
+		# Constrain angle to 0 < angle < 2pi. Even though angles over 2pi or under 0 work fine when translating the angles to x and y positions, 
+		# such angles mess with our ability to calculate other stuff. So we just make sure that the angle is between 0 and 2pi.
+		if self.angle > (2 * math.pi):
+			self.angle -= (2 * math.pi)
+		elif self.angle < 0:
+			self.angle += (2 * math.pi)
+
+	def constrain_to_level(self):
+		if self.x < settings.LEVEL_X:
+			self.x = settings.LEVEL_X
+		elif self.x + self.rect.width > settings.LEVEL_MAX_X:
+			self.x = settings.LEVEL_MAX_X - self.rect.width
+
+		if self.y < settings.LEVEL_Y:
+			self.y = settings.LEVEL_Y
+		elif self.y + self.rect.height > settings.LEVEL_MAX_Y:
+			self.y = settings.LEVEL_MAX_Y - self.rect.height
+
+		self.rect.x = self.x
+		self.rect.y = self.y
+
+	def move(self, delta_x, delta_y):
+		self.x += delta_x
+		self.y += delta_y
+		self.rect.x = self.x
+		self.rect.y = self.y
+
+	def sweep(self, delta_x, delta_y, rect):
+		# Checks if we would hit the given rect when moving delta_x, delta_y. If we would, this returns the time of impact (from 0 to 1,
+		# where 0 is where we are now and 1 is where we would end up) and the normal of the side we would hit. Otherwise it returns None.
+		# We do this by figuring out when we would start and stop overlapping the rect on each axis. We only hit the rect if we overlap
+		# on both axes at the same time.
+		if delta_x > 0:
+			entry_x = (rect.left - (self.x + self.rect.width)) / delta_x
+			exit_x = (rect.right - self.x) / delta_x
+		elif delta_x < 0:
+			entry_x = (rect.right - self.x) / delta_x
+			exit_x = (rect.left - (self.x + self.rect.width)) / delta_x
+		elif self.x + self.rect.width <= rect.left or self.x >= rect.right:
+			# We're not moving on this axis, and we're not overlapping on it either, so we can't hit it.
+			return None
+		else:
+			entry_x = float("-inf")
+			exit_x = float("inf")
+
+		if delta_y > 0:
+			entry_y = (rect.top - (self.y + self.rect.height)) / delta_y
+			exit_y = (rect.bottom - self.y) / delta_y
+		elif delta_y < 0:
+			entry_y = (rect.bottom - self.y) / delta_y
+			exit_y = (rect.top - (self.y + self.rect.height)) / delta_y
+		elif self.y + self.rect.height <= rect.top or self.y >= rect.bottom:
+			return None
+		else:
+			entry_y = float("-inf")
+			exit_y = float("inf")
+
+		entry = max(entry_x, entry_y)
+		exit = min(exit_x, exit_y)
+
+		# We don't hit the rect if we're never overlapping on both axes at once, if we would hit it after this movement, or if we're
+		# moving away from it.
+		if entry > exit or entry >= 1 or exit <= 0:
+			return None
+
+		# The side we hit is on the axis that we started overlapping on last.
+		if entry_x > entry_y:
+			if delta_x > 0:
+				return max(entry, 0), -1, 0
+			else:
+				return max(entry, 0), 1, 0
+		else:
+			if delta_y > 0:
+				return max(entry, 0), 0, -1
+			else:
+				return max(entry, 0), 0, 1
+
+	def find_first_hits(self, delta_x, delta_y):
+		# Finds what we would hit first when moving delta_x, delta_y. Returns the time of impact (from 0 to 1) and a list of everything
+		# we hit at that time, as (kind, entity, normal_x, normal_y) tuples, where kind is "wall", "block" or "paddle". More than one thing can be hit at the same time, for example
+		# when hitting two blocks right where they meet.
+		first_time = 1.0
+		hits = []
+
+		def add_hit(time, hit):
+			if time < first_time - Ball.time_of_impact_tolerance:
+				del hits[:]
+				hits.append(hit)
+				return time
+			elif time <= first_time + Ball.time_of_impact_tolerance:
+				hits.append(hit)
+			return first_time
+
+		# Check the walls of the level.
+		if delta_x < 0:
+			first_time = add_hit(max((settings.LEVEL_X - self.x) / delta_x, 0), ("wall", None, 1, 0))
+		elif delta_x > 0:
+			first_time = add_hit(max((settings.LEVEL_MAX_X - self.rect.width - self.x) / delta_x, 0), ("wall", None, -1, 0))
+		if delta_y < 0:
+			first_time = add_hit(max((settings.LEVEL_Y - self.y) / delta_y, 0), ("wall", None, 0, 1))
+		elif delta_y > 0:
+			first_time = add_hit(max((settings.LEVEL_MAX_Y - self.rect.height - self.y) / delta_y, 0), ("wall", None, 0, -1))
+
+		# Everything else is only checked if it's somewhere in the area we're moving through.
+		swept_rect = self.rect.union(self.rect.move(int(delta_x), int(delta_y))).inflate(2, 2)
+		counters.add("ball collision queries")
+
+		for block in groups.Groups.block_group.collide(swept_rect):
+			hit = self.sweep(delta_x, delta_y, block.rect)
+			if not hit is None:
+				first_time = add_hit(hit[0], ("block", block, hit[1], hit[2]))
+
+		for paddle in groups.Groups.paddle_group:
+			if paddle.rect.colliderect(swept_rect):
+				hit = self.sweep(delta_x, delta_y, paddle.rect)
+				if not hit is None:
+					first_time = add_hit(hit[0], ("paddle", paddle, hit[1], hit[2]))
+
+		# Other balls aren't checked here, see collide_balls().
+
+		# If we didn't hit anything, first_time is still 1 and we get to move all the way.
+		if len(hits) == 0:
+			return 1.0, hits
+		return first_time, hits
+
+	def handle_hits(self, hits):
+		# Bounces off everything in the given list of hits (see find_first_hits). We keep track of what sides of blocks we've bounced
+		# off, since if we hit two blocks on the same side at the same time we should only bounce once (but still damage both blocks).
+		block_sides_hit = []
+		for kind, entity, normal_x, normal_y in hits:
+			if kind == "wall":
+				self.hit_wall()
+				if normal_x != 0:
+					# Reverse angle on x-axis.
+					self.angle = math.pi - self.angle
+				else:
+					# Reverse angle on y-axis.
+					self.angle = -self.angle
+			elif kind == "block":
+				if (normal_x, normal_y) in block_sides_hit:
+					self.hit_block(entity)
+				else:
+					block_sides_hit.append((normal_x, normal_y))
+					if normal_y == -1:
+						self.hit_top_side_of_block(entity)
+					elif normal_y == 1:
+						self.hit_bottom_side_of_block(entity)
+					elif normal_x == -1:
+						self.hit_left_side_of_block(entity)
+					else:
+						self.hit_right_side_of_block(entity)
+			elif kind == "paddle":
+				self.hit_paddle(entity)
+				if normal_x == -1:
+					self.hit_left_side_of_paddle(entity)
+				elif normal_x == 1:
+					self.hit_right_side_of_paddle(entity)
+				elif normal_y == -1:
+					self.hit_top_side_of_paddle(entity)
+				else:
+					self.hit_bottom_side_of_paddle(entity)
+
 	def hit_wall(self):
 		# Spawn some particles.
 		self.spawn_particles()
@@ -327,12 +470,13 @@ class Ball(pygame.sprite.Sprite):
 			speed = random.uniform(max_speed - max_speed / 7.0, max_speed + max_speed / 7.0)
 			retardation = self.speed / 24.0
 			alpha_step = 5 * settings.GAME_FPS
-			particle.Particle(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, self.color, alpha_step)
+			groups.Groups.particle_system.spawn(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, self.color, alpha_step)
 
 	def check_collision_paddles(self):
 		# This method is used to check if we've collided with any paddles. If a collision is detected, we
 		# also handle it here.
 		paddle_collide_list = pygame.sprite.spritecollide(self, groups.Groups.paddle_group, False)
+		counters.add("ball collision queries")
 		for paddle in paddle_collide_list:
 			self.hit_paddle(paddle)
 			if self.rect.bottom >= paddle.rect.top and self.rect.top < paddle.rect.top:
@@ -345,12 +489,7 @@ class Ball(pygame.sprite.Sprite):
 					self.hit_right_side_of_paddle(paddle)
 				else:
 					# The ball collides more with the top side than any other side.
-					if self.angle < math.pi:
-						# So we reverse the angle.
-						self.angle = -self.angle
-
-					# Place ball on top of the paddle.
-					self.place_over(paddle)
+					self.hit_top_side_of_paddle(paddle)
 			elif self.rect.top <= paddle.rect.bottom and self.rect.bottom > paddle.rect.bottom:
 				# Bottom side of paddle collided with. Compare with edges:
 				if paddle.rect.left - self.rect.left > self.rect.bottom - paddle.rect.bottom:
@@ -361,12 +500,7 @@ class Ball(pygame.sprite.Sprite):
 					self.hit_right_side_of_paddle(paddle)
 				else:
 					# The ball collides more with the bottom side than any other side.
-					if self.angle > math.pi:
-						# So we reverse the angle.
-						self.angle = -self.angle
-
-					# Place ball beneath the paddle.
-					self.place_below(paddle)
+					self.hit_bottom_side_of_paddle(paddle)
 			elif self.rect.right >= paddle.rect.left and self.rect.left < paddle.rect.left:
 				# Left side of paddle collided with.
 				self.hit_left_side_of_paddle(paddle)
@@ -427,6 +561,22 @@ class Ball(pygame.sprite.Sprite):
 		# Nudge paddle a tiny bit.
 		paddle.x += Ball.paddle_nudge_distance
 
+	def hit_top_side_of_paddle(self, paddle):
+		if self.angle < math.pi:
+			# Reverse the angle.
+			self.angle = -self.angle
+
+		# Place ball on top of the paddle.
+		self.place_over(paddle)
+
+	def hit_bottom_side_of_paddle(self, paddle):
+		if self.angle > math.pi:
+			# Reverse the angle.
+			self.angle = -self.angle
+
+		# Place ball beneath the paddle.
+		self.place_below(paddle)
+
 	def hit_right_side_of_paddle(self, paddle):
 		# Calculate the new angle of the ball.
 		paddle_center = paddle.y + paddle.rect.height / 2
@@ -442,59 +592,51 @@ class Ball(pygame.sprite.Sprite):
 		# Nudge paddle a tiny bit.
 		paddle.x -= Ball.paddle_nudge_distance
 
-	def check_collision_balls(self):
-		# This method is used to check for collision with other balls. If a collision is detected, it is also
-		# handled here.
-		groups.Groups.ball_group.remove(self) # We don't want to check for collisions against ourselves!
-		ball_collide_list = pygame.sprite.spritecollide(self, groups.Groups.ball_group, False)
-		for ball in ball_collide_list:
-			self.hit_ball(ball)
-			if self.rect.bottom >= ball.rect.top and self.rect.top < ball.rect.top:
-				# Top side of ball collided with. Compare with edges:
-				if ball.rect.left - self.rect.left > ball.rect.top - self.rect.top:
-					# The ball collides more with the left side than top side.
-					# Place ball to the left of the ball.
-					self.place_left_of(ball)
-				elif self.rect.right - ball.rect.right > ball.rect.top - self.rect.top:
-					# The ball collides more with the right side than top side.
-					# Place ball to the right of the ball.
-					self.place_right_of(ball)
-				else:
-					# Place ball on top of the ball.
-					self.place_over(ball)
-			elif self.rect.top <= ball.rect.bottom and self.rect.bottom > ball.rect.bottom:
-				# Bottom side of ball collided with.
-				if ball.rect.left - self.rect.left > self.rect.bottom - ball.rect.bottom:
-					# The ball collides more with the left side than top side.
-					# Place ball to the left of the ball.
-					self.place_left_of(ball)
-				elif self.rect.right - ball.rect.right > self.rect.bottom - ball.rect.bottom:
-					# The ball collides more with the right side than top side.
-					# Place ball to the right of the ball.
-					self.place_right_of(ball)
-				else:
-					# The ball collides more with the bottom side than any other side.
-					# Place ball beneath the ball.
-					self.place_below(ball)
-			elif self.rect.right >= ball.rect.left and self.rect.left < ball.rect.left:
-				# Left side of ball collided with.
-				# Place ball to the left of the ball.
-				self.place_left_of(ball)
-			elif self.rect.left <= ball.rect.right and self.rect.right > ball.rect.right:
-				# Right side of ball collided with.
-				# Place ball to the right of the ball.
-				self.place_right_of(ball)
-
-			# Handle self.
-			delta_x = self.rect.centerx - ball.rect.centerx
-			delta_y = self.rect.centery - ball.rect.centery
-			self.angle = math.atan2(delta_y, delta_x)
-
-			# Handle other ball.
-			delta_x = ball.rect.centerx - self.rect.centerx
-			delta_y = ball.rect.centery - self.rect.centery
-			ball.angle = math.atan2(delta_y, delta_x)
-		groups.Groups.ball_group.add(self)
+	def bounce_off_ball(self, ball):
+		# Both balls bounce away from each other.
+		# Handle self.
+		delta_x = self.rect.centerx - ball.rect.centerx
+		delta_y = self.rect.centery - ball.rect.centery
+		self.angle = math.atan2(delta_y, delta_x)
+
+		# Handle other ball.
+		delta_x = ball.rect.centerx - self.rect.centerx
+		delta_y = ball.rect.centery - self.rect.centery
+		ball.angle = math.atan2(delta_y, delta_x)
+
+	def collide_with_ball(self, ball):
+		# Handles a collision between us and another ball, for both of us at once. This is called by collide_balls().
+		self.hit_ball(ball)
+
+		# The other ball has hit us just as much as we've hit it, so we tell its effects about it as well.
+		for effect in ball.effect_group:
+			effect.on_hit_ball(self)
+		ball.collided = True
+
+		# Push both balls apart, half the overlap each, along the axis where they overlap the least.
+		overlap_x = min(self.rect.right, ball.rect.right) - max(self.rect.left, ball.rect.left)
+		overlap_y = min(self.rect.bottom, ball.rect.bottom) - max(self.rect.top, ball.rect.top)
+		if overlap_x < overlap_y:
+			push = (overlap_x + 1) / 2.0
+			if self.rect.centerx < ball.rect.centerx:
+				push = -push
+			self.move(push, 0)
+			ball.move(-push, 0)
+		else:
+			push = (overlap_y + 1) / 2.0
+			if self.rect.centery < ball.rect.centery:
+				push = -push
+			self.move(0, push)
+			ball.move(0, -push)
+
+		# Being pushed might have moved one of us outside the level.
+		self.constrain_to_level()
+		ball.constrain_to_level()
+
+		self.bounce_off_ball(ball)
+
+		# The balls have already been updated this update, so we play the sound here (once for both of us).
+		self.play_sound_effect()
 
 	def hit_ball(self, ball):
 		# Spawn some particles.
@@ -513,151 +655,6 @@ class Ball(pygame.sprite.Sprite):
 		# We just collided with another ball, so!
 		self.collided = True
 
-	def check_collision_blocks(self):
-		# This check for collision with blocks (and handles them if they are detected).
-		# Since movement in this game is done step by step (we do not use raytracing) it's possible
-		# for balls to collided with more blocks than they actually should've collided with.
-		# This method meticulously goes through every possible combination of blocks collided with
-		# and deals with each accordingly.
-		blocks_collided_with = pygame.sprite.spritecollide(self, groups.Groups.block_group, False)
-
-		# This dictionary is used to store a side with each block we collided with. This is so we can
-		# handle each possible collision case later on.
-		block_information = {}
-		for block in blocks_collided_with:
-			# Determine what side of the block we've collided with.
-			if self.rect.bottom >= block.rect.top and self.rect.top < block.rect.top:
-				# Top side of block collided with. Compare with edges:
-				if block.rect.left - self.rect.left > block.rect.top - self.rect.top:
-					# The ball collides more with the left side than top side.
-					block_information[block] = "left"
-				elif self.rect.right - block.rect.right > block.rect.top - self.rect.top:
-					# The ball collides more with the right side than top side.
-					block_information[block] = "right"
-				else:
-					# The ball collides more with the top side than any other side.
-					block_information[block] = "top"
-			elif self.rect.top <= block.rect.bottom and self.rect.bottom > block.rect.bottom:
-				# Bottom side of block collided with.
-				if block.rect.left - self.rect.left > self.rect.bottom - block.rect.bottom:
-					# The ball collides more with the left side than top side.
-					block_information[block] = "left"
-				elif self.rect.right - block.rect.right > self.rect.bottom - block.rect.bottom:
-					# The ball collides more with the right side than top side.
-					block_information[block] = "right"
-				else:
-					# The ball collides more with the bottom side than any other side.
-					block_information[block] = "bottom"
-			elif self.rect.right >= block.rect.left and self.rect.left < block.rect.left:
-				# Left side of block collided with.
-				block_information[block] = "left"
-			elif self.rect.left <= block.rect.right and self.rect.right > block.rect.right:
-				# Right side of block collided with.
-				block_information[block] = "right"
-
-		if len(block_information) > 3:
-			print("block_information len " + str(len(block_information)))
-
-		# If we've only hit one block, we don't need to check so much. Just check which side we've collided with and act accordingly.
-		if len(block_information) == 1:
-			# Check what side we've hit that block and act accordingly.
-			for block, side in block_information.iteritems():
-				if side == "top":
-					self.hit_top_side_of_block(block)
-				elif side == "left":
-					self.hit_left_side_of_block(block)
-				elif side == "right":
-					self.hit_right_side_of_block(block)
-				elif side == "bottom":
-					self.hit_bottom_side_of_block(block)
-		# If we've hit two blocks, we need to check what combination of sides we've hit, to determine how to act.
-		elif len(block_information) == 2:
-			# Setup a few help lists to more easily determine how to act.
-			block_list = []
-			side_list = []
-			for block, side in block_information.iteritems():
-				block_list.append(block)
-				side_list.append(side)
-
-			# Are the two hit blocks side by side?
-			if block_list[0].y == block_list[1].y:
-				# Check if we've hit the top side of either block.
-				if "top" in side_list:
-					self.hit_top_side_of_block(block_list[0])
-					self.hit_block(block_list[1])
-				elif "bottom" in side_list:
-					self.hit_bottom_side_of_block(block_list[0])
-					self.hit_block(block_list[1])
-			# Are the two blocks hit above/below each other?
-			elif block_list[0].x == block_list[1].x:
-				# Check what side we've hit, and act accordingly.
-				if "left" in side_list:
-					self.hit_left_side_of_block(block_list[0])
-					self.hit_block(block_list[1])
-				elif "right" in side_list:
-					self.hit_right_side_of_block(block_list[0])
-					self.hit_block(block_list[1])
-			# Are the two blocks hit diagonal of each other?
-			else:
-				for block, side in block_information.iteritems():
-					if side == "top":
-						self.hit_top_side_of_block(block)
-					elif side == "left":
-						self.hit_left_side_of_block(block)
-					elif side == "right":
-						self.hit_right_side_of_block(block)
-					elif side == "bottom":
-						self.hit_bottom_side_of_block(block)
-		# If we've hit three blocks, it's a little bit more complex. We have a lot of cases to handle.
-		elif len(block_information) == 3:
-			# Setup a few help lists to more easily determine how to act.
-			block_list = []
-			side_list = []
-			for block, side in block_information.iteritems():
-				block_list.append(block)
-				side_list.append(side)
-
-			# Here we're meticulously going through every possible combination and acting accordingly.
-			# We also damage each block separately, since we cannot be sure what block we've "really"
-			# hit until we've checked.
-			if block_list[0].y == block_list[1].y:
-				self.check_block_collisions(block_list[0], block_list[1], block_list[2], side_list[2])
-			elif block_list[1].y == block_list[2].y:
-				self.check_block_collisions(block_list[1], block_list[2], block_list[0], side_list[0])
-			elif block_list[2].y == block_list[0].y:
-				self.check_block_collisions(block_list[2], block_list[0], block_list[1], side_list[1])
-		elif len(block_information) > 3:
-			least_x_distance = 999999
-			least_y_distance = 999999
-			for block, side in block_information.iteritems():
-				if abs(block.x - self.x) < least_x_distance:
-					least_x_distance = block.x - self.x
-
-				if abs(block.y - self.y) < least_y_distance:
-					least_y_distance = block.y - self.y
-
-			self.x += least_x_distance
-			self.y += least_y_distance
-
-	def check_block_collisions(self, block_one, block_two, block_three, block_three_side):
-		# Given a different combination of block_one, two and three (and the side of block three) this figures out
-		# what blocks we've actually hit.
-		if block_three_side == "left":
-			self.hit_left_side_of_block(block_three)
-		else:
-			self.hit_right_side_of_block(block_three)
-
-		if block_three.y > block_one.y:
-			if block_one.x > block_two.x:
-				self.hit_bottom_side_of_block(block_one)
-			else:
-				self.hit_bottom_side_of_block(block_two)
-		else:
-			if block_one.x > block_two.x:
-				self.hit_top_side_of_block(block_one)
-			else:
-				self.hit_top_side_of_block(block_two)
-
 	def hit_block(self, block):
 		# We've hit a block, so we do a bunch of things. First, spawn a few particles.
 		self.spawn_particles()
@@ -720,9 +717,10 @@ class Ball(pygame.sprite.Sprite):
 		# Place ball below the block.
 		self.place_below(block)
 
-	def check_collision_powerups(self):
-		# Here we check if we've collided with any powerups. If we have, we simply tell that powerup that we just
-		# hit it. We don't need to do anything else, each powerup handles the rest.
-		powerup_collide_list = pygame.sprite.spritecollide(self, groups.Groups.powerup_group, False)
-		for powerup in powerup_collide_list:
-			powerup.hit(self)
+	def check_collision_powerups(self, rect):
+		# Here we check if we've moved through any powerups (rect is the area we've moved through). If we have, we simply tell that
+		# powerup that we just hit it. We don't need to do anything else, each powerup handles the rest.
+		counters.add("ball collision queries")
+		for powerup in groups.Groups.powerup_group.sprites():
+			if powerup.rect.colliderect(rect):
+				powerup.hit(self)
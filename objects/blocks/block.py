@@ -5,9 +5,10 @@ import pygame
 import math
 import random
 import copy
+import other.assets as assets
+import other.counters as counters
 import objects.shadow as shadow
 import objects.groups as groups
-import objects.particle as particle
 import objects.effects.flash as flash
 import settings.settings as settings
 
@@ -20,16 +21,15 @@ This is the base class of all blocks in the game. A block has health, and when t
 class Block(pygame.sprite.Sprite):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/block/block.png")
-	half_health_image = pygame.image.load("res/block/block.png")
+	image = assets.Image("res/block/block.png")
+	half_health_image = assets.Image("res/block/block.png")
 
-	# Initialize the mixer (so we can load a sound) and load the sound effect.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effect = pygame.mixer.Sound("res/sounds/explosion.ogg")
+	# The sound effect we play (loaded the first time it is played).
+	sound_effect = assets.Sound("res/sounds/explosion.ogg")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	particle_spawn_amount = 4
 	particle_size = 0.75 * settings.GAME_SCALE
 	half_health_blend_color = pygame.Color(128, 128, 128)
@@ -39,10 +39,6 @@ class Block(pygame.sprite.Sprite):
 	hit_effect_final_color = pygame.Color(255, 255, 255, 0)
 	hit_effect_tick_amount = 15 * settings.GAME_FPS
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-	half_health_image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, owner, x, y, width, height, health):
 		# We start by calling the superconstructor.
 		pygame.sprite.Sprite.__init__(self)
@@ -75,8 +71,15 @@ class Block(pygame.sprite.Sprite):
 		self.health = self.health - damage
 
 		# Change the image to the half health image if health is under half.
-		if self.health <= self.max_health / 2:
+		if self.health <= self.max_health / 2 and not self.image is self.half_health_image:
 			self.image = self.half_health_image
+			groups.Groups.block_group.invalidate(self)
+
+	def create_shadow(self):
+		# Creates the shadow of the block. The block layer draws the shadows of all the blocks (see BlockLayer), so the shadow is not
+		# drawn along with the other shadows.
+		self.shadow = shadow.Shadow(self)
+		groups.Groups.shadow_group.remove(self.shadow)
 
 	def on_hit(self, damage):
 		# Damage self.
@@ -91,7 +94,7 @@ class Block(pygame.sprite.Sprite):
 			speed = 5 * settings.GAME_FPS
 			retardation = 0.25 * settings.GAME_FPS
 			alpha_step = 5 * settings.GAME_FPS
-			particle.Particle(self.x + self.rect.width / 2, self.y + self.rect.height / 2, Block.particle_size, Block.particle_size, angle, speed, retardation, self.color, alpha_step)
+			groups.Groups.particle_system.spawn(self.x + self.rect.width / 2, self.y + self.rect.height / 2, Block.particle_size, Block.particle_size, angle, speed, retardation, self.color, alpha_step)
 
 	def destroy(self):
 		# Takes care of killing self and shadow.
@@ -106,6 +109,7 @@ class Block(pygame.sprite.Sprite):
 				effect.destroy()
 
 			# Play a sound effect.
+			counters.add("sounds played")
 			sound = Block.sound_effect.play()
 			if not sound is None:
 				sound.set_volume(settings.SOUND_VOLUME)
@@ -0,0 +1,90 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import pygame
+import settings.settings as settings
+
+"""
+
+This is the group that holds all the blocks in the game. It works just like a normal sprite group, but it also sorts the blocks into a
+grid of cells (the level places the blocks on a grid anyway), so that we can find the blocks that collide with a rect by only looking
+at the cells that the rect overlaps instead of going through every single block in the level.
+
+Since it's a group, the grid is kept up to date automatically. When a block is killed (for example in Block.destroy()) or the group is
+emptied, pygame tells the group to remove the block, and we remove it from its cells at the same time.
+
+If the group has a block layer (see BlockLayer), the group also tells the layer whenever a block is added, removed or changes its image,
+so that the layer can redraw that block.
+
+"""
+
+class BlockGrid(pygame.sprite.Group):
+
+	def __init__(self, cell_width, cell_height, *sprites):
+		# The size of each cell. This should be the size of a block, so each block only ends up in a single cell.
+		self.cell_width = cell_width
+		self.cell_height = cell_height
+
+		# The cells, stored as a dictionary with (column, row) as key and a list of the blocks in that cell as value.
+		self.cells = {}
+
+		# The block layer that draws the blocks in this group, if any. The layer sets this itself when it's created.
+		self.layer = None
+
+		# Call the superconstructor. We do this last since it adds the given sprites, which needs the cells to exist.
+		pygame.sprite.Group.__init__(self, *sprites)
+
+	def set_cell_size(self, cell_width, cell_height):
+		# Changes the size of the cells, and sorts any blocks already in the group into the new cells.
+		self.cell_width = cell_width
+		self.cell_height = cell_height
+
+		self.cells = {}
+		for block in self.sprites():
+			self.add_to_cells(block)
+
+	def get_cells(self, rect):
+		# Returns the (column, row) of every cell that the given rect overlaps. The grid starts at the top left corner of the level.
+		first_column = int((rect.left - settings.LEVEL_X) // self.cell_width)
+		last_column = int((rect.right - 1 - settings.LEVEL_X) // self.cell_width)
+		first_row = int((rect.top - settings.LEVEL_Y) // self.cell_height)
+		last_row = int((rect.bottom - 1 - settings.LEVEL_Y) // self.cell_height)
+
+		return [(column, row) for column in range(first_column, last_column + 1) for row in range(first_row, last_row + 1)]
+
+	def add_to_cells(self, block):
+		for cell in self.get_cells(block.rect):
+			if cell in self.cells:
+				self.cells[cell].append(block)
+			else:
+				self.cells[cell] = [block]
+
+	def add_internal(self, sprite):
+		pygame.sprite.Group.add_internal(self, sprite)
+		self.add_to_cells(sprite)
+		self.invalidate(sprite)
+
+	def remove_internal(self, sprite):
+		pygame.sprite.Group.remove_internal(self, sprite)
+		for cell in self.get_cells(sprite.rect):
+			if cell in self.cells:
+				self.cells[cell].remove(sprite)
+				if len(self.cells[cell]) == 0:
+					del self.cells[cell]
+		self.invalidate(sprite)
+
+	def invalidate(self, block):
+		# Tells the block layer (if there is one) that the given block has changed, so it has to be redrawn.
+		if not self.layer is None:
+			self.layer.invalidate(block.rect)
+
+	def collide(self, rect):
+		# Returns a list of all the blocks that collide with the given rect, like pygame.sprite.spritecollide() would.
+		collided = []
+		for cell in self.get_cells(rect):
+			if cell in self.cells:
+				for block in self.cells[cell]:
+					# A block can be in more than one cell if it's not placed exactly on the grid, so we make sure to only add it once.
+					if block.rect.colliderect(rect) and not block in collided:
+						collided.append(block)
+		return collided
@@ -0,0 +1,82 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import pygame
+from pygame.locals import *
+import objects.camera as camera
+import objects.shadow as shadow
+import settings.settings as settings
+
+"""
+
+Blocks never move, so there's no point in blitting every single block (and every single block shadow) every frame. Instead, the block
+layer draws all the blocks onto one surface the size of the level, and all their shadows onto another, and the game simply blits those
+two surfaces every frame.
+
+The layer is kept up to date by the block group (see BlockGrid). Whenever a block is added, removed or changes its image, the group
+tells the layer which part of the level has changed with invalidate(), and the layer redraws that part (and only that part) the next
+time it's drawn. Anything that changes from frame to frame, like the flash when a block is hit, is still drawn separately.
+
+The shadows of the blocks are drawn by the layer, so they are not in the shadow group (see Block.create_shadow).
+
+"""
+
+class BlockLayer():
+
+	def __init__(self, block_group):
+		# The group of blocks that we draw.
+		self.block_group = block_group
+		self.block_group.layer = self
+
+		# The surfaces we draw the blocks and their shadows to. They cover the level, and are transparent where there are no blocks.
+		self.surface = pygame.Surface((settings.LEVEL_WIDTH, settings.LEVEL_HEIGHT), SRCALPHA)
+		self.shadow_surface = pygame.Surface((settings.LEVEL_WIDTH, settings.LEVEL_HEIGHT), SRCALPHA)
+
+		# The surfaces are mostly transparent, so we let SDL run-length encode them. That way blitting them skips over the transparent
+		# parts really fast.
+		self.surface.set_alpha(255, RLEACCEL)
+		self.shadow_surface.set_alpha(255, RLEACCEL)
+
+		# The rects (in level coordinates) that have to be redrawn before the layer is drawn next. At first, that's the whole level.
+		self.dirty_rects = [pygame.Rect(settings.LEVEL_X, settings.LEVEL_Y, settings.LEVEL_WIDTH, settings.LEVEL_HEIGHT)]
+
+	def invalidate(self, rect):
+		# Marks the given rect as changed, so that it is redrawn before the layer is drawn next.
+		self.dirty_rects.append(pygame.Rect(rect))
+
+	def redraw(self):
+		# Redraws every part of the layer that has changed since the last time.
+		for rect in self.dirty_rects:
+			# Redraw the blocks.
+			self.redraw_rect(self.surface, rect, 0, 0)
+
+			# The shadows are drawn a bit off from the blocks, so the part of the shadow surface that changed is moved as well.
+			self.redraw_rect(self.shadow_surface, rect.move(shadow.Shadow.offset_x, shadow.Shadow.offset_y), shadow.Shadow.offset_x, shadow.Shadow.offset_y)
+
+		self.dirty_rects = []
+
+	def redraw_rect(self, surface, rect, offset_x, offset_y):
+		# Clears the given rect of the given surface, and draws the blocks (or the shadows, if offset is given) that are in it again.
+		# Everything outside the rect is left as it is, so we clip the surface to the rect.
+		local_rect = rect.move(-settings.LEVEL_X, -settings.LEVEL_Y)
+		surface.set_clip(local_rect)
+		surface.fill((0, 0, 0, 0))
+
+		for block in self.block_group.collide(rect.move(-offset_x, -offset_y)):
+			if offset_x == 0 and offset_y == 0:
+				image = block.image
+			else:
+				image = block.shadow.image
+			surface.blit(image, (block.rect.x + offset_x - settings.LEVEL_X, block.rect.y + offset_y - settings.LEVEL_Y))
+
+		surface.set_clip(None)
+
+	def draw(self, surface):
+		# Draws the blocks to the given surface.
+		self.redraw()
+		surface.blit(self.surface, (settings.LEVEL_X - camera.CAMERA.x, settings.LEVEL_Y - camera.CAMERA.y))
+
+	def draw_shadows(self, surface):
+		# Draws the shadows of the blocks to the given surface.
+		self.redraw()
+		surface.blit(self.shadow_surface, (settings.LEVEL_X - camera.CAMERA.x, settings.LEVEL_Y - camera.CAMERA.y))
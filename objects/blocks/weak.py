@@ -2,7 +2,9 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import other.assets as assets
 import other.useful as useful
+import other.tintcache as tintcache
 import objects.blocks.block as block
 import objects.shadow as shadow
 import objects.groups as groups
@@ -14,42 +16,36 @@ This is a subclass of Block. It is the weakest out of all the blocks, as it only
 
 """
 
-def convert():
-	# Arguably this could be called in the constructor, but I worry about performance so I make sure to only call this once.
-	WeakBlock.image.convert()
+def prewarm(color):
+	# Colorizes the images (and the shadow) for a player with the given color ahead of time, so that creating the first block for
+	# that player doesn't have to do it. After that, every block for that player shares the same images.
+	image = tintcache.colorize(WeakBlock.image, color)
+	tintcache.colorize(WeakBlock.half_health_image, useful.blend_colors(color, block.Block.half_health_blend_color))
+	shadow.get_image(image)
 
 class WeakBlock(block.Block):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/block/block_weak.png")
-	half_health_image = pygame.image.load("res/block/block_weak.png")
+	image = assets.Image("res/block/block_weak.png")
+	half_health_image = assets.Image("res/block/block_weak.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	health = 10
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-	half_health_image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, x, y, owner):
 		# We start by calling the superconstructor.
 		block.Block.__init__(self, owner, x, y, WeakBlock.width, WeakBlock.height, WeakBlock.health)
 
-		# Create the image attribute that is drawn to the surface.
-		self.image = WeakBlock.image.copy()
-
-		# Colorize the block.
+		# Create the image attribute that is drawn to the surface, colorized to the color of the owner. All the blocks of the same
+		# type and color share the same image.
 		self.color = self.owner.color
-		useful.colorize_image(self.image, self.color)
-
-		# Create the image that is drawn when health is half or less.
-		self.half_health_image = WeakBlock.half_health_image.copy()
+		self.image = tintcache.colorize(WeakBlock.image, self.color)
 
-		# Colorize that image.
+		# Create the image that is drawn when health is half or less, and colorize that as well.
 		self.half_health_color = useful.blend_colors(self.owner.color, block.Block.half_health_blend_color)
-		useful.colorize_image(self.half_health_image, self.half_health_color)
+		self.half_health_image = tintcache.colorize(WeakBlock.half_health_image, self.half_health_color)
 
 		# Create a shadow.
-		self.shadow = shadow.Shadow(self)
\ No newline at end of file
+		self.create_shadow()
\ No newline at end of file
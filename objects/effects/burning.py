@@ -4,10 +4,11 @@ __license__ = "All Rights Reserved"
 import pygame
 import math
 import random
+import other.assets as assets
+import other.counters as counters
 import objects.blocks.block as block
 import objects.groups as groups
 import objects.effects.effect as effect
-import objects.particle as particle
 import settings.settings as settings
 
 """
@@ -25,15 +26,14 @@ This effect plays a sound effect when it is created.
 class Burning(effect.Effect):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/effect/burning.png")
+	image = assets.Image("res/effect/burning.png")
 
-	# Initialize the mixer (so we can load a sound) and load the sound effect.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effect = pygame.mixer.Sound("res/sounds/burning.ogg")
+	# The sound effect we play (loaded the first time it is played).
+	sound_effect = assets.Sound("res/sounds/burning.ogg")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	damage_per_second = 2.0
 	particle_spawn_rate = 75
 	particle_least_spawn_amount = 3
@@ -41,9 +41,6 @@ class Burning(effect.Effect):
 	duration = 10000
 	block_duration = 5000
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, parent, duration = None):
  		# We check if a duration has been given.
  		if not duration == None:
@@ -57,6 +54,7 @@ class Burning(effect.Effect):
 		self.particle_spawn_time = 0
 
 		# Play the sound effect.
+		counters.add("sounds played")
 		sound = Burning.sound_effect.play()
 		if not sound is None:
 			sound.set_volume(settings.SOUND_VOLUME)
@@ -105,4 +103,4 @@ class Burning(effect.Effect):
 					else:
 						a_color = random.randint(0, 255)
 						color = pygame.Color(a_color, a_color, a_color)
-					particle.Particle(self.parent.x + self.parent.rect.width / 2, self.parent.y + self.parent.rect.height / 2, width, width, angle, speed, retardation, color, 5 * settings.GAME_FPS)
+					groups.Groups.particle_system.spawn(self.parent.x + self.parent.rect.width / 2, self.parent.y + self.parent.rect.height / 2, width, width, angle, speed, retardation, color, 5 * settings.GAME_FPS)
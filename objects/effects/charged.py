@@ -4,11 +4,12 @@ __license__ = "All Rights Reserved"
 import pygame
 import math
 import random
+import other.assets as assets
+import other.counters as counters
 import objects.camera as camera
 import objects.groups as groups
 import objects.effects.effect as effect
 import objects.blocks.block as block
-import objects.particle as particle
 import settings.settings as settings
 
 """
@@ -20,9 +21,8 @@ The effect is then destroyed.
 
 class Charged(effect.Effect):
 
-	# Initialize the mixer (so we can load a sound) and load the sound effect.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effect = pygame.mixer.Sound("res/sounds/thunder.ogg")
+	# The sound effect we play (loaded the first time it is played).
+	sound_effect = assets.Sound("res/sounds/thunder.ogg")
 
 	damage_width = 16 * settings.GAME_SCALE
 	damage_height = 16 * settings.GAME_SCALE
@@ -51,6 +51,7 @@ class Charged(effect.Effect):
 			# If the hit block isn't one of the parents owners blocks...
 			if hit_block.owner != self.parent.owner:
 				# Play the sound effect.
+				counters.add("sounds played")
 				sound = Charged.sound_effect.play()
 				if not sound is None:
 					sound.set_volume(settings.SOUND_VOLUME)
@@ -62,9 +63,9 @@ class Charged(effect.Effect):
 				self.spawn_particles(hit_block)
 
 				# Lets see if there are any additional blocks to damage.
-				for block in hit_block.owner.block_group:
-					# We check to see if any of their rects collide with damage_rect.
-					if self.damage_rect.colliderect(block.rect):
+				for block in groups.Groups.block_group.collide(self.damage_rect):
+					# We only damage the blocks that belong to the same player as the block we hit.
+					if block.owner == hit_block.owner:
 						# It does, so we damage that block and spawn some particles.
 						block.on_hit(Charged.damage)
 						self.spawn_particles(block)
@@ -99,4 +100,4 @@ class Charged(effect.Effect):
 			random_value = random.randint(225, 255)
 			color = pygame.Color(random_value, random_value, random.randint(0, 100))
 			random_size = random.randint(self.rect.width / 4, self.rect.width / 3)
-			particle.Particle(self.rect.x + self.rect.width / 2, self.rect.y + self.rect.height / 2, random_size, random_size, angle, speed, retardation, color, 20 * settings.GAME_FPS)
\ No newline at end of file
+			groups.Groups.particle_system.spawn(self.rect.x + self.rect.width / 2, self.rect.y + self.rect.height / 2, random_size, random_size, angle, speed, retardation, color, 20 * settings.GAME_FPS)
\ No newline at end of file
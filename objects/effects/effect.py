@@ -3,6 +3,7 @@ __license__ = "All Rights Reserved"
 
 import pygame
 import objects.camera as camera
+import other.render as render
 import objects.groups as groups
 import settings.settings as settings
 
@@ -15,6 +16,9 @@ and destroying the effect when the duration runs out. It also provides a few ove
 
 class Effect(pygame.sprite.Sprite):
 
+	# The layer we're drawn in (see RenderQueue).
+	layer = render.EFFECT_LAYER
+
 	def __init__(self, parent, duration):
 		# We start by calling the superconstructor.
 		pygame.sprite.Sprite.__init__(self)
@@ -73,9 +77,14 @@ class Effect(pygame.sprite.Sprite):
 			self.destroy()
 
 	def draw(self, surface):
-		# If the image exists, we blit it to the surface.
+		# If the image exists, we blit it to the surface, and return the area we drew to.
+		if not self.image == None:
+			return surface.blit(self.image, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y))
+
+	def add_to_batch(self, batch):
+		# Adds what draw would draw to the given render batch (see RenderBatch), instead of blitting it straight away.
 		if not self.image == None:
-			surface.blit(self.image, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y))
+			batch.add(self.image, self.rect.x, self.rect.y)
 
 	def destroy(self):
 		self.kill()
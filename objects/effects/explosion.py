@@ -2,8 +2,8 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import other.assets as assets
 import other.useful as useful
-from libs import pyganim
 import objects.camera as camera
 import objects.groups as groups
 import objects.effects.effect as effect
@@ -15,49 +15,48 @@ Simple on-hit effect.
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	Explosion.image_sheet.convert_alpha()
-
 class Explosion(effect.Effect):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image_sheet = pygame.image.load("res/effect/explosion.png")
+	image_sheet = assets.Image("res/effect/explosion.png", settings.GAME_SCALE + 1)
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image_sheet.get_width() * (settings.GAME_SCALE + 1)
-	height = image_sheet.get_height() * (settings.GAME_SCALE + 1)
+	width = image_sheet.width
+	height = image_sheet.height
 	frame_width = width
 	frame_height = width
-
-	# Scale image to settings.GAME_SCALE.
-	image_sheet = pygame.transform.scale(image_sheet, (width, height))
+	frame_duration = 60
 
 	def __init__(self, parent, duration = 1000):
 		# We start by calling the superconstructor.
 		effect.Effect.__init__(self, parent, duration)
 
 		# Generate the animation frames.
-		frames = useful.create_frames_from_sheet(Explosion.image_sheet, Explosion.frame_width, Explosion.frame_height, 0.06)
+		self.frames = useful.create_frames_from_sheet(Explosion.image_sheet, Explosion.frame_width, Explosion.frame_height)
 
-		# Create the pyganim object.
-		self.animation = pyganim.PygAnimation(frames, False)
-
-		# Start playing the animation!
-		self.animation.play()
+		# The time (in milliseconds) the animation has been playing for. We keep track of this ourselves instead of letting pyganim do
+		# it, since pyganim uses the real time, and the animation has to follow the game clock (so that it slows down with the rest of
+		# the game, and plays the same way every time the game is simulated, see headless).
+		self.animation_time = 0
+		self.frame = 0
 
 	def update(self, main_clock):
 		# We make sure to call the supermethod.
 		effect.Effect.update(self, main_clock)
 
-		# Update the playback rate of the animation.
-		self.animation.rate = main_clock.time_scale
+		# Move the animation forward. get_time() is already scaled by the time scale.
+		self.animation_time += main_clock.get_time()
+		self.frame = int(self.animation_time / Explosion.frame_duration)
 
 		# If the animation is finished, we destroy ourselves.
-		if self.animation.isFinished():
+		if self.frame >= len(self.frames):
 			self.destroy()
 
 	def draw(self, surface):
 		# Draw the current frame of the animation.
-		self.animation.blit(surface, (self.parent.rect.x - camera.CAMERA.x, self.parent.rect.y - camera.CAMERA.y))
\ No newline at end of file
+		if self.frame < len(self.frames):
+			return surface.blit(self.frames[self.frame], (self.parent.rect.x - camera.CAMERA.x, self.parent.rect.y - camera.CAMERA.y))
+
+	def add_to_batch(self, batch):
+		# Only we know which frame to draw (if any), so we draw ourselves when the batch gets to us.
+		batch.add_draw(self.draw)
\ No newline at end of file
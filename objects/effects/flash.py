@@ -3,6 +3,8 @@ __license__ = "All Rights Reserved"
 
 import pygame
 import objects.camera as camera
+import other.counters as counters
+import other.render as render
 import objects.groups as groups
 import objects.effects.effect as effect
 import settings.settings as settings
@@ -15,11 +17,15 @@ Simple on-hit effect.
 
 class Flash(effect.Effect):
 
+	# The layer we're drawn in (see RenderQueue).
+	layer = render.FLASH_LAYER
+
 	def __init__(self, parent, start_color, final_color, tick_amount, duration = 3000):
 		# We start by calling the superconstructor.
 		effect.Effect.__init__(self, parent, duration)
 
 		self.surface = pygame.Surface((self.parent.rect.width, self.parent.rect.height), pygame.locals.SRCALPHA)
+		counters.add("flash surfaces")
 
 		self.start_color = start_color
 		self.current_color = self.start_color
@@ -62,3 +68,8 @@ class Flash(effect.Effect):
 		
 		# This is to make the alpha value work (filling doesn't work with alpha otherwise).
 		return surface.blit(self.surface, (self.parent.rect.x - camera.CAMERA.x, self.parent.rect.y - camera.CAMERA.y))
+
+	def add_to_batch(self, batch):
+		# Adds the flash effect with the current color to the given render batch (see RenderBatch).
+		self.surface.fill(self.current_color)
+		batch.add(self.surface, self.parent.rect.x, self.parent.rect.y)
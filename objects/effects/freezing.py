@@ -4,10 +4,11 @@ __license__ = "All Rights Reserved"
 import pygame
 import math
 import random
+import other.assets as assets
+import other.counters as counters
 import objects.groups as groups
 import objects.effects.effect as effect
 import objects.paddle as paddle
-import objects.particle as particle
 import settings.settings as settings
 
 """
@@ -20,24 +21,20 @@ will be frozen, having their max_speed lowered for a short duration.
 class Freezing(effect.Effect):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/effect/freezing.png")
+	image = assets.Image("res/effect/freezing.png")
 
-	# Initialize the mixer (so we can load a sound) and load the sound effect.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effect = pygame.mixer.Sound("res/sounds/freezing.ogg")
+	# The sound effect we play (loaded the first time it is played).
+	sound_effect = assets.Sound("res/sounds/freezing.ogg")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	max_speed_reduction = 0.41 * settings.GAME_FPS * settings.GAME_SCALE
 	paddle_freezing_duration = 1100
 	particle_spawn_rate = 600
 	particle_spawn_amount = 2
 	duration = 10000
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, parent, duration = None):
  		# We check if a duration has been given.
  		if not duration == None:
@@ -84,6 +81,7 @@ class Freezing(effect.Effect):
 		if self.parent.owner == self.real_owner:
 			if not self.parent.owner == hit_paddle.owner:
 				Freezing(hit_paddle, Freezing.paddle_freezing_duration)
+				counters.add("sounds played")
 				sound = Freezing.sound_effect.play()
 				if not sound is None:
 					sound.set_volume(settings.SOUND_VOLUME)
@@ -111,7 +109,7 @@ class Freezing(effect.Effect):
 					speed = random.uniform(0.2 * settings.GAME_FPS * settings.GAME_SCALE, 0.35 * settings.GAME_FPS * settings.GAME_SCALE)
 					retardation = speed / 76.0
 					color = pygame.Color(random.randint(0, 50), random.randint(125, 255), random.randint(220, 255))
-					particle.Particle(self.parent.x + self.parent.rect.width / 2, self.parent.y + self.parent.rect.height / 2, self.parent.rect.width / 2, self.parent.rect.width / 2, angle, speed, retardation, color, 3 * settings.GAME_FPS)
+					groups.Groups.particle_system.spawn(self.parent.x + self.parent.rect.width / 2, self.parent.y + self.parent.rect.height / 2, self.parent.rect.width / 2, self.parent.rect.width / 2, angle, speed, retardation, color, 3 * settings.GAME_FPS)
 
 	def on_kill(self):
 		# Restore the acceleration we removed from the parent.
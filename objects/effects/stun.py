@@ -4,10 +4,11 @@ __license__ = "All Rights Reserved"
 import pygame
 import math
 import random
+import other.assets as assets
+import other.counters as counters
 import objects.groups as groups
 import objects.effects.effect as effect
 import objects.paddle as paddle
-import objects.particle as particle
 import settings.settings as settings
 
 """
@@ -19,22 +20,18 @@ A simple stun effect. Paddles effected by this effect have their speed reduced t
 class Stun(effect.Effect):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/effect/stun.png")
+	image = assets.Image("res/effect/stun.png")
 
-	# Initialize the mixer (so we can load a sound) and load the sound effect.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effect = pygame.mixer.Sound("res/sounds/freezing.ogg")
+	# The sound effect we play (loaded the first time it is played).
+	sound_effect = assets.Sound("res/sounds/freezing.ogg")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	max_speed_reduction = 20 * settings.GAME_FPS * settings.GAME_SCALE
 	particle_spawn_rate = 125
 	particle_spawn_amount = 5
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, parent, paddle_stun_duration, on_kill_function = None, duration = 6000):
 		# We start by calling the superconstructor with the given duration value.
 		# If parent is a paddle, set the duration to the paddle stun duration.
@@ -78,6 +75,7 @@ class Stun(effect.Effect):
 		# Spread the effect to any hit paddles not owned by the parents owner. This effect does not last as long on paddles as it does on any other object.
 		if not self.parent.owner == hit_paddle.owner:
 			Stun(hit_paddle, self.paddle_stun_duration)
+			counters.add("sounds played")
 			sound = Stun.sound_effect.play()
 			if not sound is None:
 				sound.set_volume(settings.SOUND_VOLUME)
@@ -106,7 +104,7 @@ class Stun(effect.Effect):
 				retardation = speed / 25.0
 				color_value = random.randint(100, 250)
 				color = pygame.Color(color_value, color_value, color_value)
-				particle.Particle(self.parent.x + self.parent.rect.width / 3, self.parent.y + self.parent.rect.height / 3, self.parent.rect.width / 3, self.parent.rect.width / 3, angle, speed, retardation, color, 1 * settings.GAME_FPS)
+				groups.Groups.particle_system.spawn(self.parent.x + self.parent.rect.width / 3, self.parent.y + self.parent.rect.height / 3, self.parent.rect.width / 3, self.parent.rect.width / 3, angle, speed, retardation, color, 1 * settings.GAME_FPS)
 
 	def on_kill(self):
 		# Restore the max speed we removed from the parent.
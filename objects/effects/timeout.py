@@ -3,7 +3,8 @@ __version__ = "0.1"
 __license__ = "All Rights Reserved"
 
 import pygame
-import other.useful as useful
+import other.assets as assets
+import other.tintcache as tintcache
 import objects.ball as ball
 import objects.powerups.powerup as powerup
 import objects.groups as groups
@@ -17,17 +18,18 @@ of this effect runs out.
 
 """
 
+def prewarm(color):
+	# Colorizes the image for balls with the given color ahead of time.
+	tintcache.colorize(Timeout.image, color)
+
 class Timeout(effect.Effect):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/effect/timeout.png")
+	image = assets.Image("res/effect/timeout.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
-
-	# Scale image to match the game scale.
-	image = pygame.transform.scale(image, (width, height))
+	width = image.width
+	height = image.height
 
 	def __init__(self, parent, duration):
 		# We start by calling the superconstructor.
@@ -35,8 +37,7 @@ class Timeout(effect.Effect):
 
 		# Create the image attribute that is drawn to the surface. We only do this if the parent is a ball, however.
 		if self.parent.__class__ == ball.Ball:
-			self.image = Timeout.image.copy()
-			useful.colorize_image(self.image, self.parent.color)
+			self.image = tintcache.colorize(Timeout.image, self.parent.color)
 
 		# Set the rects width and height to the standard values.
 		self.rect.width = Timeout.width
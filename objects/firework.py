@@ -4,10 +4,12 @@ __license__ = "All Rights Reserved"
 import pygame
 import random
 import math
+import other.assets as assets
+import other.counters as counters
 import objects.camera as camera
+import other.render as render
 import objects.powerups.powerup as powerup
 import objects.shadow as shadow
-import objects.particle as particle
 import objects.ball as ball
 import objects.groups as groups
 import settings.settings as settings
@@ -20,13 +22,11 @@ This is the Firework effect. When it is destroyed, it spawns particles in every
 
 class Firework(pygame.sprite.Sprite):
 
-	# Initialize the mixer (so we can load a sound) and load the sound effects.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effects = []
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion1.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion2.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion3.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion4.ogg"))
+	# The layer we're drawn in (see RenderQueue).
+	layer = render.PROJECTILE_LAYER
+
+	# The sound effects we pick from at random (loaded the first time one of them is played).
+	sound_effects = assets.Sounds(["res/sounds/explosion1.ogg", "res/sounds/explosion2.ogg", "res/sounds/explosion3.ogg", "res/sounds/explosion4.ogg"])
 
 	width = 2 * settings.GAME_SCALE
 	height = 2 * settings.GAME_SCALE
@@ -73,12 +73,13 @@ class Firework(pygame.sprite.Sprite):
 			retardation = 0.1 * settings.GAME_FPS
 			color = pygame.Color(255, 0, 0)
 			color.hsla = (random.uniform(0, 360), color.hsla[1], color.hsla[2], color.hsla[3])
-			a_particle = particle.Particle(self.x + self.rect.width / 2.0, self.y + self.rect.height / 2.0, width, width, angle, speed, retardation, color, 5 * settings.GAME_FPS)
-			a_particle.kill_outside_level = False
-			a_particle.kill_when_speed_reaches_zero = False
-			a_particle.gravity = 0.05 * settings.GAME_SCALE
+			# Fireworks are only used in the game over screen, which doesn't draw any shadows, so the particles don't need any. It always
+			# draws the particles, even if they're turned off.
+			groups.Groups.particle_system.spawn(self.x + self.rect.width / 2.0, self.y + self.rect.height / 2.0, width, width, angle, speed, retardation, color, 5 * settings.GAME_FPS,
+												gravity = 0.05 * settings.GAME_SCALE, kill_outside_level = False, kill_when_speed_reaches_zero = False, has_shadow = False, ignore_setting = True)
 
 		# Play a random sound from the sound_effects list.
+		counters.add("sounds played")
 		sound = Firework.sound_effects[random.randrange(0, len(Firework.sound_effects))].play()
 		if not sound is None:
 			sound.set_volume(settings.SOUND_VOLUME / 8.0)
@@ -103,4 +104,7 @@ class Firework(pygame.sprite.Sprite):
 		self.rect.y = self.y
 
 	def draw(self, surface):
-		surface.fill(self.color, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y, self.rect.width, self.rect.height))
\ No newline at end of file
+		surface.fill(self.color, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y, self.rect.width, self.rect.height))
+
+	def add_to_batch(self, batch):
+		batch.add_fill(self.color, self.rect.x, self.rect.y, self.rect.width, self.rect.height)
\ No newline at end of file
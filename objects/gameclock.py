@@ -2,11 +2,21 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import settings.settings as settings
 
 class GameClock():
 
 	default_time_scale = 1
 
+	# Scenes that use a fixed timestep are updated this many times per second, no matter how fast or slow they are drawn. A lot of the
+	# game logic changes things by a fixed amount every update (like acceleration and retardation), and all of that is tuned for
+	# settings.GAME_FPS, so that's what we use here as well.
+	simulation_rate = settings.GAME_FPS
+
+	# If a frame takes a really long time, we don't try to catch up on more than this amount of updates. Otherwise a slow frame would
+	# cause even more updates the next frame, which would cause an even slower frame, and so on. The game will simply slow down instead.
+	max_steps_per_frame = 5
+
 	def __init__(self):
 		# We start by creating a default pygame clock.
 		self.clock = pygame.time.Clock()
@@ -17,24 +27,57 @@ class GameClock():
 		# We also store the default time scale, for easy access.
 		self.default_time_scale = GameClock.default_time_scale
 
-		# We store the delta time in seconds. Updated whenever .tick() is called.
+		# We store the delta time in seconds. Updated whenever .tick() or .step() is called.
 		self.delta_time = 0
 
+		# The unscaled time of the current frame (or the current step, if using a fixed timestep) in milliseconds.
+		self.frame_time = 0
+
+		# The length of a single fixed step, in milliseconds.
+		self.step_time = 1000.0 / GameClock.simulation_rate
+
+		# The time that has passed but hasn't been simulated yet. Every call to .step() removes one step_time from this.
+		self.accumulator = 0
+
+		# How far we are between the last two fixed steps, from 0 to 1. Used to draw objects in between their last two positions.
+		self.interpolation = 1.0
+
 	def tick(self, framerate = 0):
-		delta_time_ms = self.clock.tick(framerate) * self.time_scale
-		self.delta_time = (delta_time_ms / 1000.0)
-		return delta_time_ms
+		return self.advance(self.clock.tick(framerate))
 
 	def tick_busy_loop(self, framerate = 0):
-		return self.clock.tick_busy_loop(framerate)
+		return self.advance(self.clock.tick_busy_loop(framerate))
+
+	def advance(self, frame_time):
+		# Moves the clock forward by frame_time milliseconds.
+		self.frame_time = frame_time
+		self.delta_time = (frame_time * self.time_scale / 1000.0)
+
+		# Add the time to the accumulator, but never more than we're willing to catch up on.
+		self.accumulator = min(self.accumulator + frame_time, GameClock.max_steps_per_frame * self.step_time)
+
+		return frame_time * self.time_scale
+
+	def step(self):
+		# Returns True if there is enough time in the accumulator for another fixed step, and sets the delta time to that of a single
+		# step. This is meant to be used like "while main_clock.step(): update()".
+		if self.accumulator >= self.step_time:
+			self.accumulator -= self.step_time
+			self.frame_time = self.step_time
+			self.delta_time = (self.step_time * self.time_scale / 1000.0)
+			return True
+
+		# There's not enough time left for another step, so we store how far along we are towards the next one.
+		self.interpolation = self.accumulator / self.step_time
+		return False
 
 	def get_time(self):
-		# Returns the time passed between two ticks, modified by time_scale.
-		return self.clock.get_time() * self.time_scale
+		# Returns the time passed between two ticks (or the length of a step), modified by time_scale.
+		return self.frame_time * self.time_scale
 
 	def get_rawtime(self):
 		# Returns the raw time passed between two ticks, modified by time_scale.
 		return self.clock.get_rawtime() * self.time_scale
 
 	def get_fps(self):
-		return self.clock.get_fps()	
\ No newline at end of file
+		return self.clock.get_fps()
@@ -2,6 +2,10 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import objects.blocks.blockgrid as blockgrid
+import objects.particle as particle
+import other.counters as counters
+import settings.settings as settings
 
 """
 
@@ -12,8 +16,16 @@ This module (and class) takes care of the groups used to store and update all th
 def empty_after_round():
 	# Empties all groups but the player group, so that when we want to return to the game again, the players are
 	# still intact.
+
+	# The shadows and particles thrown away here are killed as far as the counters are concerned (see counters), or the number of
+	# them that were created would never add up with the number that were killed. Every block has a shadow that isn't in the shadow
+	# group (see Block.create_shadow), so those are counted along with the blocks.
+	if settings.COUNTERS:
+		counters.add("shadows killed", len(Groups.shadow_group) + len(Groups.block_group))
+		counters.add("particles killed", len(Groups.particle_system))
+
 	Groups.ball_group.empty()
-	Groups.particle_group.empty()
+	Groups.particle_system.empty()
 	Groups.block_group.empty()
 	Groups.powerup_group.empty()
 	Groups.effect_group.empty()
@@ -33,14 +45,15 @@ class Groups:
 	# Define the group that contains all the balls.
 	ball_group = pygame.sprite.Group()
 
-	# Define the group that contains all the particles.
-	particle_group = pygame.sprite.Group()
+	# Define the particle system that contains all the particles (and their shadows). It isn't a group, but it works a lot like one.
+	particle_system = particle.ParticleSystem()
 
 	# Define the group that contains all the traces.
 	trace_group = pygame.sprite.Group()
 
-	# Define the group that contains all the blocks.
-	block_group = pygame.sprite.Group()
+	# Define the group that contains all the blocks. This group also keeps the blocks in a grid, to speed up collision checks. The size
+	# of the cells in the grid is set by the level, when it places the blocks.
+	block_group = blockgrid.BlockGrid(settings.GAME_SCALE, settings.GAME_SCALE)
 
 	# Define the group that contains all the powerups.
 	powerup_group = pygame.sprite.Group()
@@ -0,0 +1,53 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+"""
+
+When the game is updated at a fixed rate but drawn at any rate, the objects would look like they stutter if we simply drew them at the
+position of the last update. This class remembers the position of every object in the given groups before each update, and can then
+temporarily move their rects in between the last two positions while drawing.
+
+Call store() before every update, apply() before drawing and restore() after drawing.
+
+"""
+
+class Interpolator():
+
+	def __init__(self, groups):
+		# The groups containing the objects we should interpolate.
+		self.groups = groups
+
+		# The position of each object before the last update.
+		self.previous_positions = {}
+
+		# The actual position of each object we've moved, so we can move them back after drawing.
+		self.current_positions = {}
+
+	def store(self):
+		# Remember where all the objects are before they are updated.
+		self.previous_positions = {}
+		for group in self.groups:
+			for entity in group:
+				self.previous_positions[entity] = (entity.rect.x, entity.rect.y)
+
+	def apply(self, interpolation):
+		# Move all the objects to somewhere between their previous and their current position. An interpolation of 0 means the
+		# previous position and 1 means the current position.
+		self.current_positions = {}
+		if interpolation >= 1:
+			return
+
+		for group in self.groups:
+			for entity in group:
+				# Objects that were created during the last update don't have a previous position, so they stay where they are.
+				if entity in self.previous_positions:
+					previous_x, previous_y = self.previous_positions[entity]
+					self.current_positions[entity] = (entity.rect.x, entity.rect.y)
+					entity.rect.x = previous_x + (entity.rect.x - previous_x) * interpolation
+					entity.rect.y = previous_y + (entity.rect.y - previous_y) * interpolation
+
+	def restore(self):
+		# Move all the objects back to their actual position.
+		for entity, position in self.current_positions.iteritems():
+			entity.rect.x, entity.rect.y = position
+		self.current_positions = {}
@@ -4,6 +4,7 @@ __license__ = "All Rights Reserved"
 import pygame
 import random
 import math
+import other.assets as assets
 import objects.groups as groups
 import settings.settings as settings
 
@@ -16,14 +17,11 @@ Laserbeam.
 class Laserbeam(pygame.sprite.Sprite):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/attack/laser.png")
+	image = assets.Image("res/attack/laser.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
-
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
+	width = image.width
+	height = image.height
 
 	def __init__(self, owner):
 		# We start by calling the superconstructor.
@@ -4,6 +4,7 @@ __license__ = "All Rights Reserved"
 import pygame
 import random
 import math
+import other.assets as assets
 import objects.camera as camera
 import objects.effects.stun as stun
 import objects.effects.explosion as explosion
@@ -22,19 +23,14 @@ This is the MiniMissile effect. When picked up by a ball, it applies the "Charge
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	MiniMissile.image.convert_alpha()
-
 class MiniMissile(missile.Missile):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/attack/minimissile.png")
+	image = assets.Image("res/attack/minimissile.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	particle_spawn_rate = 25
 	particle_spawn_amount = 5
 
@@ -62,8 +58,5 @@ class MiniMissile(missile.Missile):
 	angle_correction_rate = 0.1 * settings.GAME_FPS
 	max_speed = 3 * settings.GAME_FPS * settings.GAME_SCALE
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, x, y, angle, owner, target):
 		super(MiniMissile, self).__init__(x, y, angle, owner, target)
\ No newline at end of file
@@ -4,13 +4,15 @@ __license__ = "All Rights Reserved"
 import pygame
 import random
 import math
+import other.assets as assets
+import other.counters as counters
 import objects.camera as camera
+import other.render as render
 import objects.effects.stun as stun
 import objects.effects.explosion as explosion
 import objects.dummy as dummy
 import objects.powerups.powerup as powerup
 import objects.shadow as shadow
-import objects.particle as particle
 import objects.ball as ball
 import objects.groups as groups
 import settings.settings as settings
@@ -21,27 +23,20 @@ This is the Missile effect. When picked up by a ball, it applies the "Charged" e
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	Missile.image.convert_alpha()
-
 class Missile(pygame.sprite.Sprite):
 
-	# Initialize the mixer (so we can load a sound) and load the sound effects.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effects = []
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion1.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion2.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion3.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/explosion4.ogg"))
+	# The layer we're drawn in (see RenderQueue).
+	layer = render.PROJECTILE_LAYER
+
+	# The sound effects we pick from at random (loaded the first time one of them is played).
+	sound_effects = assets.Sounds(["res/sounds/explosion1.ogg", "res/sounds/explosion2.ogg", "res/sounds/explosion3.ogg", "res/sounds/explosion4.ogg"])
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/powerup/missile.png")
+	image = assets.Image("res/powerup/missile.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	particle_spawn_rate = 25
 	particle_spawn_amount = 5
 
@@ -69,9 +64,6 @@ class Missile(pygame.sprite.Sprite):
 	angle_correction_rate = 0.1 * settings.GAME_FPS
 	max_speed = 3 * settings.GAME_FPS * settings.GAME_SCALE
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, x, y, angle, owner, target):
 		# We start by calling the superconstructor.
 		pygame.sprite.Sprite.__init__(self)
@@ -148,6 +140,7 @@ class Missile(pygame.sprite.Sprite):
 			powerup.destroy(False)
 
 		# Play a random sound from the sound_effects list.
+		counters.add("sounds played")
 		sound = self.__class__.sound_effects[random.randrange(0, len(self.__class__.sound_effects))].play()
 		if not sound is None:
 			sound.set_volume(settings.SOUND_VOLUME)
@@ -202,7 +195,7 @@ class Missile(pygame.sprite.Sprite):
 			speed = min(max(self.speed, self.__class__.hit_particle_min_speed), self.__class__.hit_particle_max_speed) * random.uniform(0.75, 1.25)
 			retardation = speed / 21.0
 			color = pygame.Color(random.randint(200, 255), random.randint(0, 255), 0)
-			particle.Particle(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, color, 5)
+			groups.Groups.particle_system.spawn(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, color, 5)
 
 	def update(self, main_clock):
 		# Check if we have collided with the target block.
@@ -299,7 +292,10 @@ class Missile(pygame.sprite.Sprite):
 				speed = random.uniform(0.65 * settings.GAME_FPS * settings.GAME_SCALE, 1.1 * settings.GAME_FPS * settings.GAME_SCALE)
 				retardation = speed / 24.0
 				color = pygame.Color(random.randint(200, 255), random.randint(0, 255), 0)
-				particle.Particle(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, color, 5)
+				groups.Groups.particle_system.spawn(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, color, 5)
 
 	def draw(self, surface):
-		surface.blit(self.image, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y))
\ No newline at end of file
+		surface.blit(self.image, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y))
+
+	def add_to_batch(self, batch):
+		batch.add(self.image, self.rect.x, self.rect.y)
\ No newline at end of file
@@ -5,6 +5,7 @@ import pygame
 import random
 import copy
 import math
+import other.assets as assets
 import other.useful as useful
 import objects.camera as camera
 import objects.shadow as shadow
@@ -20,21 +21,16 @@ Since paddles can move within the game area, they detect and handle their own co
 
 """
 
-def convert():
-	Paddle.top_image.convert()
-	Paddle.middle_image.convert()
-	Paddle.bottom_image.convert()
-
 class Paddle(pygame.sprite.Sprite):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
 	#image = pygame.image.load("res/paddle/paddle.png")
-	top_image = pygame.image.load("res/paddle/paddle_top.png")
-	middle_image = pygame.image.load("res/paddle/paddle_middle.png")
-	bottom_image = pygame.image.load("res/paddle/paddle_bottom.png")
+	top_image = assets.Image("res/paddle/paddle_top.png")
+	middle_image = assets.Image("res/paddle/paddle_middle.png")
+	bottom_image = assets.Image("res/paddle/paddle_bottom.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = middle_image.get_width() * settings.GAME_SCALE
+	width = middle_image.width
 	height = 22 * settings.GAME_SCALE
 	acceleration = 1.0 * settings.GAME_FPS * settings.GAME_SCALE
 	retardation = 2.5 * settings.GAME_FPS * settings.GAME_SCALE
@@ -55,11 +51,6 @@ class Paddle(pygame.sprite.Sprite):
 	stabilize_speed = 0.1 * settings.GAME_FPS * settings.GAME_SCALE
 	max_nudge_distance = 2.5 * settings.GAME_SCALE
 
-	# Scale the images to settings.GAME_SCALE.
-	top_image = pygame.transform.scale(top_image, (top_image.get_width() * settings.GAME_SCALE, top_image.get_height() * settings.GAME_SCALE))
-	middle_image = pygame.transform.scale(middle_image, (middle_image.get_width() * settings.GAME_SCALE, middle_image.get_height() * settings.GAME_SCALE))
-	bottom_image = pygame.transform.scale(bottom_image, (bottom_image.get_width() * settings.GAME_SCALE, bottom_image.get_height() * settings.GAME_SCALE))
-
 	def __init__(self, x, y, owner):
 		# We start by calling the superconstructor.
 		pygame.sprite.Sprite.__init__(self)
@@ -3,108 +3,200 @@ __license__ = "All Rights Reserved"
 
 import pygame
 from pygame.locals import *
-import math
-import copy
+import numpy
 import other.useful as useful
-import objects.shadow as shadow
-import objects.groups as groups
+import other.counters as counters
 import objects.camera as camera
 import settings.settings as settings
+import settings.graphics as graphics
 
 """
 
-This is the Particle class. Particles can be easily created, and they handle their own movement and destruction.
+This is the ParticleSystem class. It keeps track of all the particles in the game, and handles their movement, destruction and drawing.
 
 Particles are used throughout the game as eyecandy, basically. They surve no real purpose, except for looking pretty.
 And if I can say so myself, I think they add a lot to the look of the game. :)
 
-"""
-
-class Particle(pygame.sprite.Sprite):
-
-	# Standard values. These will be used unless any other values are specified per instance of this class.
-	shadow_blend_color = pygame.Color(100, 100, 100, 255)
-
-	def __init__(self, x, y, width, height, angle, speed, retardation, color, alpha_step = 0):
-		# We start by calling the superconstructor.
-		pygame.sprite.Sprite.__init__(self)
-		
-		# Create the rect used for drawing the particle.
-		self.rect = pygame.rect.Rect(x, y, width, height)
-
-		# This can be set if you spawn particles outside the game.
-		self.kill_outside_level = True
-		self.kill_when_speed_reaches_zero = True
+There can be a LOT of particles at the same time (every block hit spawns a few, every firework spawns 64), so instead of making every
+particle its own sprite with its own surface and its own shadow, we store everything about all the particles in NumPy arrays, one array
+per attribute. That way we can move and fade every single particle at once with a few array operations, instead of updating them one
+at a time in Python.
 
-		# Keep track of x and y as floats, for preciseness sake (rect keeps track of x,y as ints)
-		self.x = x
-		self.y = y
+Particles also leave a shadow behind. The shadow follows its particle around, and lingers for a while after the particle has died before
+fading away (unless the particle died by leaving the level, then the shadow goes with it). Shadows are stored in the same arrays as the
+particles.
 
-		# Setup speed, angle and retardation values, used when moving the particle.
-		self.angle = angle
-		self.speed = speed
-		self.retardation = retardation
-		self.gravity = 0
-		self.velocity_y = 0
-		
-		# Setup alpha values.
-		self.alpha_step = alpha_step
-		self.alpha = 255
+The one particle system used in the game is stored in groups.Groups.particle_system, and new particles are created with spawn().
 
-		# Setup the color values, used for drawing the particle.
-		self.color = copy.copy(color)
-
-		# Since we're using fill, we create a surface with SRCALPHA to handle alpha.
-		self.surface = pygame.Surface((self.rect.width, self.rect.height), SRCALPHA)
-
-		# Setup shadow color value, used for coloring the shadow.
-		self.shadow_color = useful.blend_colors(self.color, Particle.shadow_blend_color)
+"""
 
-		# Create a shadow.
-		self.shadow = shadow.Shadow(self, self.shadow_color, True, True)
+class ParticleSystem():
 
-		# Add self to the main particle_group.
-		groups.Groups.particle_group.add(self)
+	# Standard values. These will be used unless any other values are specified per particle.
+	shadow_blend_color = pygame.Color(100, 100, 100, 255)
 
-	def destroy(self):
-		# Takes care of killing both itself and the shadow.
-		self.kill()
-		self.shadow.kill()
+	# The shadows work just like lingering shadows (see Shadow), so these are the same values as in the Shadow class.
+	shadow_offset_x = 1 * settings.GAME_SCALE
+	shadow_offset_y = 2 * settings.GAME_SCALE
+	shadow_linger_time = 25 * settings.GAME_FPS
+	shadow_alpha_step = 50 * settings.GAME_FPS
+
+	# The names of all the arrays we store, and the type of each array.
+	attributes = [("x", numpy.float64), ("y", numpy.float64), ("previous_x", numpy.float64), ("previous_y", numpy.float64),
+					("width", numpy.int32), ("height", numpy.int32), ("direction_x", numpy.float64), ("direction_y", numpy.float64),
+					("speed", numpy.float64), ("retardation", numpy.float64), ("gravity", numpy.float64), ("velocity_y", numpy.float64),
+					("alpha_step", numpy.float64), ("red", numpy.int32), ("green", numpy.int32), ("blue", numpy.int32), ("alpha", numpy.int32),
+					("kill_outside_level", numpy.bool_), ("kill_when_speed_reaches_zero", numpy.bool_), ("alive", numpy.bool_),
+					("shadow_red", numpy.int32), ("shadow_green", numpy.int32), ("shadow_blue", numpy.int32), ("shadow_alpha", numpy.int32),
+					("shadow_linger_time_left", numpy.float64), ("shadow_alive", numpy.bool_)]
+
+	def __init__(self):
+		# Particles that have been spawned since the last update. Adding them to the arrays one at a time would be slow, so we collect
+		# them here and add them all at once.
+		self.spawned = []
+
+		# Create the (empty) arrays.
+		self.empty()
+
+		# Since we're using fill, we need a surface with SRCALPHA to handle alpha. We keep one for each size of particle we've drawn.
+		self.surfaces = {}
+
+	def __len__(self):
+		# The number of living particles.
+		self.add_spawned()
+		return int(numpy.count_nonzero(self.alive))
+
+	def empty(self):
+		# Removes every particle and every shadow.
+		self.spawned = []
+		for name, dtype in ParticleSystem.attributes:
+			setattr(self, name, numpy.zeros(0, dtype))
+
+	def spawn(self, x, y, width, height, angle, speed, retardation, color, alpha_step = 0, gravity = 0, kill_outside_level = True, kill_when_speed_reaches_zero = True, has_shadow = True, ignore_setting = False):
+		# Creates a new particle. Set kill_outside_level and kill_when_speed_reaches_zero to False if you spawn particles outside the
+		# game, and has_shadow to False if you're never going to draw the shadows.
+
+		# The game doesn't update or draw the particles if they're turned off, so they would just pile up. We don't bother spawning them
+		# then, unless ignore_setting is True (the game over screen always updates and draws its particles, so the fireworks use it).
+		if not graphics.PARTICLES and not ignore_setting:
+			return
+
+		shadow_color = useful.blend_colors(color, ParticleSystem.shadow_blend_color)
+
+		self.spawned.append((x, y, x, y, width, height, numpy.cos(angle), numpy.sin(angle), speed, retardation, gravity, 0, alpha_step,
+							color.r, color.g, color.b, color.a, kill_outside_level, kill_when_speed_reaches_zero, True,
+							shadow_color.r, shadow_color.g, shadow_color.b, shadow_color.a, ParticleSystem.shadow_linger_time, has_shadow and graphics.SHADOWS))
+
+	def add_spawned(self):
+		# Adds all the particles spawned since the last time to the arrays.
+		if len(self.spawned) == 0:
+			return
+
+		counters.add("particles spawned", len(self.spawned))
+
+		columns = zip(*self.spawned)
+		for index, (name, dtype) in enumerate(ParticleSystem.attributes):
+			setattr(self, name, numpy.concatenate((getattr(self, name), numpy.array(columns[index], dtype))))
+		self.spawned = []
+
+	def remove_dead(self):
+		# Throws away every particle that is dead and doesn't have a shadow left either.
+		keep = self.alive | self.shadow_alive
+		if not keep.all():
+			for name, dtype in ParticleSystem.attributes:
+				setattr(self, name, getattr(self, name)[keep])
 
 	def update(self, main_clock):
-		# Update speed, and kill self if speed gets to or under 0.
-		self.speed -= self.retardation * main_clock.time_scale
-		if self.speed <= 0:
-			if self.kill_when_speed_reaches_zero:
-				self.kill()
-			else:
-				self.speed = 0
-		
-		# Update the alpha in the RGBA color value. If it gets to or under 0, kill self.
-		if self.alpha_step > 0:
-			if self.color.a - int(self.alpha_step * main_clock.delta_time) < 0:
-				self.kill()
+		self.add_spawned()
+		self.remove_dead()
+
+		# Remember where every particle was before moving it, so we can draw them in between.
+		self.previous_x = self.x.copy()
+		self.previous_y = self.y.copy()
+
+		# Only the particles that are alive at the start of the update are updated. The dead ones stay where they died, so their
+		# shadows stay there too.
+		alive = self.alive.copy()
+
+		# Update speed, and kill the particles whose speed gets to or under 0.
+		self.speed[alive] -= self.retardation[alive] * main_clock.time_scale
+		stopped = alive & (self.speed <= 0)
+		self.alive[stopped & self.kill_when_speed_reaches_zero] = False
+		self.speed[stopped & ~self.kill_when_speed_reaches_zero] = 0
+
+		# Update the alpha value. If it would get under 0, kill the particle instead.
+		fading = alive & (self.alpha_step > 0)
+		alpha_decrease = (self.alpha_step * main_clock.delta_time).astype(numpy.int32)
+		faded = fading & (self.alpha - alpha_decrease < 0)
+		self.alive[faded] = False
+		fading &= ~faded
+		self.alpha[fading] -= alpha_decrease[fading]
+
+		# Finally, move the particles with speed in consideration.
+		self.velocity_y[alive] += self.gravity[alive]
+		self.x[alive] += self.direction_x[alive] * self.speed[alive] * main_clock.delta_time
+		self.y[alive] += self.direction_y[alive] * self.speed[alive] * main_clock.delta_time + self.velocity_y[alive]
+
+		# Kill the particles that are no longer in the visible game area, along with their shadows.
+		left = self.x.astype(numpy.int32)
+		top = self.y.astype(numpy.int32)
+		outside = (self.kill_outside_level & alive & ((left + self.width <= settings.LEVEL_X) | (left >= settings.LEVEL_MAX_X) |
+					(top + self.height <= settings.LEVEL_Y) | (top >= settings.LEVEL_MAX_Y)))
+		self.alive[outside] = False
+		self.shadow_alive[outside] = False
+
+		# Count the particles that died in this update. Counting them isn't free, so we only do it if the counters are on.
+		if settings.COUNTERS:
+			counters.add("particles killed", int(numpy.count_nonzero(alive & ~self.alive)))
+
+	def update_shadows(self, main_clock):
+		# Once a shadow has lingered for long enough, it fades away.
+		self.add_spawned()
+
+		self.shadow_linger_time_left -= main_clock.get_time()
+		fading = self.shadow_alive & (self.shadow_linger_time_left <= 0)
+		alpha_decrease = int(ParticleSystem.shadow_alpha_step * main_clock.delta_time)
+		faded = fading & (self.shadow_alpha - alpha_decrease < 0)
+		self.shadow_alive[faded] = False
+		self.shadow_alpha[fading & ~faded] -= alpha_decrease
+
+	def draw(self, surface, interpolation = 1.0):
+		self.blit_particles(surface, self.alive, 0, 0, self.red, self.green, self.blue, self.alpha, interpolation)
+
+	def draw_shadows(self, surface, interpolation = 1.0):
+		self.blit_particles(surface, self.shadow_alive, ParticleSystem.shadow_offset_x, ParticleSystem.shadow_offset_y, self.shadow_red, self.shadow_green,
+							self.shadow_blue, self.shadow_alpha, interpolation)
+
+	def blit_particles(self, surface, visible, offset_x, offset_y, red, green, blue, alpha, interpolation):
+		# Draws a filled rect for every particle in visible, in the given colors. We work out where every particle should be drawn
+		# (in between its last two positions, see Interpolator) all at once, and then simply go through the list.
+		self.add_spawned()
+		if not visible.any():
+			return
+
+		x = self.previous_x[visible] + (self.x[visible] - self.previous_x[visible]) * interpolation
+		y = self.previous_y[visible] + (self.y[visible] - self.previous_y[visible]) * interpolation
+		x = (x + offset_x).astype(numpy.int32) - int(camera.CAMERA.x)
+		y = (y + offset_y).astype(numpy.int32) - int(camera.CAMERA.y)
+		width = self.width[visible]
+		height = self.height[visible]
+
+		# Particles that are completely outside the clip rect of the surface (under the walls, or outside the screen when it shakes)
+		# can't be seen anyway, so we don't draw them.
+		clip = surface.get_clip()
+		seen = (x + width > clip.left) & (x < clip.right) & (y + height > clip.top) & (y < clip.bottom)
+
+		particles = zip(x[seen].tolist(), y[seen].tolist(), width[seen].tolist(), height[seen].tolist(), red[visible][seen].tolist(),
+						green[visible][seen].tolist(), blue[visible][seen].tolist(), alpha[visible][seen].tolist())
+
+		for x, y, width, height, r, g, b, a in particles:
+			if a >= 255:
+				# Opaque particles don't need any blending, so we can fill them straight onto the surface.
+				surface.fill((r, g, b), (x, y, width, height))
 			else:
-				self.color.a -= int(self.alpha_step * main_clock.delta_time)
-
-		# Finally, move the particle with speed in consideration.
-		self.velocity_y += self.gravity
-		self.x = self.x + (math.cos(self.angle) * self.speed * main_clock.delta_time)
-		self.y = self.y + (math.sin(self.angle) * self.speed * main_clock.delta_time) + self.velocity_y
-		self.rect.x = self.x
-		self.rect.y = self.y
-
-		# Kill the particle if it is no longer in the visible game area, or outside the screen.
-		if self.kill_outside_level:
-			if self.rect.x + self.rect.width <= settings.LEVEL_X:
-				self.destroy()
-			elif self.rect.x >= settings.LEVEL_MAX_X:
-				self.destroy()
-			if self.rect.y + self.rect.height <= settings.LEVEL_Y:
-				self.destroy()
-			elif self.rect.y >= settings.LEVEL_MAX_Y:
-				self.destroy()
-
-	def draw(self, surface):
-		self.surface.fill(self.color)
-		return surface.blit(self.surface, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y))
\ No newline at end of file
+				# Filling doesn't work with alpha, so we fill a surface of the right size and blit that instead.
+				if not (width, height) in self.surfaces:
+					self.surfaces[(width, height)] = pygame.Surface((width, height), SRCALPHA)
+				particle_surface = self.surfaces[(width, height)]
+				particle_surface.fill((r, g, b, a))
+				surface.blit(particle_surface, (x, y))
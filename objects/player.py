@@ -6,6 +6,7 @@ from pygame.locals import *
 import random
 import math
 import copy
+import other.assets as assets
 import objects.camera as camera
 import objects.groups as groups
 import objects.ball as ball
@@ -24,25 +25,19 @@ This is the player class. mBreak is currently designed with two players in mind,
 class Player(pygame.sprite.Sprite):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	energy_image_top_left = pygame.image.load("res/player/energy/energy_top_left_2.png")
-	energy_image_middle_left = pygame.image.load("res/player/energy/energy_middle_4.png")
-	energy_image_middle_right = pygame.image.load("res/player/energy/energy_middle_right_4.png")
-	energy_image_bottom_left = pygame.image.load("res/player/energy/energy_bottom_left_2.png")
-
-	energy_image_top_left_width = energy_image_top_left.get_width() * settings.GAME_SCALE
-	energy_image_top_left_height = energy_image_top_left.get_height() * settings.GAME_SCALE
-	energy_image_middle_left_width = energy_image_middle_left.get_width() * settings.GAME_SCALE
-	energy_image_middle_left_height = energy_image_middle_left.get_height() * settings.GAME_SCALE
-	energy_image_middle_right_width = energy_image_middle_right.get_width() * settings.GAME_SCALE
-	energy_image_middle_right_height = energy_image_middle_right.get_height() * settings.GAME_SCALE
-	energy_image_bottom_left_width = energy_image_bottom_left.get_width() * settings.GAME_SCALE
-	energy_image_bottom_left_height = energy_image_bottom_left.get_height() * settings.GAME_SCALE
-
-	# Scale image to settings.GAME_SCALE.
-	energy_image_top_left = pygame.transform.scale(energy_image_top_left, (energy_image_top_left_width, energy_image_top_left_height))
-	energy_image_middle_left = pygame.transform.scale(energy_image_middle_left, (energy_image_middle_left_width, energy_image_middle_left_height))
-	energy_image_middle_right = pygame.transform.scale(energy_image_middle_right, (energy_image_middle_right_width, energy_image_middle_right_height))
-	energy_image_bottom_left = pygame.transform.scale(energy_image_bottom_left, (energy_image_bottom_left_width, energy_image_bottom_left_height))
+	energy_image_top_left = assets.Image("res/player/energy/energy_top_left_2.png")
+	energy_image_middle_left = assets.Image("res/player/energy/energy_middle_4.png")
+	energy_image_middle_right = assets.Image("res/player/energy/energy_middle_right_4.png")
+	energy_image_bottom_left = assets.Image("res/player/energy/energy_bottom_left_2.png")
+
+	energy_image_top_left_width = energy_image_top_left.width
+	energy_image_top_left_height = energy_image_top_left.height
+	energy_image_middle_left_width = energy_image_middle_left.width
+	energy_image_middle_left_height = energy_image_middle_left.height
+	energy_image_middle_right_width = energy_image_middle_right.width
+	energy_image_middle_right_height = energy_image_middle_right.height
+	energy_image_bottom_left_width = energy_image_bottom_left.width
+	energy_image_bottom_left_height = energy_image_bottom_left.height
 
 	def __init__(self, x, y, name, key_up, key_down, key_unleash_energy, joy_unleash_energy, gamepad_id, color, ai_difficulty = 1):
 		# We start by calling the superconstructor.
@@ -123,6 +118,9 @@ class Player(pygame.sprite.Sprite):
 		self.energy_color_g = self.energy_color.g
 		self.energy_color_b = self.energy_color.b
 
+		# The time (in milliseconds) the color of the energy has been pulsing for.
+		self.energy_pulse_time = 0
+
 		# Create and store the paddle.
 		self.paddle_group = pygame.sprite.Group()
 
@@ -201,8 +199,10 @@ class Player(pygame.sprite.Sprite):
 		self.energy_rect.height = self.energy_level_surface.get_height() * (self.energy / float(self.max_energy))
 		self.energy_rect.y = self.energy_level_surface.get_height() - self.energy_rect.height
 
-		# Update the color of the energy.
-		new_r = int(self.energy_color_r + math.sin(pygame.time.get_ticks() * 0.005) * (50 * (self.energy / float(self.max_energy))))
+		# Update the color of the energy. It pulses with the time the game has been running, not the real time, so that the game looks
+		# the same every time it's simulated (see headless).
+		self.energy_pulse_time += main_clock.frame_time
+		new_r = int(self.energy_color_r + math.sin(self.energy_pulse_time * 0.005) * (50 * (self.energy / float(self.max_energy))))
 		if new_r <= 255 and new_r >= 0:
 			self.energy_color.r = new_r
 		else:
@@ -211,7 +211,7 @@ class Player(pygame.sprite.Sprite):
 			else:
 				self.energy_color.r = 255
 
-		new_g = int(self.energy_color_g + math.sin(pygame.time.get_ticks() * 0.005) * (50 * (self.energy / float(self.max_energy))))
+		new_g = int(self.energy_color_g + math.sin(self.energy_pulse_time * 0.005) * (50 * (self.energy / float(self.max_energy))))
 		if new_g <= 255 and new_g >= 0:
 			self.energy_color.g = new_g
 		else:
@@ -220,7 +220,7 @@ class Player(pygame.sprite.Sprite):
 			else:
 				self.energy_color.g = 255
 
-		new_b = int(self.energy_color_b + math.sin(pygame.time.get_ticks() * 0.005) * (50 * (self.energy / float(self.max_energy))))
+		new_b = int(self.energy_color_b + math.sin(self.energy_pulse_time * 0.005) * (50 * (self.energy / float(self.max_energy))))
 		if new_b <= 255 and new_b >= 0:
 			self.energy_color.b = new_b
 		else:
@@ -259,15 +259,19 @@ class Player(pygame.sprite.Sprite):
 			self.last_powerup_group_size = len(self.powerup_group)		
 
 	def draw(self, surface):
+		# Draws the energy bar, and returns the rect of the screen that we've drawn to.
+
 		# Draw the energy images.
-		surface.blit(self.energy_image_top, (self.energy_top_x - camera.CAMERA.x, self.energy_top_y - camera.CAMERA.y))
-		surface.blit(self.energy_image_middle, (self.energy_middle_x - camera.CAMERA.x, self.energy_middle_y - camera.CAMERA.y))
+		dirty_rect = surface.blit(self.energy_image_top, (self.energy_top_x - camera.CAMERA.x, self.energy_top_y - camera.CAMERA.y))
+		dirty_rect.union_ip(surface.blit(self.energy_image_middle, (self.energy_middle_x - camera.CAMERA.x, self.energy_middle_y - camera.CAMERA.y)))
 
 		temp_energy_surface = self.energy_level_surface.copy()
 		temp_energy_surface.fill(self.energy_color, self.energy_rect)
-		surface.blit(temp_energy_surface, (self.energy_level_x - camera.CAMERA.x, self.energy_level_y - camera.CAMERA.y))
+		dirty_rect.union_ip(surface.blit(temp_energy_surface, (self.energy_level_x - camera.CAMERA.x, self.energy_level_y - camera.CAMERA.y)))
+
+		dirty_rect.union_ip(surface.blit(self.energy_image_bottom, (self.energy_bottom_x - camera.CAMERA.x, self.energy_bottom_y - camera.CAMERA.y)))
 
-		surface.blit(self.energy_image_bottom, (self.energy_bottom_x - camera.CAMERA.x, self.energy_bottom_y - camera.CAMERA.y))
+		return dirty_rect
 
 	def handle_events(self, event):
 		# Work on this later...
@@ -4,10 +4,10 @@ __license__ = "All Rights Reserved"
 import pygame
 import random
 import math
+import other.assets as assets
 import objects.powerups.powerup as powerup
 import objects.effects.charged as charged
 import objects.shadow as shadow
-import objects.particle as particle
 import objects.ball as ball
 import objects.groups as groups
 import settings.settings as settings
@@ -18,25 +18,17 @@ This is the Electricity effect. When picked up by a ball, it applies the "Charge
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	Electricity.image.convert_alpha()
-
 class Electricity(powerup.Powerup):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/powerup/electricity.png")
+	image = assets.Image("res/powerup/electricity.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	particle_spawn_rate = 550
 	particle_spawn_amount = 5
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, x, y):
 		# We start by calling the superconstructor.
 		powerup.Powerup.__init__(self, x, y, Electricity.width, Electricity.height)
@@ -82,4 +74,4 @@ class Electricity(powerup.Powerup):
 				random_value = random.randint(225, 255)
 				color = pygame.Color(random_value, random_value, random.randint(0, 100))
 				random_size = random.randint(self.rect.width / 8, self.rect.width / 6)
-				particle.Particle(self.x + self.rect.width / 2, self.y + self.rect.height / 2, random_size, random_size, angle, speed, retardation, color, 20 * settings.GAME_FPS)
\ No newline at end of file
+				groups.Groups.particle_system.spawn(self.x + self.rect.width / 2, self.y + self.rect.height / 2, random_size, random_size, angle, speed, retardation, color, 20 * settings.GAME_FPS)
\ No newline at end of file
@@ -2,6 +2,7 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import other.assets as assets
 import objects.powerups.powerup as powerup
 import objects.effects.sizechange as sizechange
 import objects.shadow as shadow
@@ -15,19 +16,14 @@ This is the Enlarger powerup. When picked up by a ball, it applies a "sizechange
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	Enlarger.image_sheet.convert_alpha()
-
 class Enlarger(powerup.Powerup):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image_sheet = pygame.image.load("res/powerup/enlarger.png")
+	image_sheet = assets.Image("res/powerup/enlarger.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image_sheet.get_width() * settings.GAME_SCALE
-	height = image_sheet.get_height() * settings.GAME_SCALE
+	width = image_sheet.width
+	height = image_sheet.height
 	frame_width = width
 	frame_height = width
 	
@@ -37,9 +33,6 @@ class Enlarger(powerup.Powerup):
 	# The size that the effect will change the paddle by.
 	size_change = 4 * settings.GAME_SCALE
 
-	# Scale image to settings.GAME_SCALE.
-	image_sheet = pygame.transform.scale(image_sheet, (width, height))
-
 	def __init__(self, x, y):
 		# We start by calling the superconstructor.
 		powerup.Powerup.__init__(self, x, y, Enlarger.frame_width, Enlarger.frame_height)
@@ -4,11 +4,11 @@ __license__ = "All Rights Reserved"
 import pygame
 import random
 import math
+import other.assets as assets
 import objects.powerups.powerup as powerup
 import objects.effects.timeout as timeout
 import objects.effects.burning as burning
 import objects.shadow as shadow
-import objects.particle as particle
 import objects.ball as ball
 import objects.groups as groups
 import settings.settings as settings
@@ -20,26 +20,18 @@ the owner of that ball.
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	Fire.image.convert_alpha()
-
 class Fire(powerup.Powerup):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/powerup/fire.png")
+	image = assets.Image("res/powerup/fire.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	particle_spawn_rate = 100
 	particle_least_spawn_amount = 2
 	particle_maximum_spawn_amount = 4
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, x, y):
 		# We start by calling the superconstructor.
 		powerup.Powerup.__init__(self, x, y, Fire.width, Fire.height)
@@ -84,4 +76,4 @@ class Fire(powerup.Powerup):
 				else:
 					a_color = random.randint(0, 255)
 					color = pygame.Color(a_color, a_color, a_color)
-				particle.Particle(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, color, 5 * settings.GAME_FPS)
+				groups.Groups.particle_system.spawn(self.x + self.rect.width / 2, self.y + self.rect.height / 2, width, width, angle, speed, retardation, color, 5 * settings.GAME_FPS)
@@ -4,13 +4,13 @@ __license__ = "All Rights Reserved"
 import pygame
 import random
 import math
+import other.assets as assets
 import other.useful as useful
 from libs import pyganim
 import objects.powerups.powerup as powerup
 import objects.effects.timeout as timeout
 import objects.effects.freezing as freezing
 import objects.shadow as shadow
-import objects.particle as particle
 import objects.ball as ball
 import objects.groups as groups
 import settings.settings as settings
@@ -22,28 +22,20 @@ that balls owner.
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	Frost.image_sheet.convert_alpha()
-
 class Frost(powerup.Powerup):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image_sheet = pygame.image.load("res/powerup/frost.png")
+	image_sheet = assets.Image("res/powerup/frost.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image_sheet.get_width() * settings.GAME_SCALE
-	height = image_sheet.get_height() * settings.GAME_SCALE
+	width = image_sheet.width
+	height = image_sheet.height
 	frame_width = width
 	frame_height = width
 
 	particle_spawn_rate = 600
 	particle_spawn_amount = 2
 
-	# Scale image to settings.GAME_SCALE.
-	image_sheet = pygame.transform.scale(image_sheet, (width, height))
-
 	def __init__(self, x, y):
 		# We start by calling the superconstructor.
 		powerup.Powerup.__init__(self, x, y, Frost.frame_width, Frost.frame_height)
@@ -102,4 +94,4 @@ class Frost(powerup.Powerup):
 				speed = random.uniform(0.2 * settings.GAME_FPS * settings.GAME_SCALE, 0.35 * settings.GAME_FPS * settings.GAME_SCALE)
 				retardation = speed / 76.0
 				color = pygame.Color(random.randint(0, 50), random.randint(125, 255), random.randint(220, 255))
-				particle.Particle(self.x + self.rect.width / 2, self.y + self.rect.height / 2, self.rect.width / 4, self.rect.width / 4, angle, speed, retardation, color, 3 * settings.GAME_FPS)
\ No newline at end of file
+				groups.Groups.particle_system.spawn(self.x + self.rect.width / 2, self.y + self.rect.height / 2, self.rect.width / 4, self.rect.width / 4, angle, speed, retardation, color, 3 * settings.GAME_FPS)
\ No newline at end of file
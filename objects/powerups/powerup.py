@@ -5,6 +5,8 @@ import pygame
 import copy
 import math
 import random
+import other.assets as assets
+import other.counters as counters
 import objects.effects.flash as flash
 import objects.groups as groups
 import settings.settings as settings
@@ -18,13 +20,8 @@ It also handles the sound effects that are played when the powerup is destroyed
 
 class Powerup(pygame.sprite.Sprite):
 
-	# Initialize the mixer (so we can load a sound) and load the sound effects.
-	pygame.mixer.init(44100, -16, 2, 2048)
-	sound_effects = []
-	sound_effects.append(pygame.mixer.Sound("res/sounds/powerup1.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/powerup2.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/powerup3.ogg"))
-	sound_effects.append(pygame.mixer.Sound("res/sounds/powerup4.ogg"))
+	# The sound effects we pick from at random (loaded the first time one of them is played).
+	sound_effects = assets.Sounds(["res/sounds/powerup1.ogg", "res/sounds/powerup2.ogg", "res/sounds/powerup3.ogg", "res/sounds/powerup4.ogg"])
 
 	# The standard width of all powerup image files. Each individual powerup can ofcourse be bigger/smaller, but this is the standard size.
 	width = 8 * settings.GAME_SCALE
@@ -55,7 +52,10 @@ class Powerup(pygame.sprite.Sprite):
 
 		# Keep track of whether or not this powerup should bob.
 		self.bob = True
-		self.start_time = pygame.time.get_ticks()
+
+		# Every powerup starts bobbing at a random point, so that they don't all bob in sync. This used to be the time the powerup was
+		# created, but that made the game play differently every time, even with the same random seed (see headless).
+		self.start_time = random.uniform(0, 2 * math.pi)
 		self.passed_time = 0
 
 		# Store self in the main powerup_group.
@@ -68,6 +68,7 @@ class Powerup(pygame.sprite.Sprite):
 		self.effect_group.add(flash.Flash(self, copy.copy(Powerup.spawn_effect_start_color), copy.copy(Powerup.spawn_effect_final_color), Powerup.spawn_effect_tick_amount))
 
 		# Play a random sound from the sound_effects list.
+		counters.add("sounds played")
 		sound = Powerup.sound_effects[random.randrange(0, len(Powerup.sound_effects))].play()
 		if not sound is None:
 			sound.set_volume(settings.SOUND_VOLUME)
@@ -117,6 +118,7 @@ class Powerup(pygame.sprite.Sprite):
 
 		# Play a random sound from the sound_effects list.
 		if play_sound:
+			counters.add("sounds played")
 			sound = Powerup.sound_effects[random.randrange(0, len(Powerup.sound_effects))].play()
 			if not sound is None:
 				sound.set_volume(settings.SOUND_VOLUME)
@@ -2,6 +2,7 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import other.assets as assets
 import objects.powerups.powerup as powerup
 import objects.effects.sizechange as sizechange
 import objects.shadow as shadow
@@ -14,19 +15,14 @@ This is the Reducer powerup. When picked up by a ball, it applies a "sizechange"
 
 """
 
-def convert():
-	# We put this here so the game-class can call this method to "preload" the image used for this powerup.
-	# I could probably put this in the constructor of the powerup, but I worry about performance so I make sure to only do it once.
-	Reducer.image.convert_alpha()
-
 class Reducer(powerup.Powerup):
 
 	# Load the image file here, so any new instance of this class doesn't have to reload it every time, they can just copy the surface.
-	image = pygame.image.load("res/powerup/reducer.png")
+	image = assets.Image("res/powerup/reducer.png")
 
 	# Standard values. These will be used unless any other values are specified per instance of this class.
-	width = image.get_width() * settings.GAME_SCALE
-	height = image.get_height() * settings.GAME_SCALE
+	width = image.width
+	height = image.height
 	
 	# The amount of time the effect will last.
 	duration = 7500
@@ -34,9 +30,6 @@ class Reducer(powerup.Powerup):
 	# The size that the effect will change the paddle by.
 	size_change = -4 * settings.GAME_SCALE
 
-	# Scale image to settings.GAME_SCALE.
-	image = pygame.transform.scale(image, (width, height))
-
 	def __init__(self, x, y):
 		# We start by calling the superconstructor.
 		powerup.Powerup.__init__(self, x, y, Reducer.width, Reducer.height)
@@ -4,7 +4,9 @@ __license__ = "All Rights Reserved"
 import pygame
 from pygame.locals import *
 import objects.camera as camera
-import other.useful as useful
+import other.tintcache as tintcache
+import other.counters as counters
+import other.render as render
 import objects.groups as groups
 import settings.settings as settings
 
@@ -18,8 +20,16 @@ It's trivial to add a shadow to any sprite in the game.
 
 """
 
+def get_image(parent_image, color = pygame.Color(0, 0, 0, 128)):
+	# Returns the shadow image of the given image. The image is shared with every other shadow of the same image and color, so it
+	# must not be changed. If the image doesn't have any alpha values, don't blend alphas. If it does, do blend alphas.
+	return tintcache.colorize(parent_image, color, not parent_image.get_alpha() == None, alpha = color.a)
+
 class Shadow(pygame.sprite.Sprite):
 
+	# The layer we're drawn in (see RenderQueue).
+	layer = render.SHADOW_LAYER
+
 	# Standard values. These will be used unless any other values are specified per instance of this class.
 	offset_x = 1 * settings.GAME_SCALE
 	offset_y = 2 * settings.GAME_SCALE
@@ -51,28 +61,30 @@ class Shadow(pygame.sprite.Sprite):
 		# Store the color.
 		self.color = color
 
-		# Copy the parents image, and then colorize it to the shadow color.
+		# Get the parents image colorized to the shadow color.
 		if not self.fill:
-			self.image = self.parent.image.copy()
-			
-			# Colorize the image. If the image doesn't have any alpha values, don't blend alphas. If it does, do blend alphas.
-			if self.image.get_alpha() == None:
-				useful.colorize_image(self.image, self.color)
-			else:
-				useful.colorize_image(self.image, self.color, True)
-
-			# Convert to alpha and apply the alpha value.
-			self.image.convert_alpha()
-			self.image.set_alpha(self.color.a)
-
-			# Store a copy of this image as the original image. Used when rotating the shadow.
-			self.original_image = self.image.copy()
+			self.image = get_image(self.parent.image, self.color)
+
+			# Store the original image. Used when rotating the shadow (rotating creates a new image, so we can share this one).
+			self.original_image = self.image
 		else:
 			# If using fill instead of image, create a new surface to handle alpha.
 			self.surface = pygame.Surface((self.rect.width, self.rect.height), SRCALPHA)
 
 		# Add self to the main shadow_group.
 		groups.Groups.shadow_group.add(self)
+		counters.add("shadows created")
+
+		# Whether we've been killed yet. Some shadows aren't in the shadow group (see Block.create_shadow), so we can't simply check if
+		# we're still in a group.
+		self.killed = False
+
+	def kill(self):
+		# Count the shadow as killed, unless it has been killed already.
+		if not self.killed:
+			self.killed = True
+			counters.add("shadows killed")
+		pygame.sprite.Sprite.kill(self)
 
 	def blit_to(self, surface):
 		# Blits the shadow to the given surface.
@@ -85,6 +97,14 @@ class Shadow(pygame.sprite.Sprite):
 			# If we're not using fill, we simply blit the image to the given surface.
 			return surface.blit(self.image, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y))
 
+	def add_to_batch(self, batch):
+		# Adds the shadow to the given render batch (see RenderBatch), instead of blitting it straight away.
+		if self.fill:
+			self.surface.fill(self.color)
+			batch.add(self.surface, self.rect.x, self.rect.y)
+		else:
+			batch.add(self.image, self.rect.x, self.rect.y)
+
 	def update(self, main_clock):
 		# Check if we're supposed to linger.
 		if self.linger:
@@ -6,6 +6,7 @@ from pygame.locals import *
 import copy
 import objects.camera as camera
 import other.useful as useful
+import other.render as render
 import objects.shadow as shadow
 import objects.groups as groups
 import settings.settings as settings
@@ -22,6 +23,9 @@ Any object which has a color and a rect can spawn a trace attached to it.
 
 class Trace(pygame.sprite.Sprite):
 
+	# The layer we're drawn in (see RenderQueue).
+	layer = render.TRACE_LAYER
+
 	# Standard values. These will be used unless any other values are specified per instance of this class.
 	shadow_blend_color = pygame.Color(100, 100, 100, 255)
 	alpha_step = 16 * settings.GAME_FPS
@@ -60,6 +64,11 @@ class Trace(pygame.sprite.Sprite):
 		self.surface.fill(self.color)
 		return surface.blit(self.surface, (self.rect.x - camera.CAMERA.x, self.rect.y - camera.CAMERA.y))
 
+	def add_to_batch(self, batch):
+		# Adds self to the given render batch (see RenderBatch), instead of blitting straight away.
+		self.surface.fill(self.color)
+		batch.add(self.surface, self.rect.x, self.rect.y)
+
 	def destroy(self):
 		# Takes care of killing ourselves and our shadow.
 		self.kill()
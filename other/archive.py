@@ -0,0 +1,216 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import os
+import mmap
+import json
+import struct
+
+"""
+
+This module packs everything in res/ into a single file, the resource archive (res.pak), and reads the resources back out of it.
+
+Opening hundreds of small files one at a time is slow, especially from a spinning disk, so instead the whole archive is opened once and
+memory-mapped. Every resource in it is then handed out as a small file-like object (see ArchiveFile) that reads from the mapped
+archive, which pygame.image.load() and pygame.mixer.Sound() happily accept instead of a filename. pygame only accepts strings from
+read() though (not buffers), so every read copies the bytes it returns out of the mapping, just like reading from a real file would.
+What the archive saves is opening and closing a file for every resource, not the copying.
+
+The archive is built with:
+
+	python -m other.archive
+
+which has to be done again whenever something in res/ changes. The archive remembers the size and modification time of every file it
+was built from, and if res/ doesn't match that any more when the game starts, the archive isn't used at all (and we say so), so an
+edited resource is never silently ignored. If there is no archive (or a resource isn't in it), the resource is simply read from res/
+as usual, so the game works just fine without one.
+
+Resources are always asked for by their normal path (like "res/ball/ball.png"), so nothing else has to know whether they come from
+the archive or not. Use open_file() instead of open(), read_file() to get the contents of a whole file, and listdir() instead of
+os.listdir().
+
+The music is still streamed from res/ by pygame.mixer.music (it needs a real file to stream from), and the fonts aren't in res/.
+
+An archive looks like this: a header (see HEADER) with a magic string and the size of the index, then the index itself (JSON, with
+every path as key and (offset, size, modification time) as value, where offset is counted from the end of the index), and finally the
+contents of every file, one after the other.
+
+"""
+
+# The archive, and the folder that is packed into it.
+ARCHIVE_PATH = "res.pak"
+ROOT = "res"
+
+HEADER = struct.Struct("<4sI")
+MAGIC = "mBP2"
+
+# The archive used by the whole game, opened the first time it's needed (see get_archive).
+ARCHIVE = None
+ARCHIVE_OPENED = False
+
+class ArchiveFile():
+
+	def __init__(self, data, offset, size):
+		# A read-only file-like object for the size bytes at offset in data (the mapped archive). Reading returns a copy of the bytes,
+		# since that's what pygame wants.
+		self.data = data
+		self.offset = offset
+		self.size = size
+		self.position = 0
+
+	def read(self, size = -1):
+		if size is None or size < 0 or size > self.size - self.position:
+			size = self.size - self.position
+		start = self.offset + self.position
+		self.position += size
+		return self.data[start:start + size]
+
+	def seek(self, offset, whence = 0):
+		if whence == 1:
+			offset += self.position
+		elif whence == 2:
+			offset += self.size
+		self.position = max(0, min(offset, self.size))
+
+	def tell(self):
+		return self.position
+
+	def close(self):
+		pass
+
+class Archive():
+
+	def __init__(self, path):
+		# Open and map the archive at path, and read the index.
+		with open(path, "rb") as archive_file:
+			self.data = mmap.mmap(archive_file.fileno(), 0, access = mmap.ACCESS_READ)
+
+		magic, index_size = HEADER.unpack_from(self.data)
+		if magic != MAGIC:
+			raise IOError("%s is not a resource archive." % path)
+
+		# The index, with every path as key and (offset, size) as value. The offsets are counted from the start of the archive here.
+		data_offset = HEADER.size + index_size
+		index = json.loads(self.data[HEADER.size:data_offset])
+		self.index = dict((str(name), (data_offset + offset, size)) for name, (offset, size, _) in index.iteritems())
+
+		# The size and modification time every file had when the archive was built, with the path as key (see get_stamps).
+		self.stamps = dict((str(name), (size, modified)) for name, (_, size, modified) in index.iteritems())
+
+	def __contains__(self, path):
+		return normalize_path(path) in self.index
+
+	def is_up_to_date(self, root):
+		# Returns True if the files in root are exactly the ones the archive was built from. If root doesn't exist (the archive is all
+		# there is), there's nothing it can be out of date with.
+		if not os.path.isdir(root):
+			return True
+		return get_stamps(root) == self.stamps
+
+	def open(self, path):
+		offset, size = self.index[normalize_path(path)]
+		return ArchiveFile(self.data, offset, size)
+
+	def read(self, path):
+		offset, size = self.index[normalize_path(path)]
+		return self.data[offset:offset + size]
+
+	def listdir(self, folder):
+		# Returns the names of everything directly in the given folder of the archive.
+		folder = normalize_path(folder).rstrip("/") + "/"
+		names = set()
+		for path in self.index:
+			if path.startswith(folder):
+				names.add(path[len(folder):].split("/")[0])
+		return sorted(names)
+
+def normalize_path(path):
+	# Paths in the archive always use forward slashes, and never start with "./".
+	path = path.replace("\\", "/")
+	while path.startswith("./"):
+		path = path[2:]
+	return path
+
+def get_stamps(root):
+	# Returns the size and modification time of every file in root (and its subfolders), with the path as key.
+	stamps = {}
+	for folder, _, names in os.walk(root):
+		for name in names:
+			resource_path = normalize_path(os.path.join(folder, name))
+			resource_stat = os.stat(resource_path)
+			stamps[resource_path] = (resource_stat.st_size, resource_stat.st_mtime)
+	return stamps
+
+def get_archive():
+	# Returns the archive, or None if there isn't one (or it can't be read, or it's out of date).
+	global ARCHIVE
+	global ARCHIVE_OPENED
+
+	if not ARCHIVE_OPENED:
+		ARCHIVE_OPENED = True
+		if os.path.exists(ARCHIVE_PATH):
+			try:
+				ARCHIVE = Archive(ARCHIVE_PATH)
+			except (IOError, ValueError, struct.error):
+				print("Couldn't read %s, so the resources are read from %s/ instead. Run \"python -m other.archive\" to rebuild it." % (ARCHIVE_PATH, ROOT))
+				ARCHIVE = None
+
+		if not ARCHIVE is None and not ARCHIVE.is_up_to_date(ROOT):
+			print("%s doesn't match the files in %s/, so the resources are read from %s/ instead. Run \"python -m other.archive\" to rebuild it." % (ARCHIVE_PATH, ROOT, ROOT))
+			ARCHIVE = None
+	return ARCHIVE
+
+def open_file(path):
+	# Returns a file-like object for reading the resource at path, from the archive if it's in there.
+	archive = get_archive()
+	if not archive is None and path in archive:
+		return archive.open(path)
+	return open(path, "rb")
+
+def read_file(path):
+	# Returns the contents of the resource at path, from the archive if it's in there.
+	archive = get_archive()
+	if not archive is None and path in archive:
+		return archive.read(path)
+	with open(path, "rb") as resource_file:
+		return resource_file.read()
+
+def listdir(folder):
+	# Returns the names of everything in the given folder, from the archive if it has anything in there.
+	archive = get_archive()
+	if not archive is None:
+		names = archive.listdir(folder)
+		if len(names) > 0:
+			return names
+	return os.listdir(folder)
+
+def build(root = ROOT, path = ARCHIVE_PATH):
+	# Packs every file in root (and its subfolders) into an archive at path. Returns the number of files and the size of the archive.
+	stamps = get_stamps(root)
+	paths = sorted(stamps)
+
+	index = {}
+	offset = 0
+	for resource_path in paths:
+		size, modified = stamps[resource_path]
+		index[resource_path] = (offset, size, modified)
+		offset += size
+	index_data = json.dumps(index, sort_keys = True)
+
+	# We write to a temporary file first and then rename it, so that a running game never sees a half-written archive.
+	temporary_path = path + ".tmp"
+	with open(temporary_path, "wb") as archive_file:
+		archive_file.write(HEADER.pack(MAGIC, len(index_data)))
+		archive_file.write(index_data)
+		for resource_path in paths:
+			with open(resource_path, "rb") as resource_file:
+				archive_file.write(resource_file.read())
+	if os.path.exists(path):
+		os.remove(path)
+	os.rename(temporary_path, path)
+
+	return len(paths), os.path.getsize(path)
+
+if __name__ == "__main__":
+	file_count, archive_size = build()
+	print("Packed %d files from %s/ into %s (%.1f MB)" % (file_count, ROOT, ARCHIVE_PATH, archive_size / (1024.0 * 1024.0)))
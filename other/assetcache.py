@@ -0,0 +1,170 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import pygame
+import os
+import mmap
+import struct
+import hashlib
+import multiprocessing
+import other.archive as archive
+
+"""
+
+This module keeps the images we've already loaded, scaled and colorized (tinted) on disk, in CACHE_DIRECTORY, so that we don't have to
+decode, scale and colorize the same images every time the game starts (or every round, for the colorized ones).
+
+Every image is stored in its own file, named after a hash of its key. The key of a loaded image is (the hash of the source file, the
+scale), and the key of a colorized image is the key of the image it was colorized from, plus the color (and
+the other colorize options). Since the hash of the source file is part of the key, changing an image in res/ simply means that it gets
+a new key, and the old file is never used again. If the way images are stored (or colorized) ever changes, bump CACHE_VERSION so that
+none of the old files are used.
+
+A file contains a small header (see HEADER) followed by the raw pixels of the image, in the format given in the header (RGB or RGBA).
+The files are memory-mapped and turned into surfaces with pygame.image.frombuffer(), so the pixels are never decoded or even copied
+before they're converted to the format of the display (see assets.convert). Since the pixels are stored before they're converted, the
+format of the display isn't part of the key. Some of our images (like the frames of the logo) are palette images with a colorkey
+instead of an alpha channel, so the header also holds the colorkey, and the loaded surface gets it back, just like the image would have
+if it was loaded from res/.
+
+The first time the game runs, the cache is empty. assets.prewarm() then calls build(), which loads and scales all the missing images
+in parallel, with one process per CPU.
+
+Everything in here is just to save time. If anything goes wrong when reading or writing the cache, we simply act as if the image wasn't
+in the cache (and load it the normal way).
+
+"""
+
+# Bump this whenever the way images are stored, scaled or colorized changes.
+CACHE_VERSION = 2
+
+# The folder the cached images are stored in.
+CACHE_DIRECTORY = os.path.join(".cache", "assets")
+
+# Set this to False to never read or write the cache.
+ENABLED = True
+
+# The header of every file: a magic string, the width and height of the image, the format of the pixels, whether the image has a
+# colorkey and the colorkey (RGBA).
+HEADER = struct.Struct("<4sII4s?4B")
+MAGIC = "mBAC"
+
+# Building the cache in parallel is only worth starting the processes if there are at least this many images to build.
+MIN_PARALLEL_BUILD = 8
+
+# The hashes of the source files, stored with the path as key, so we only read every file once.
+FILE_HASHES = {}
+
+def get_file_hash(path):
+	# Returns the hash of the contents of the file at path.
+	if not path in FILE_HASHES:
+		FILE_HASHES[path] = hashlib.sha1(archive.read_file(path)).hexdigest()
+	return FILE_HASHES[path]
+
+def get_image_key(path, scale):
+	# Returns the key of the image at path scaled by scale.
+	return (get_file_hash(path), scale)
+
+def get_tint_key(source_key, color, blend_alpha, bgr):
+	# Returns the key of the image with the given key, colorized with the given color and options (see useful.colorize_image).
+	return source_key + ((tuple(color), blend_alpha, bgr),)
+
+def get_filename(key):
+	return os.path.join(CACHE_DIRECTORY, hashlib.sha1(repr((CACHE_VERSION, key))).hexdigest() + ".raw")
+
+def load(key):
+	# Returns the image with the given key from the cache, or None if it isn't there.
+	if not ENABLED:
+		return None
+
+	try:
+		with open(get_filename(key), "rb") as cache_file:
+			# We map the file copy-on-write, so that nothing we do with the surface can ever change the file.
+			data = mmap.mmap(cache_file.fileno(), 0, access = mmap.ACCESS_COPY)
+	except (IOError, OSError, ValueError):
+		return None
+
+	if len(data) < HEADER.size:
+		return None
+	header = HEADER.unpack_from(data)
+	magic, width, height, pixel_format, has_colorkey = header[:5]
+	pixel_format = pixel_format.strip()
+	if magic != MAGIC or len(data) != HEADER.size + width * height * len(pixel_format):
+		return None
+
+	# The surface uses the mapped pixels as they are. It keeps the mapping alive for as long as it needs it.
+	image = pygame.image.frombuffer(buffer(data, HEADER.size), (width, height), pixel_format)
+	if has_colorkey:
+		image.set_colorkey(header[5:])
+	return image
+
+def save(key, image):
+	# Stores image in the cache with the given key.
+	if not ENABLED:
+		return
+
+	if image.get_masks()[3] != 0:
+		pixel_format = "RGBA"
+	else:
+		pixel_format = "RGB"
+
+	colorkey = image.get_colorkey()
+	if colorkey is None:
+		header = HEADER.pack(MAGIC, image.get_width(), image.get_height(), pixel_format.ljust(4), False, 0, 0, 0, 0)
+	else:
+		header = HEADER.pack(MAGIC, image.get_width(), image.get_height(), pixel_format.ljust(4), True, *colorkey)
+
+	filename = get_filename(key)
+	try:
+		if not os.path.isdir(CACHE_DIRECTORY):
+			os.makedirs(CACHE_DIRECTORY)
+
+		# We write to a temporary file first and then rename it, so that nobody (another process building the cache, for example) ever
+		# sees a half-written file.
+		temporary_filename = "%s.%d.tmp" % (filename, os.getpid())
+		with open(temporary_filename, "wb") as cache_file:
+			cache_file.write(header)
+			cache_file.write(pygame.image.tostring(image, pixel_format))
+		os.rename(temporary_filename, filename)
+	except (IOError, OSError):
+		pass
+
+def load_image(path, scale):
+	# Returns the image at path, scaled by scale, from the cache, or None if it isn't there.
+	if not ENABLED:
+		return None
+	return load(get_image_key(path, scale))
+
+def save_image(path, scale, image):
+	# Stores the image at path, scaled by scale, in the cache.
+	if not ENABLED:
+		return
+	save(get_image_key(path, scale), image)
+
+def build(images):
+	# Loads, scales and stores every image in images (a list of (path, scale)) that isn't in the cache already. If there are enough of
+	# them, we do it in parallel. Returns the number of images built.
+	if not ENABLED:
+		return 0
+
+	jobs = [(path, scale) for path, scale in images if not os.path.exists(get_filename(get_image_key(path, scale)))]
+	if len(jobs) >= MIN_PARALLEL_BUILD and multiprocessing.cpu_count() > 1:
+		pool = multiprocessing.Pool()
+		try:
+			pool.map(build_image, jobs)
+		finally:
+			pool.close()
+			pool.join()
+	else:
+		for job in jobs:
+			build_image(job)
+
+	return len(jobs)
+
+def build_image(job):
+	# Loads and scales one image, and stores it in the cache. This runs in the processes started by build().
+	path, scale = job
+	image = pygame.image.load(archive.open_file(path), path)
+	if scale != 1:
+		image = pygame.transform.scale(image, (image.get_width() * scale, image.get_height() * scale))
+	save(get_image_key(path, scale), image)
@@ -0,0 +1,360 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import pygame
+from pygame.locals import *
+import collections
+import struct
+import time
+import multiprocessing.pool
+import other.archive as archive
+import other.assetcache as assetcache
+import other.tracer as tracer
+import settings.settings as settings
+
+"""
+
+This module loads the images and sounds used by the game. Every image is loaded once, scaled to the game scale once, and converted to
+the format of the display once, and every sound is loaded once. Assets loaded here are shared by everyone who asks for them, so they
+must NEVER be changed (copy them first if you want to draw on them, just like with the images from the tint cache).
+
+Nothing is loaded until it's actually used. The game objects declare the images and sounds they use as class attributes:
+
+	class Ball(pygame.sprite.Sprite):
+		image = assets.Image("res/ball/ball.png")
+		sound_effect = assets.Sound("res/sounds/ball.ogg")
+		width = image.width
+
+but the files are only loaded the first time Ball.image (or self.image, until something else is assigned to it) or Ball.sound_effect
+is used. That way, importing the game objects is cheap, and the splash screen shows up right away instead of after every asset in the
+game has been loaded. The size of an image is read from the header of the file, so image.width and image.height can be used while the
+class is defined without loading the whole image.
+
+Loading something in the middle of a round would make the game stutter, so the game calls prewarm() before a round starts, which loads
+everything that has been declared so far. get_image() and get_sound() can also be used directly, for assets that aren't class attributes.
+
+Most of the time it takes to load an asset is spent decoding the PNG or OGG, which SDL does without holding on to the GIL. So while the
+splash screen plays, start_loading() decodes everything declared on a few threads in the background, and finish_loading() waits for
+them to finish before the first screen that uses the assets (see Splash.on_exit). Only the decoding happens on the other threads, the
+decoded assets are stored (and converted) on the main thread. If an asset that is still being decoded is asked for, we simply wait for
+that one asset.
+
+Converting an image to the format of the display (with Surface.convert() or Surface.convert_alpha()) makes blitting it a LOT faster, since
+SDL doesn't have to convert every pixel on every single blit. Images can only be converted once the display mode has been set, so
+images loaded before that are converted by convert_all() right after the display mode is set (see display.create()). Images loaded after
+that are converted right away.
+
+Loaded and scaled images (and colorized ones, see TintCache) are also kept on disk (see assetcache), so that the next time the game
+starts they don't have to be decoded and scaled again.
+
+The time it takes to load every asset is stored in LOAD_TIMES, and print_stats() shows a summary, so that we can keep an eye on how long
+loading takes.
+
+Everything is read through the resource archive (see archive), so it's all read from res.pak if it has been built.
+
+Finally, check_format() tells us whether a surface is in the format of the display or not. In debug mode, the render batches use it to
+warn about anything blitted every frame that isn't (see RenderBatch.submit).
+
+"""
+
+# The settings we initialize the mixer with.
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 2048
+
+# Every image loaded so far, stored with (path, scale) as key.
+IMAGES = {}
+
+# Every sound loaded so far, stored with the path as key.
+SOUNDS = {}
+
+# The keys of the images that have been converted to the format of the display.
+CONVERTED = set()
+
+# The keys of the converted images, stored with the id of the image as key (see get_key).
+KEYS = {}
+
+# The keys of every image and sound that has been declared (with Image, Sound or Sounds), so that prewarm() knows what to load.
+DECLARED_IMAGES = set()
+DECLARED_SOUNDS = set()
+
+# The images and sounds being loaded in the background (see start_loading), stored with their key as key.
+PENDING = {}
+
+# The time (in seconds) it took to load every image and sound, with the key of the asset as key, in the order they were loaded.
+LOAD_TIMES = collections.OrderedDict()
+
+# The ids of the surfaces check_format() has already warned about, so that we only warn once per surface.
+WARNED = set()
+
+# A surface in the format convert_alpha() gives, created the first time check_format() needs it.
+ALPHA_FORMAT = None
+
+class Image(object):
+
+	def __init__(self, path, scale = None):
+		# The image at path, scaled by scale. If no scale is given, it's scaled to the game scale.
+		if scale is None:
+			scale = settings.GAME_SCALE
+		self.key = (path, scale)
+		declare_image(path, scale)
+
+		# The size of the (scaled) image is often used to work out other values, so we make it available right away.
+		self.width, self.height = get_image_size(path, scale)
+
+	def __get__(self, instance, owner):
+		image = IMAGES.get(self.key)
+		if image is None:
+			image = get_image(*self.key)
+		return image
+
+class Sound(object):
+
+	def __init__(self, path):
+		# The sound at path.
+		self.path = path
+		declare_sound(path)
+
+	def __get__(self, instance, owner):
+		sound = SOUNDS.get(self.path)
+		if sound is None:
+			sound = get_sound(self.path)
+		return sound
+
+class Sounds(object):
+
+	def __init__(self, paths):
+		# A list of the sounds at the given paths, for when one of them is picked at random.
+		self.paths = paths
+		for path in paths:
+			declare_sound(path)
+
+		# The list of sounds, created the first time it's used.
+		self.sounds = None
+
+	def __get__(self, instance, owner):
+		if self.sounds is None:
+			self.sounds = [get_sound(path) for path in self.paths]
+		return self.sounds
+
+def declare_image(path, scale = None):
+	# Lets us know that the image at path, scaled by scale (or the game scale), is going to be used, so that it's loaded along with
+	# everything else (see start_loading and prewarm). Image does this for you.
+	if scale is None:
+		scale = settings.GAME_SCALE
+	DECLARED_IMAGES.add((path, scale))
+
+def declare_sound(path):
+	# Just like declare_image, but for sounds.
+	DECLARED_SOUNDS.add(path)
+
+def get_image(path, scale = None):
+	# Returns the image at path, scaled by scale (or to the game scale, if no scale is given). The image is only loaded the first time.
+	if scale is None:
+		scale = settings.GAME_SCALE
+	key = (path, scale)
+
+	if key in PENDING:
+		collect(key)
+
+	if not key in IMAGES:
+		image, load_time = load_image_file(path, scale)
+		store_image(key, image, load_time)
+
+	return IMAGES[key]
+
+def load_image_file(path, scale):
+	# Loads and scales the image at path, and returns it along with the time it took. This is run on the loader threads as well, so it
+	# must not touch anything but the disk cache.
+	start_time = time.time()
+
+	# If we've loaded and scaled the image before (in this run of the game or an earlier one), we can skip straight to converting.
+	image = assetcache.load_image(path, scale)
+	if image is None:
+		image = pygame.image.load(archive.open_file(path), path)
+		if scale != 1:
+			image = pygame.transform.scale(image, (image.get_width() * scale, image.get_height() * scale))
+		assetcache.save_image(path, scale, image)
+
+	end_time = time.time()
+	tracer.add_span(path, "assets", start_time, end_time)
+	return image, end_time - start_time
+
+def store_image(key, image, load_time):
+	# Stores a loaded image. If the display mode has already been set, we might as well convert it right away.
+	start_time = time.time()
+
+	IMAGES[key] = image
+	if not pygame.display.get_surface() is None:
+		convert_image(key)
+
+	LOAD_TIMES[key] = load_time + time.time() - start_time
+
+def get_key(image):
+	# Returns the (path, scale) of the given image if it was loaded (and converted) here, otherwise None.
+	return KEYS.get(id(image))
+
+def get_image_size(path, scale = None):
+	# Returns the size the image at path will have once it's loaded and scaled by scale (or the game scale). We read the size from the
+	# header of the file if it's a PNG (which all our images are), since that's a lot quicker than loading the image.
+	if scale is None:
+		scale = settings.GAME_SCALE
+
+	if (path, scale) in IMAGES:
+		return IMAGES[(path, scale)].get_size()
+
+	image_file = archive.open_file(path)
+	header = image_file.read(24)
+	image_file.close()
+	if header[:8] == "\x89PNG\r\n\x1a\n" and header[12:16] == "IHDR":
+		width, height = struct.unpack(">II", header[16:24])
+	else:
+		width, height = pygame.image.load(archive.open_file(path), path).get_size()
+
+	return (width * scale, height * scale)
+
+def get_sound(path):
+	# Returns the sound at path. The sound is only loaded the first time.
+	if path in PENDING:
+		collect(path)
+
+	if not path in SOUNDS:
+		init_mixer()
+		SOUNDS[path], LOAD_TIMES[path] = load_sound_file(path)
+
+	return SOUNDS[path]
+
+def load_sound_file(path):
+	# Loads the sound at path, and returns it along with the time it took. This is run on the loader threads as well.
+	start_time = time.time()
+	sound = pygame.mixer.Sound(archive.open_file(path))
+
+	end_time = time.time()
+	tracer.add_span(path, "assets", start_time, end_time)
+	return sound, end_time - start_time
+
+def pre_init_mixer():
+	# Makes sure the mixer uses our settings when pygame.init() initializes it. Call this before pygame.init().
+	pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
+
+def init_mixer():
+	# Initializes the mixer, unless that has already been done (sounds can't be loaded before it is).
+	if pygame.mixer.get_init() is None:
+		pygame.mixer.init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
+
+def start_loading(threads = None):
+	# Starts loading every image and sound that has been declared (and isn't loaded yet) in the background, on the given number of
+	# threads (or one per CPU). Returns the number of assets that will be loaded. Call finish_loading() before they're needed.
+	keys = [key for key in DECLARED_IMAGES if not key in IMAGES and not key in PENDING]
+	paths = [path for path in DECLARED_SOUNDS if not path in SOUNDS and not path in PENDING]
+	if len(keys) + len(paths) == 0:
+		return 0
+
+	# The mixer can't be initialized from the loader threads, so we do it here.
+	if len(paths) > 0:
+		init_mixer()
+
+	pool = multiprocessing.pool.ThreadPool(threads)
+	for key in keys:
+		PENDING[key] = pool.apply_async(load_image_file, key)
+	for path in paths:
+		PENDING[path] = pool.apply_async(load_sound_file, (path,))
+
+	# That's all the threads are going to do, so they can quit once they're done.
+	pool.close()
+
+	return len(keys) + len(paths)
+
+def collect(key):
+	# Waits for the image or sound with the given key to be loaded in the background, and stores it.
+	asset, load_time = PENDING.pop(key).get()
+	if isinstance(key, tuple):
+		store_image(key, asset, load_time)
+	else:
+		SOUNDS[key] = asset
+		LOAD_TIMES[key] = load_time
+
+def finish_loading():
+	# Waits for everything started by start_loading() to be loaded, and returns the time we had to wait (in seconds).
+	start_time = time.time()
+
+	for key in PENDING.keys():
+		collect(key)
+
+	return time.time() - start_time
+
+def prewarm():
+	# Loads every image and sound that has been declared but not loaded yet, and returns the time it took (in seconds).
+	start_time = time.time()
+
+	# Anything still loading in the background is finished first, so that it isn't loaded twice.
+	finish_loading()
+
+	# Images that aren't in the disk cache yet (the first time the game runs) are loaded and scaled into the cache in parallel first.
+	assetcache.build([key for key in DECLARED_IMAGES if not key in IMAGES])
+
+	for path, scale in DECLARED_IMAGES:
+		get_image(path, scale)
+	for path in DECLARED_SOUNDS:
+		get_sound(path)
+
+	return time.time() - start_time
+
+def print_stats(amount = 10):
+	# Prints how many assets have been loaded, how long that took in total, and which ones took the longest.
+	print("Loaded %d images and %d sounds in %.1f ms" % (len(IMAGES), len(SOUNDS), sum(LOAD_TIMES.itervalues()) * 1000))
+	for key, load_time in sorted(LOAD_TIMES.iteritems(), key = lambda item: item[1], reverse = True)[:amount]:
+		print("    %6.2f ms  %s" % (load_time * 1000, key))
+
+def convert_image(key):
+	# Converts the image with the given key to the format of the display, unless that has already been done.
+	if key in CONVERTED:
+		return
+
+	IMAGES[key] = convert(IMAGES[key])
+	CONVERTED.add(key)
+	KEYS[id(IMAGES[key])] = key
+
+def convert_all():
+	# Converts every image that hasn't been converted yet. Call this once the display mode has been set.
+	for key in IMAGES.keys():
+		convert_image(key)
+
+def convert(surface):
+	# Returns a copy of surface in the format of the display. Images with an alpha channel keep it, the others are converted without one
+	# (since blitting an image without alpha is even faster).
+	if has_alpha_channel(surface):
+		return surface.convert_alpha()
+	else:
+		return surface.convert()
+
+def check_format(surface):
+	# Returns True if surface is in the format of the display (or the format convert_alpha() would give it), otherwise False. The first
+	# time a surface that isn't is checked, we print a warning.
+	display_surface = pygame.display.get_surface()
+	if display_surface is None:
+		return True
+
+	if has_alpha_channel(surface):
+		# Images with alpha are converted to the pixel format of the display, but with an alpha channel added. We don't have anything
+		# around with that format, so we make a tiny surface to compare with (once).
+		global ALPHA_FORMAT
+		if ALPHA_FORMAT is None:
+			ALPHA_FORMAT = pygame.Surface((1, 1), SRCALPHA).convert_alpha()
+		format_surface = ALPHA_FORMAT
+	else:
+		format_surface = display_surface
+
+	if surface.get_bitsize() == format_surface.get_bitsize() and surface.get_masks() == format_surface.get_masks():
+		return True
+
+	if not id(surface) in WARNED:
+		WARNED.add(id(surface))
+		print("Blitting a surface that isn't in the display format (%d bits, masks %s): %s" % (surface.get_bitsize(), surface.get_masks(), surface))
+	return False
+
+def has_alpha_channel(surface):
+	# Returns True if surface has an alpha value for every pixel. We can't simply look for the SRCALPHA flag, since SDL sets that one on
+	# surfaces that have been given an alpha value for the whole surface (with set_alpha) as well.
+	return surface.get_masks()[3] != 0
@@ -0,0 +1,130 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import os
+import time
+import cProfile
+
+"""
+
+This module profiles the game with cProfile, and writes the result to a .pstats file in CAPTURE_DIRECTORY. The file can be looked at
+with the pstats module (python -m pstats <file>), or with a viewer like SnakeViz.
+
+There are two ways to start a capture:
+
+	* Start the game with "python mBreak.py --profile". Everything from the very first import (before pygame and the settings are
+	  loaded) until the first match is over is profiled.
+	* Press C in the game (in debug mode, see debug.event). The next Capture.frames frames of the running scene are profiled, and the
+	  file is named after the scene. Press it again to stop early.
+
+The time spent waiting for the next frame in clock.tick() isn't profiled (see Scene.step), since it would just hide the real work
+under a lot of sleeping. cProfile forgets which functions were running whenever it's paused, though, so the functions that were running
+at the time (like Scene.step and everything that called it) don't get their cumulative time right. Everything they call after the
+pause does.
+
+"""
+
+# The folder the captures are written to.
+CAPTURE_DIRECTORY = "metrics"
+
+class Capture():
+
+	# Standard values. The number of frames captured when no other number is given.
+	frames = 300
+
+	def __init__(self):
+		# The profile that is running, or None if we're not capturing.
+		self.profile = None
+
+		# What we're capturing (the file is named after it), and the number of frames left to capture (None if there's no limit).
+		self.name = None
+		self.frames_left = None
+
+	def is_running(self):
+		return not self.profile is None
+
+	def start(self, name, frames = None):
+		# Starts capturing. If frames is None, we keep on capturing until stop() (or match_over()) is called.
+		if self.is_running():
+			return
+
+		self.name = name
+		self.frames_left = frames
+		self.profile = cProfile.Profile()
+		self.profile.enable()
+
+	def stop(self):
+		# Stops capturing and writes the file. Returns the name of the file, or None if we weren't capturing.
+		if not self.is_running():
+			return None
+
+		self.profile.disable()
+		filename = os.path.join(CAPTURE_DIRECTORY, "%s-%s.pstats" % (self.name, time.strftime("%Y%m%d-%H%M%S")))
+		try:
+			if not os.path.isdir(CAPTURE_DIRECTORY):
+				os.makedirs(CAPTURE_DIRECTORY)
+			self.profile.dump_stats(filename)
+			print("Wrote the profile of " + self.name + " to " + filename + ".")
+		except (IOError, OSError):
+			print("Couldn't write the profile to " + filename + ".")
+			filename = None
+
+		self.profile = None
+		return filename
+
+	def toggle(self, name, frames = None):
+		# Starts capturing the given number of frames (or Capture.frames), or stops if we're already capturing.
+		if self.is_running():
+			self.stop()
+		else:
+			if frames is None:
+				frames = Capture.frames
+			self.start(name, frames)
+
+	def begin_frame(self):
+		# Counts down the frames left to capture, and stops once there are none left. Call this at the very start of every frame.
+		if not self.is_running() or self.frames_left is None:
+			return
+
+		if self.frames_left <= 0:
+			self.stop()
+		else:
+			self.frames_left -= 1
+
+	def pause(self):
+		# Stops profiling for a while, without ending the capture.
+		if self.is_running():
+			self.profile.disable()
+
+	def resume(self):
+		if self.is_running():
+			self.profile.enable()
+
+	def match_over(self):
+		# A capture without a limit (like the one started with --profile) ends when the first match is over.
+		if self.is_running() and self.frames_left is None:
+			self.stop()
+
+# The capture used by the whole game.
+CAPTURE = Capture()
+
+def start(name, frames = None):
+	CAPTURE.start(name, frames)
+
+def stop():
+	return CAPTURE.stop()
+
+def toggle(name, frames = None):
+	CAPTURE.toggle(name, frames)
+
+def begin_frame():
+	CAPTURE.begin_frame()
+
+def pause():
+	CAPTURE.pause()
+
+def resume():
+	CAPTURE.resume()
+
+def match_over():
+	CAPTURE.match_over()
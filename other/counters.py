@@ -0,0 +1,126 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import os
+import csv
+import json
+import time
+import settings.settings as settings
+
+"""
+
+This module counts how often the expensive things in the game happen, like how many collision checks the balls make, how many
+particles and shadows are created and killed, how many images are colorized (and how many pixels that is), how many flash surfaces are
+created and how many sounds are played. Where the profiler (see profiler) tells us how long things take, this tells us how many of
+them there were, which is what we need to explain a slow frame, or to compare two versions of the game.
+
+The game code simply calls add() with the name of a counter wherever something we want to count happens. Every update of the game
+is a frame (see Game.update), and for every round we keep the total, the average per frame and the most in a single frame for every
+counter. When a round is over (see Game.finish_round), the numbers for every round of the match so far are written to METRICS_DIRECTORY,
+both as JSON and as CSV (one row per round and counter), so they're easy to compare or load into a spreadsheet.
+
+Counting is only done when settings.COUNTERS is True (set "counters 1" in settings.txt, or run the headless mode with --counters).
+Otherwise every function in here returns right away, so the calls can be left in the game.
+
+"""
+
+# The folder the counters are written to.
+METRICS_DIRECTORY = "metrics"
+
+class Counters():
+
+	def __init__(self):
+		# The counts of the current frame, with the name of the counter as key.
+		self.frame = {}
+
+		# The number of frames in the current round, and the total and the highest count in a single frame of every counter so far.
+		self.frames = 0
+		self.totals = {}
+		self.maximums = {}
+
+		# The numbers of every round of the match so far (see get_round).
+		self.rounds = []
+
+		# The name of the files the current match is written to, without the extension. We pick one when the first round is done.
+		self.filename = None
+
+	def add(self, name, amount = 1):
+		self.frame[name] = self.frame.get(name, 0) + amount
+
+	def end_frame(self):
+		# Adds the counts of the current frame to the round, and starts a new frame.
+		for name, count in self.frame.iteritems():
+			self.totals[name] = self.totals.get(name, 0) + count
+			if count > self.maximums.get(name, 0):
+				self.maximums[name] = count
+		self.frame = {}
+		self.frames += 1
+
+	def get_round(self):
+		# Returns the numbers of the current round: the number of frames, and the total, average per frame and most in a single frame
+		# of every counter.
+		counters = {}
+		for name, total in self.totals.iteritems():
+			counters[name] = {"total": total, "mean": float(total) / max(self.frames, 1), "max": self.maximums[name]}
+		return {"round": len(self.rounds) + 1, "frames": self.frames, "counters": counters}
+
+	def finish_round(self):
+		# Ends the current round and writes every round of the match so far. Whatever was counted after the last frame (while cleaning
+		# up after the round, for example) is added to the totals, but doesn't count as a frame of its own.
+		for name, count in self.frame.iteritems():
+			self.totals[name] = self.totals.get(name, 0) + count
+			self.maximums[name] = max(self.maximums.get(name, 0), count)
+		self.rounds.append(self.get_round())
+
+		self.frame = {}
+		self.frames = 0
+		self.totals = {}
+		self.maximums = {}
+
+		self.export()
+
+	def export(self):
+		# Writes every round of the match so far to METRICS_DIRECTORY, as JSON and as CSV. The files are overwritten after every round,
+		# so that a match that is quit halfway still leaves the rounds that were played.
+		if self.filename is None:
+			self.filename = os.path.join(METRICS_DIRECTORY, time.strftime("counters-%Y%m%d-%H%M%S"))
+
+		try:
+			if not os.path.isdir(METRICS_DIRECTORY):
+				os.makedirs(METRICS_DIRECTORY)
+
+			with open(self.filename + ".json", "w") as json_file:
+				json.dump({"version": settings.GAME_VERSION, "rounds": self.rounds}, json_file, indent = 4, sort_keys = True)
+
+			with open(self.filename + ".csv", "wb") as csv_file:
+				writer = csv.writer(csv_file)
+				writer.writerow(["round", "frames", "counter", "total", "mean", "max"])
+				for round_numbers in self.rounds:
+					for name, numbers in sorted(round_numbers["counters"].iteritems()):
+						writer.writerow([round_numbers["round"], round_numbers["frames"], name, numbers["total"], "%.3f" % numbers["mean"], numbers["max"]])
+		except (IOError, OSError):
+			# The numbers are nice to have, but they're not worth crashing the game over.
+			print("Couldn't write the counters to " + self.filename + ".")
+
+	def reset(self):
+		# Forgets everything counted so far, and starts a new match (that is written to new files).
+		self.__init__()
+
+# The counters used by the whole game.
+COUNTERS = Counters()
+
+def add(name, amount = 1):
+	if settings.COUNTERS:
+		COUNTERS.add(name, amount)
+
+def end_frame():
+	if settings.COUNTERS:
+		COUNTERS.end_frame()
+
+def finish_round():
+	if settings.COUNTERS:
+		COUNTERS.finish_round()
+
+def reset():
+	if settings.COUNTERS:
+		COUNTERS.reset()
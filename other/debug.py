@@ -16,17 +16,22 @@ import objects.powerups.enlarger as enlarger
 import objects.powerups.reducer as reducer
 import objects.ball as ball
 import objects.groups as groups
+import other.capture as capture
 import settings.settings as settings
+import other.profiler as profiler
+import other.render as render
 
 """
 
 This module contains a few useful methods used when debugging the game. These are by default only called when DEBUG_MODE is True.
 
-It also contains a debug class used to display the FPS counter in the top-left corner of the screen, when DEBUG_MODE is True.
+It also contains a debug class used to display the FPS counter in the top-left corner of the screen, when DEBUG_MODE is True. Below the
+FPS counter, it shows how long a frame takes, which phases of the frame take the most time (see profiler) and how many particles,
+shadows, traces, effects and projectiles there are.
 
 """
 
-def event(event, main_clock):
+def event(event, main_clock, scene):
 	if event.type == MOUSEBUTTONDOWN:
 		if event.button == 1:
 			create_ball_at_pos(event.pos)
@@ -48,6 +53,9 @@ def event(event, main_clock):
 		for player in groups.Groups.player_group:
 			destroy_blocks_for_player(player)
 			break
+	elif event.type == KEYDOWN and event.key == K_c:
+		# The C button profiles the next few frames of the scene with cProfile (see capture), or stops if we're already profiling.
+		capture.toggle(scene.__class__.__name__)
 
 def create_ball_at_pos(pos):
 	return ball.Ball(pos[0], pos[1], random.uniform(0, math.pi), list(groups.Groups.player_group)[random.randint(0, len(groups.Groups.player_group) - 1)])
@@ -107,8 +115,75 @@ class Debug:
 	x = font_size
 	y = font_size
 
+	# Everything below the FPS counter is written in a smaller font, so that it doesn't cover the whole game.
+	small_font_size = 6 * settings.GAME_SCALE
+	small_font = pygame.font.Font(settings.DEBUG_FONT, small_font_size)
+
+	# The number of phases shown, the slowest ones first.
+	phase_amount = 8
+
+	# Rendering text takes a good part of a frame, and would show up in the very numbers we display. So every character is only
+	# rendered once (for every font and color), and stored in glyphs with (font, color, character) as key. The text is then written
+	# by blitting one glyph after another.
+	glyphs = {}
+
+	# The text changes too fast to read anyway, so it's only updated every refresh_interval milliseconds. In between, we simply blit
+	# the glyphs of the last text again (sequence is the list of blits, see render.blit_sequence).
+	refresh_interval = 250
+	last_refresh = None
+	sequence = []
+
+	@staticmethod
+	def get_text(main_clock):
+		# Returns the lines of text to show: the FPS, the frame time, the slowest phases and the number of entities.
+		text = []
+		text.append(str(int(main_clock.get_fps())))
+		text.append("%5.1f ms  frame" % profiler.PROFILER.get_frame_time())
+
+		breakdown = sorted(profiler.PROFILER.get_breakdown(), key = lambda item: item[1], reverse = True)
+		for phase, phase_time in breakdown[:Debug.phase_amount]:
+			text.append("%5.1f ms  %s" % (phase_time, phase))
+
+		text.append("particles: %d  shadows: %d  traces: %d" % (len(groups.Groups.particle_system), len(groups.Groups.shadow_group), len(groups.Groups.trace_group)))
+		text.append("effects: %d  projectiles: %d" % (len(groups.Groups.effect_group), len(groups.Groups.projectile_group)))
+		return text
+
+	@staticmethod
+	def get_glyph(font, color, character):
+		# Returns the given character rendered in the given font and color, rendering it the first time it's asked for.
+		key = (font, tuple(color), character)
+		glyph = Debug.glyphs.get(key)
+		if glyph is None:
+			glyph = font.render(character, False, color)
+			Debug.glyphs[key] = glyph
+		return glyph
+
+	@staticmethod
+	def add_text(sequence, font, color, text, x, y):
+		# Adds the blits that write text at x, y in the given font and color to sequence.
+		for character in text:
+			glyph = Debug.get_glyph(font, color, character)
+			sequence.append((glyph, (x, y)))
+			x += glyph.get_width()
+
 	@staticmethod
 	def display(surface, main_clock):
-		# Display the current FPS.
-		surface.blit(Debug.font.render(str(int(main_clock.get_fps())), False, Debug.shadow_color), (Debug.x + Debug.shadow_offset_x, Debug.y + Debug.shadow_offset_y))
-		surface.blit(Debug.font.render(str(int(main_clock.get_fps())), False, Debug.font_color), (Debug.x, Debug.y))
+		# Render the lines again, if it's time to.
+		now = pygame.time.get_ticks()
+		if Debug.last_refresh is None or now - Debug.last_refresh >= Debug.refresh_interval:
+			Debug.last_refresh = now
+
+			# Every line is written with its shadow below it. The first line (the FPS) is written in the big font.
+			shadows = []
+			lines = []
+			font = Debug.font
+			y = Debug.y
+			for line in Debug.get_text(main_clock):
+				Debug.add_text(shadows, font, Debug.shadow_color, line, Debug.x + Debug.shadow_offset_x, y + Debug.shadow_offset_y)
+				Debug.add_text(lines, font, Debug.font_color, line, Debug.x, y)
+				y += font.get_height()
+				font = Debug.small_font
+			Debug.sequence = shadows + lines
+
+		# Display the text.
+		render.blit_sequence(surface, Debug.sequence)
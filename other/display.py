@@ -0,0 +1,104 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import pygame
+import other.assets as assets
+import settings.settings as settings
+
+"""
+
+This module takes care of the window. Normally, the game is drawn straight to the window. But if settings.WINDOW_SCALE isn't 1 (see
+settings.set_game_scale()), the game is drawn to a smaller surface at its own resolution instead, and that surface is scaled up to fill
+the window once every frame, right before the window is updated. If the window isn't an exact multiple of the game (see
+settings.WINDOW_SIZE), the game is centered in the window, and the few pixels left over around it stay black.
+
+The scenes never have to care about this, they simply draw to the surface returned by create() and call update() at the end of every
+frame. The only thing that's different is the position of the mouse, so convert_event() moves the mouse position in mouse events from
+the window to the surface that the game is drawn to.
+
+update() can also be given a list of rects (dirty rects), in which case only those parts of the window are scaled and shown. This is a
+lot cheaper than showing the whole window when only a few things on the screen have changed, like in a menu.
+
+"""
+
+# The actual window, and the surface that the game is drawn to (which is the same surface as the window if WINDOW_SCALE is 1).
+WINDOW = None
+SURFACE = None
+
+# The part of the window that the game is scaled up to.
+GAME_RECT = None
+
+def create(flags = 0):
+	# Creates the window and returns the surface that the game should be drawn to.
+	global WINDOW
+	global SURFACE
+	global GAME_RECT
+
+	WINDOW = pygame.display.set_mode(settings.get_window_size(), flags)
+	GAME_RECT = pygame.Rect(0, 0, settings.SCREEN_WIDTH * settings.WINDOW_SCALE, settings.SCREEN_HEIGHT * settings.WINDOW_SCALE)
+	GAME_RECT.center = WINDOW.get_rect().center
+	if settings.WINDOW_SCALE == 1 and GAME_RECT == WINDOW.get_rect():
+		SURFACE = WINDOW
+	else:
+		SURFACE = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)).convert()
+		WINDOW.fill((0, 0, 0))
+
+	# Now that we know the format of the display, every image loaded so far can be converted to it.
+	assets.convert_all()
+
+	return SURFACE
+
+def update(rects = None):
+	# Scales the game up to the window (if needed) and shows it. If rects is given, only those parts of the game are updated. If the
+	# window wasn't created by create() (like in the headless mode), we don't know where the game is drawn, so we update all of it.
+	if rects is None or SURFACE is None:
+		if not SURFACE is WINDOW:
+			pygame.transform.scale(SURFACE, GAME_RECT.size, WINDOW.subsurface(GAME_RECT))
+		pygame.display.update()
+		return
+
+	# Rects partly outside the surface can't be scaled, so we clip them first and throw away the ones that end up empty.
+	surface_rect = SURFACE.get_rect()
+	rects = [surface_rect.clip(rect) for rect in rects]
+	rects = [rect for rect in rects if rect.width > 0 and rect.height > 0]
+
+	if not SURFACE is WINDOW:
+		# We scale every rect up to the window on its own, and update the scaled rects instead.
+		window_rects = []
+		for rect in rects:
+			window_rect = pygame.Rect(GAME_RECT.x + rect.x * settings.WINDOW_SCALE, GAME_RECT.y + rect.y * settings.WINDOW_SCALE,
+										rect.width * settings.WINDOW_SCALE, rect.height * settings.WINDOW_SCALE)
+			pygame.transform.scale(SURFACE.subsurface(rect), window_rect.size, WINDOW.subsurface(window_rect))
+			window_rects.append(window_rect)
+		rects = window_rects
+
+	pygame.display.update(rects)
+
+def merge_rects(rects):
+	# Returns a list of rects covering the same area as the given rects, where every group of overlapping rects has been merged into a
+	# single rect. This way, we don't update the same part of the window more than once.
+	merged = []
+	for rect in rects:
+		rect = pygame.Rect(rect)
+		# Keep merging until the rect doesn't overlap any of the merged rects, since growing it can make it overlap new ones.
+		index = rect.collidelist(merged)
+		while index != -1:
+			rect.union_ip(merged.pop(index))
+			index = rect.collidelist(merged)
+		merged.append(rect)
+	return merged
+
+def convert_event(event):
+	# Returns the event with any mouse positions moved from the window to the surface the game is drawn to.
+	if SURFACE is WINDOW or not hasattr(event, "pos"):
+		return event
+
+	attributes = dict(event.dict)
+	attributes["pos"] = window_to_surface(event.pos)
+	if "rel" in attributes:
+		# The relative movement doesn't care where the game is in the window, it only has to be scaled.
+		attributes["rel"] = (int(event.rel[0] / settings.WINDOW_SCALE), int(event.rel[1] / settings.WINDOW_SCALE))
+	return pygame.event.Event(event.type, attributes)
+
+def window_to_surface(position):
+	return (int((position[0] - GAME_RECT.x) / settings.WINDOW_SCALE), int((position[1] - GAME_RECT.y) / settings.WINDOW_SCALE))
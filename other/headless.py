@@ -0,0 +1,287 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import os
+import random
+import argparse
+import itertools
+import pygame
+import other.assets as assets
+import other.tracer as tracer
+import objects.camera as camera
+import objects.gameclock as gameclock
+import settings.settings as settings
+
+"""
+
+This module runs the game without a window, without sound and without any player input. It's meant for letting the AI play against
+itself as fast as the computer allows, for example to tune the AI or to try out gameplay changes over a lot of rounds.
+
+Call simulate() to play a match, which returns the winner, the score and some stats for every round. It calls setup() itself, which
+replaces the window with an offscreen surface and the mixer with one that doesn't play anything.
+
+Given the same seed, simulate() plays the same match every time, so that two versions of the game (or of the AI) can be compared. For
+that, the game must never use the real time for anything that affects the game (everything is timed by the SimulatedClock), and the
+order the sprites in a group are updated in must not change from one run to the next (see install_ordered_sprites).
+
+It can also be run directly with "python -m other.headless", which plays a match and prints the result.
+
+"""
+
+def setup():
+	# We don't want a window, so we use the dummy video driver.
+	os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+	# We don't want any sound either, so we replace the mixer with one that doesn't do anything.
+	install_stub_mixer()
+
+	# The sprites in a group have to be updated in the same order every time a match is played.
+	install_ordered_sprites()
+
+	pygame.init()
+
+	# A display mode has to be set for Surface.convert() to work, even if we never look at it.
+	pygame.display.set_mode((1, 1), 0, 32)
+	assets.convert_all()
+
+	# Tell the game that it's running headless, and disable the debug keys (there's nobody there to press them anyway).
+	settings.HEADLESS = True
+	settings.DEBUG_MODE = False
+
+	# Initialize the camera.
+	camera.create_camera(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+
+	# Everything is drawn to this surface instead of the window.
+	return pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), 0, 32)
+
+def install_stub_mixer():
+	# Replaces the parts of the mixer that the game uses, so that no audio device is needed.
+	pygame.mixer.init = stub_mixer_init
+	pygame.mixer.pre_init = stub_mixer_init
+	pygame.mixer.get_init = stub_mixer_get_init
+	pygame.mixer.Sound = StubSound
+	pygame.mixer.music = StubMusic()
+
+def stub_mixer_init(*args, **kwargs):
+	pass
+
+def stub_mixer_get_init():
+	return (44100, -16, 2)
+
+def install_ordered_sprites():
+	# A group keeps its sprites in a dictionary, so they're updated (and collided with, and so on) in the order of their hashes. By
+	# default, the hash of a sprite is its address in memory, which changes every time the game is run, and since the AI players draw
+	# random numbers as they're updated, the same seed would give a different match every time. So every sprite is given a number the
+	# first time it's hashed (when it's first added to a group), and that's its hash instead. This is a little slower than the default,
+	# which is why only the headless mode does it.
+	global SPRITE_NUMBERS
+	pygame.sprite.Sprite.__hash__ = get_sprite_hash
+
+	# Every match starts counting from the start, so that it doesn't matter how many matches were played before it.
+	SPRITE_NUMBERS = itertools.count()
+
+# The number given to the next sprite that's hashed (see install_ordered_sprites).
+SPRITE_NUMBERS = itertools.count()
+
+def get_sprite_hash(sprite):
+	number = sprite.__dict__.get("sprite_number")
+	if number is None:
+		number = sprite.__dict__["sprite_number"] = next(SPRITE_NUMBERS)
+	return number
+
+def simulate(player_one_color, player_two_color, number_of_rounds = 1, player_one_ai = 2, player_two_ai = 2, max_frames = 60 * 60 * 10, seed = None, render = False):
+	# Plays a whole match between two AI players and returns the result. A round that hasn't ended after max_frames frames is counted
+	# as a draw. Drawing takes most of the time, so the game is only drawn (to an offscreen surface) if render is True.
+
+	window_surface = setup()
+	main_clock = SimulatedClock()
+
+	# These have to be imported after setup() has been called, so we import them here.
+	import objects.groups as groups
+	import objects.player as player
+	import objects.powerups.powerup as powerup
+	import screens.game as game
+
+	if not seed is None:
+		random.seed(seed)
+
+	# Create the players the same way the prepare menu does.
+	player_one = player.Player(powerup.Powerup.width / 2, powerup.Powerup.height / 2, settings.PLAYER_ONE_NAME,
+								settings.PLAYER_ONE_KEY_UP, settings.PLAYER_ONE_KEY_DOWN, settings.PLAYER_ONE_KEY_UNLEASH_ENERGY,
+								settings.PLAYER_ONE_JOY_UNLEASH_ENERGY, None, player_one_color, player_one_ai)
+	player_two = player.Player(settings.SCREEN_WIDTH - (powerup.Powerup.width / 2) - powerup.Powerup.width,
+								settings.SCREEN_HEIGHT - (powerup.Powerup.height / 2) - powerup.Powerup.height, settings.PLAYER_TWO_NAME,
+								settings.PLAYER_TWO_KEY_UP, settings.PLAYER_TWO_KEY_DOWN, settings.PLAYER_TWO_KEY_UNLEASH_ENERGY,
+								settings.PLAYER_TWO_JOY_UNLEASH_ENERGY, None, player_two_color, player_two_ai)
+
+	score = {}
+	score[player_one] = 0
+	score[player_two] = 0
+
+	rounds = []
+	number_of_rounds_done = 0
+	match_over = False
+	while not match_over:
+		a_game = game.Game(window_surface, main_clock, player_one, player_two, number_of_rounds, score, number_of_rounds_done)
+
+		# Step the game until it's done, or until we give up on it.
+		frames = 0
+		while not a_game.done and frames < max_frames:
+			a_game.step(render)
+			frames += 1
+
+		# If nobody won, it's a draw.
+		if not a_game.game_over:
+			a_game.winner = None
+
+		# Store the stats for this round before the groups are emptied.
+		round_stats = {}
+		round_stats["winner"] = None if a_game.winner is None else a_game.winner.name
+		round_stats["frames"] = frames
+		round_stats["time"] = main_clock.time_passed / 1000.0
+		round_stats["blocks_left"] = {player_one.name: len(player_one.block_group), player_two.name: len(player_two.block_group)}
+		rounds.append(round_stats)
+
+		# Restore the time scale, just as the game does when it exits.
+		main_clock.time_scale = main_clock.default_time_scale
+		main_clock.time_passed = 0
+
+		match_over = a_game.finish_round()
+		number_of_rounds_done = a_game.number_of_rounds_done
+
+		# There's no scene manager here to write the timeline when a scene ends (see tracer), so we do it after every round.
+		tracer.flush()
+
+	# The player with the highest score wins the match. If the score is even, nobody wins.
+	if score[player_one] > score[player_two]:
+		winner = player_one.name
+	elif score[player_two] > score[player_one]:
+		winner = player_two.name
+	else:
+		winner = None
+
+	# Empty all the groups, so that another match can be simulated afterwards. An emptied group keeps its dictionary as it was (with
+	# room for every sprite it ever had), which would make the next match update its sprites in another order than this one did, so the
+	# groups get new dictionaries as well.
+	groups.empty_all()
+	for group in vars(groups.Groups).itervalues():
+		if isinstance(group, pygame.sprite.AbstractGroup):
+			group.spritedict = {}
+
+	result = {}
+	result["winner"] = winner
+	result["score"] = {player_one.name: score[player_one], player_two.name: score[player_two]}
+	result["rounds"] = rounds
+	return result
+
+class SimulatedClock(gameclock.GameClock):
+
+	"""
+
+	A clock that doesn't care about the real time. Every tick moves the time forward by exactly one frame, so the game can run as fast
+	as possible while still playing exactly as it would at the given framerate.
+
+	"""
+
+	def __init__(self, framerate = settings.GAME_FPS):
+		gameclock.GameClock.__init__(self)
+
+		# The length of a single frame, in milliseconds.
+		self.frame_length = 1000.0 / framerate
+
+		# The amount of (scaled) time that has passed since this was last reset, in milliseconds.
+		self.time_passed = 0
+
+	def tick(self, framerate = 0):
+		delta_time_ms = self.advance(self.frame_length)
+		self.time_passed += delta_time_ms
+		return delta_time_ms
+
+	def tick_busy_loop(self, framerate = 0):
+		return self.tick(framerate)
+
+	def get_rawtime(self):
+		return self.frame_length * self.time_scale
+
+	def get_fps(self):
+		return 1000.0 / self.frame_length
+
+class StubSound:
+
+	# Stands in for pygame.mixer.Sound. Playing it never gives us a channel, which the game already handles.
+
+	def __init__(self, *args, **kwargs):
+		pass
+
+	def play(self, *args, **kwargs):
+		return None
+
+	def stop(self):
+		pass
+
+	def fadeout(self, time):
+		pass
+
+	def set_volume(self, value):
+		pass
+
+	def get_volume(self):
+		return 0.0
+
+	def get_length(self):
+		return 0.0
+
+class StubMusic:
+
+	# Stands in for pygame.mixer.music.
+
+	def load(self, filename):
+		pass
+
+	def play(self, *args, **kwargs):
+		pass
+
+	def stop(self):
+		pass
+
+	def pause(self):
+		pass
+
+	def unpause(self):
+		pass
+
+	def rewind(self):
+		pass
+
+	def fadeout(self, time):
+		pass
+
+	def set_endevent(self, *args):
+		pass
+
+	def get_busy(self):
+		return False
+
+	def set_volume(self, value):
+		pass
+
+	def get_volume(self):
+		return 0.0
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Plays a match of mBreak between two AI players, without a window or sound.")
+	parser.add_argument("--rounds", type = int, default = 1, help = "the number of rounds to play")
+	parser.add_argument("--ai", type = int, nargs = 2, default = [2, 2], help = "the AI difficulty of player one and two")
+	parser.add_argument("--seed", type = int, default = None, help = "the random seed to use (the same seed always plays the same match)")
+	parser.add_argument("--render", action = "store_true", help = "draw every frame to an offscreen surface")
+	parser.add_argument("--counters", action = "store_true", help = "count the expensive things the game does and write them to a file (see counters)")
+	parser.add_argument("--trace", action = "store_true", help = "record a timeline of every frame and write it to a file (see tracer)")
+	arguments = parser.parse_args()
+	settings.COUNTERS = arguments.counters
+	settings.TRACING = arguments.trace
+
+	result = simulate(pygame.Color(255, 0, 0, 255), pygame.Color(0, 0, 255, 255), arguments.rounds, arguments.ai[0], arguments.ai[1], seed = arguments.seed, render = arguments.render)
+
+	for index, round_stats in enumerate(result["rounds"]):
+		print("Round %d: winner %s after %d frames (%.1f seconds), blocks left %s" % (index + 1, round_stats["winner"], round_stats["frames"], round_stats["time"], round_stats["blocks_left"]))
+	print("Winner: %s, score: %s" % (result["winner"], result["score"]))
@@ -0,0 +1,117 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import time
+import collections
+import other.tracer as tracer
+import settings.settings as settings
+
+"""
+
+This module keeps track of where the time goes in every frame, so that we can see which part of the game is slowing it down. The
+debug overlay (see Debug.display) shows the breakdown while the game is running.
+
+A frame is split into phases with marks. Every call to mark() ends a phase: the time since the last mark is added to the phase with the
+given name. The scenes mark the big phases (see Scene.step), like waiting for the clock, handling events, updating and drawing, and the
+game marks the smaller phases within its update and draw (like updating the balls, or drawing a layer of the render queue). The same
+phase can be marked more than once in a frame (the game can be updated more than once per frame), the times are simply added up.
+
+The breakdown is averaged over the last few frames (see Profiler.history_length), since a single frame says very little.
+
+When tracing (see tracer), every frame and every phase is also recorded as a span, so the same marks show up on the timeline.
+
+Profiling is only done in debug mode (or when tracing). Otherwise mark() returns right away, so the marks can be left in without slowing
+anything down.
+
+"""
+
+class Profiler():
+
+	# Standard values. The breakdown is averaged over this many frames.
+	history_length = 60
+
+	def __init__(self, history_length = None):
+		if history_length is None:
+			self.history_length = Profiler.history_length
+		else:
+			self.history_length = history_length
+
+		# The time spent in every phase of the current frame, with the name of the phase as key. None if we're not profiling.
+		self.frame = None
+
+		# The name of the current frame (the scene it belongs to), and the time it began and the time of the last mark.
+		self.frame_name = None
+		self.frame_start_time = 0
+		self.last_mark_time = 0
+
+		# The last few frames, and the total time spent in every phase in those frames.
+		self.history = collections.deque()
+		self.totals = {}
+
+		# The names of all the phases, in the order we first saw them.
+		self.phases = []
+
+	def begin_frame(self, name = "frame"):
+		# Ends the current frame and begins a new one, with the given name. Call this at the very start of every frame.
+		now = time.time()
+		if not self.frame is None:
+			self.add_frame(self.frame)
+			tracer.add_span(self.frame_name, "frame", self.frame_start_time, now)
+
+		if settings.DEBUG_MODE or settings.TRACING:
+			self.frame = {}
+			self.frame_name = name
+			self.frame_start_time = now
+			self.last_mark_time = now
+		else:
+			self.frame = None
+
+	def mark(self, phase):
+		# Ends the given phase, by adding the time since the last mark to it.
+		if self.frame is None:
+			return
+
+		now = time.time()
+		self.frame[phase] = self.frame.get(phase, 0.0) + now - self.last_mark_time
+		tracer.add_span(phase, "phase", self.last_mark_time, now)
+		self.last_mark_time = now
+
+	def add_frame(self, frame):
+		# Adds a finished frame to the history, and throws away the oldest one if we have too many.
+		self.history.append(frame)
+		for phase, phase_time in frame.iteritems():
+			if not phase in self.totals:
+				self.totals[phase] = 0.0
+				self.phases.append(phase)
+			self.totals[phase] += phase_time
+
+		while len(self.history) > self.history_length:
+			for phase, phase_time in self.history.popleft().iteritems():
+				self.totals[phase] -= phase_time
+
+	def get_breakdown(self):
+		# Returns a list of (phase, average time in milliseconds) for every phase that has taken any time in the last few frames, in
+		# the order they were first seen.
+		if len(self.history) == 0:
+			return []
+		return [(phase, self.totals[phase] * 1000 / len(self.history)) for phase in self.phases if self.totals[phase] > 1e-9]
+
+	def get_frame_time(self):
+		# Returns the average length of a frame in milliseconds, in the last few frames.
+		return sum(phase_time for phase, phase_time in self.get_breakdown())
+
+	def reset(self):
+		# Forgets every frame so far.
+		self.frame = None
+		self.history.clear()
+		self.totals = {}
+		self.phases = []
+
+# The profiler used by the whole game.
+PROFILER = Profiler()
+
+def begin_frame(name = "frame"):
+	PROFILER.begin_frame(name)
+
+def mark(phase):
+	PROFILER.mark(phase)
@@ -0,0 +1,181 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import pygame
+import other.assets as assets
+import other.profiler as profiler
+import settings.settings as settings
+
+"""
+
+Blitting a lot of small images one at a time is slow in Python, mostly because of the overhead of every single call to blit(). A render
+batch collects everything that should be blitted, and then blits all of it with a single call to Surface.blits().
+
+Everything is added to the batch with its position in the game (not on the screen), and the offset (the position of the camera) is
+subtracted from every position when the batch is submitted. That way, whoever fills the batch doesn't have to care about the camera.
+
+The batch draws everything in the order it was added. Fills and objects that have to draw themselves (like animations) can be added
+as well, they simply interrupt the blits at the point they were added, so the order is kept.
+
+Anything that would end up completely outside the clip rect of the surface it's submitted to is never blitted at all (it wouldn't show
+anyway). In the game, the clip rect is the inside of the level, so nothing under the walls or outside the screen is blitted.
+
+A render queue is a stack of render batches, one for each layer. Everything is added to the batch of the layer it should be drawn in,
+and the queue submits the batches from the bottom layer to the top one, so the order things are added in only matters within a layer.
+The layers used in the game are listed below, from the bottom up, and every object that can be drawn in the game knows which layer it
+belongs to (its layer attribute).
+
+In debug mode, every blit is checked to be in the format of the display (see assets.check_format), since blitting anything else every
+frame is a lot slower than it has to be.
+
+"""
+
+# The layers of the game, from the bottom up.
+SHADOW_LAYER = 0
+BLOCK_LAYER = 1
+PADDLE_LAYER = 2
+POWERUP_LAYER = 3
+TRACE_LAYER = 4
+DEBUG_LAYER = 5
+BALL_LAYER = 6
+EFFECT_LAYER = 7
+FLASH_LAYER = 8
+PARTICLE_LAYER = 9
+PROJECTILE_LAYER = 10
+
+# The names of the layers, used when profiling (see RenderQueue.submit).
+LAYER_NAMES = {SHADOW_LAYER: "shadows", BLOCK_LAYER: "blocks", PADDLE_LAYER: "paddles", POWERUP_LAYER: "powerups", TRACE_LAYER: "traces",
+				DEBUG_LAYER: "debug", BALL_LAYER: "balls", EFFECT_LAYER: "effects", FLASH_LAYER: "flashes", PARTICLE_LAYER: "particles",
+				PROJECTILE_LAYER: "projectiles"}
+
+# The different kinds of things a render batch can contain.
+BLIT = 0
+FILL = 1
+DRAW = 2
+
+class RenderBatch():
+
+	def __init__(self):
+		# Everything in the batch, stored as (kind, ...) in the order it was added. Blits are stored as (BLIT, source, x, y, area,
+		# special_flags), fills as (FILL, color, x, y, width, height) and draws as (DRAW, function).
+		self.items = []
+
+	def __len__(self):
+		return len(self.items)
+
+	def clear(self):
+		self.items = []
+
+	def add(self, source, x, y, area = None, special_flags = 0):
+		# Adds a blit of source at the given position in the game.
+		self.items.append((BLIT, source, x, y, area, special_flags))
+
+	def add_group(self, group):
+		# Adds a blit for every sprite in the given group, at the position of its rect.
+		for sprite in group:
+			self.items.append((BLIT, sprite.image, sprite.rect.x, sprite.rect.y, None, 0))
+
+	def add_fill(self, color, x, y, width, height):
+		# Adds a filled rect at the given position in the game.
+		self.items.append((FILL, color, x, y, width, height))
+
+	def add_draw(self, function):
+		# Adds something that draws itself to the batch. When the batch gets to it, function is called with the surface to draw to.
+		# It's drawn as it is, so it has to take care of the camera (and of not drawing what can't be seen) by itself.
+		self.items.append((DRAW, function))
+
+	def submit(self, surface, offset = (0, 0)):
+		# Draws everything in the batch to the given surface, moved by the given offset, and empties the batch.
+		offset_x, offset_y = offset
+
+		# Only the part of the surface inside the clip rect can be drawn to, so we skip anything that's completely outside it.
+		visible_rect = surface.get_clip()
+
+		check_format = settings.DEBUG_MODE
+
+		# Go through the batch, and blit everything in between the fills and draws all at once.
+		sequence = []
+		for item in self.items:
+			if item[0] == BLIT:
+				_, source, x, y, area, special_flags = item
+				position = (x - offset_x, y - offset_y)
+				if area is None:
+					size = source.get_size()
+				else:
+					size = pygame.Rect(area).size
+				if not visible_rect.colliderect(position, size):
+					continue
+				if check_format:
+					assets.check_format(source)
+
+				if area is None and special_flags == 0:
+					sequence.append((source, position))
+				else:
+					sequence.append((source, position, area, special_flags))
+			elif item[0] == FILL:
+				_, color, x, y, width, height = item
+				rect = pygame.Rect(x - offset_x, y - offset_y, width, height)
+				if not visible_rect.colliderect(rect):
+					continue
+
+				# Blit everything up until now first, so that the order is kept.
+				blit_sequence(surface, sequence)
+				sequence = []
+				surface.fill(color, rect)
+			else:
+				blit_sequence(surface, sequence)
+				sequence = []
+				item[1](surface)
+		blit_sequence(surface, sequence)
+
+		self.items = []
+
+def blit_sequence(surface, sequence):
+	# Blits every (source, position[, area, special_flags]) in the given sequence to the given surface. Surface.blits() is quite new
+	# (pygame 1.9.4), so if it's not around we simply blit one at a time.
+	if len(sequence) == 0:
+		return
+
+	if hasattr(surface, "blits"):
+		surface.blits(sequence, False)
+	else:
+		for blit in sequence:
+			surface.blit(*blit)
+
+class RenderQueue():
+
+	def __init__(self):
+		# The render batch of every layer, stored with the layer as key.
+		self.batches = {}
+
+	def __len__(self):
+		return sum(len(batch) for batch in self.batches.itervalues())
+
+	def clear(self):
+		self.batches = {}
+
+	def get_batch(self, layer):
+		# Returns the render batch of the given layer.
+		if not layer in self.batches:
+			self.batches[layer] = RenderBatch()
+		return self.batches[layer]
+
+	def add(self, drawable):
+		# Adds an object that knows how to add itself to a render batch (with add_to_batch) to the batch of its layer.
+		drawable.add_to_batch(self.get_batch(drawable.layer))
+
+	def add_group(self, group, layer):
+		# Adds a blit for every sprite in the given group to the batch of the given layer.
+		self.get_batch(layer).add_group(group)
+
+	def add_draw(self, function, layer):
+		# Adds something that draws itself (see RenderBatch.add_draw) to the batch of the given layer.
+		self.get_batch(layer).add_draw(function)
+
+	def submit(self, surface, offset = (0, 0)):
+		# Submits the batch of every layer, from the bottom layer to the top one, and empties the queue. In debug mode, the time it takes
+		# to draw every layer is shown by the debug overlay (see profiler).
+		for layer in sorted(self.batches):
+			self.batches[layer].submit(surface, offset)
+			profiler.mark("draw: " + LAYER_NAMES.get(layer, str(layer)) + " layer")
+		self.batches = {}
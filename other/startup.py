@@ -0,0 +1,205 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import os
+import sys
+import time
+import argparse
+import collections
+import __builtin__
+
+"""
+
+This module measures how long it takes for the game to start, from the very first import until the first frame of the splash screen
+has been drawn, so that we notice when something makes the game slower to start (just like the headless mode lets us keep an eye on
+the frame time).
+
+It runs the game like mBreak.py does, but without a window and without sound (the dummy drivers are used, so everything still gets
+loaded and initialized), and stops it as soon as the first frame is shown. Then it reports:
+
+	* how long the big steps took (importing pygame, importing the game, loading the settings, pygame.init() and so on),
+	* how long it took to import every module, not counting the modules it imported in turn (that's where the fonts and anything else
+	  created in a class body show up),
+	* how long it took to load every image and sound (see assets.LOAD_TIMES). Most of them are loaded in the background while the splash
+	  plays (see assets.start_loading), so they're listed separately and don't count towards the time to the first frame.
+
+If the first frame took longer than the budget, it exits with an error, so it can be used to catch startup regressions automatically.
+Run it from the folder mBreak.py is in:
+
+	python -m other.startup --budget 500
+
+Nothing from the game may be imported before this starts timing, which is why it only imports modules from the standard library.
+
+"""
+
+# The time (in milliseconds) the game may take to draw its first frame, unless another budget is given.
+BUDGET = 1000
+
+class FirstFrame(Exception):
+
+	# Raised when the first frame is shown, to stop the game right there.
+
+	pass
+
+class ImportTimer():
+
+	def __init__(self):
+		# The time (in seconds) it took to import every module, not counting the modules it imported, with the name of the module as key
+		# in the order they were imported.
+		self.times = collections.OrderedDict()
+
+		# The time spent importing other modules, for every import in progress (the last one is the one going on right now).
+		self.stack = []
+
+		self.original_import = None
+
+	def install(self):
+		# Starts timing every import.
+		self.original_import = __builtin__.__import__
+		__builtin__.__import__ = self.timed_import
+
+	def uninstall(self):
+		__builtin__.__import__ = self.original_import
+
+	def timed_import(self, name, globals = None, locals = None, fromlist = None, level = -1):
+		# Imports just like __import__ does, and if that means a module is loaded for the first time, we store how long it took. It can
+		# also load modules in fromlist (from package import module), so we check those as well.
+		names = [name]
+		if fromlist:
+			names.extend(name + "." + item for item in fromlist if isinstance(item, str))
+		new_names = [module_name for module_name in names if not module_name in sys.modules]
+		if len(new_names) == 0:
+			return self.original_import(name, globals, locals, fromlist, level)
+
+		self.stack.append(0.0)
+		start_time = time.time()
+		try:
+			return self.original_import(name, globals, locals, fromlist, level)
+		finally:
+			total_time = time.time() - start_time
+			imported_time = self.stack.pop()
+			if len(self.stack) > 0:
+				self.stack[-1] += total_time
+
+			loaded_names = [module_name for module_name in new_names if not sys.modules.get(module_name) is None]
+			if len(loaded_names) > 0:
+				self.times[", ".join(loaded_names)] = total_time - imported_time
+
+class Startup():
+
+	def __init__(self):
+		# How long every step of the startup took (in seconds), with the name of the step as key, in the order they were taken.
+		self.steps = collections.OrderedDict()
+
+		self.import_timer = ImportTimer()
+
+		# The time it took to draw the first frame, and the images and sounds that had been loaded by then.
+		self.first_frame_time = None
+		self.first_frame_assets = []
+
+		# The time we had to wait for the assets loading in the background, after the first frame.
+		self.loading_wait_time = None
+
+	def time_function(self, module, name, step):
+		# Replaces the function name in module with one that stores how long every call takes as the given step.
+		function = getattr(module, name)
+		def timed_function(*args, **kwargs):
+			start_time = time.time()
+			try:
+				return function(*args, **kwargs)
+			finally:
+				self.steps[step] = self.steps.get(step, 0.0) + time.time() - start_time
+		setattr(module, name, timed_function)
+
+	def run(self, use_cache = True):
+		# Starts the game and stops it at the first frame of the splash screen. Returns the time that took (in seconds).
+		os.environ["SDL_VIDEODRIVER"] = "dummy"
+		os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+		start_time = time.time()
+		self.import_timer.install()
+		try:
+			step_time = time.time()
+			import pygame
+			self.steps["import pygame"] = time.time() - step_time
+
+			# The first frame is shown with pygame.display.update(), so that's where we stop.
+			def first_frame(*args):
+				raise FirstFrame()
+			pygame.display.update = first_frame
+			pygame.display.flip = first_frame
+
+			# The settings are loaded while mBreak is imported, so we import them first to be able to time that.
+			import settings.settings as settings
+			import settings.graphics as graphics
+			import other.assets as assets
+			import other.assetcache as assetcache
+			assetcache.ENABLED = use_cache
+			self.time_function(settings, "load", "settings.load()")
+			self.time_function(graphics, "load", "graphics.load()")
+			self.time_function(pygame, "init", "pygame.init()")
+			self.time_function(assets, "start_loading", "assets.start_loading()")
+
+			step_time = time.time()
+			import mBreak
+			self.steps["import mBreak"] = time.time() - step_time - self.steps["settings.load()"] - self.steps["graphics.load()"]
+
+			step_time = time.time()
+			try:
+				mBreak.main()
+			except FirstFrame:
+				pass
+			else:
+				raise RuntimeError("The game quit before it showed its first frame.")
+			self.steps["mBreak.main()"] = time.time() - step_time - self.steps["pygame.init()"] - self.steps.get("assets.start_loading()", 0.0)
+		finally:
+			self.import_timer.uninstall()
+		self.first_frame_time = time.time() - start_time
+
+		# Whatever hasn't been loaded yet is loaded in the background, so we wait for that to finish as well to see how long every
+		# asset took.
+		self.first_frame_assets = assets.LOAD_TIMES.keys()
+		self.loading_wait_time = assets.finish_loading()
+
+		return self.first_frame_time
+
+	def print_report(self, amount = 10):
+		# Prints how long everything took. Only the amount slowest modules and assets are listed.
+		import other.assets as assets
+
+		print("First frame after %.1f ms" % (self.first_frame_time * 1000))
+		for step, step_time in self.steps.iteritems():
+			print("    %8.2f ms  %s" % (step_time * 1000, step))
+
+		import_times = self.import_timer.times
+		print("Imported %d modules in %.1f ms, the slowest ones were:" % (len(import_times), sum(import_times.itervalues()) * 1000))
+		for name, import_time in sorted(import_times.iteritems(), key = lambda item: item[1], reverse = True)[:amount]:
+			print("    %8.2f ms  %s" % (import_time * 1000, name))
+
+		load_times = assets.LOAD_TIMES
+		before_first_frame = self.first_frame_assets
+		print("Loaded %d assets before the first frame in %.1f ms" % (len(before_first_frame), sum(load_times[key] for key in before_first_frame) * 1000))
+		for key in sorted(before_first_frame, key = lambda key: load_times[key], reverse = True)[:amount]:
+			print("    %8.2f ms  %s" % (load_times[key] * 1000, key))
+
+		background = [key for key in load_times if not key in self.first_frame_assets]
+		print("Loaded %d assets in the background in %.1f ms (still loading after the first frame: %.1f ms), the slowest ones were:" %
+				(len(background), sum(load_times[key] for key in background) * 1000, self.loading_wait_time * 1000))
+		for key in sorted(background, key = lambda key: load_times[key], reverse = True)[:amount]:
+			print("    %8.2f ms  %s" % (load_times[key] * 1000, key))
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description = "Measures how long it takes for mBreak to show its first frame, without a window or sound.")
+	parser.add_argument("--budget", type = float, default = BUDGET, help = "fail if the first frame takes longer than this (in milliseconds)")
+	parser.add_argument("--amount", type = int, default = 10, help = "the number of modules and assets to list")
+	parser.add_argument("--no-cache", action = "store_true", help = "don't use the asset cache (see assetcache)")
+	arguments = parser.parse_args()
+
+	startup = Startup()
+	first_frame_time = startup.run(not arguments.no_cache)
+	startup.print_report(arguments.amount)
+
+	if first_frame_time * 1000 > arguments.budget:
+		print("Over budget: the first frame took %.1f ms, the budget is %.1f ms." % (first_frame_time * 1000, arguments.budget))
+		sys.exit(1)
+	print("Within budget (%.1f ms)." % arguments.budget)
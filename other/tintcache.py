@@ -0,0 +1,113 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import collections
+import other.useful as useful
+import other.assets as assets
+import other.assetcache as assetcache
+
+"""
+
+This module keeps colorized (tinted) versions of images around, so that we don't have to colorize the same image with the same color
+over and over again. For example, every block in a level is the same image colorized with the same color (one color per player), so
+instead of colorizing the image once per block we colorize it once and let all the blocks share it.
+
+Since the images are shared, they must NEVER be changed by whoever uses them. If you want to draw on an image you got from here, copy
+it first.
+
+Use colorize() to get a colorized image. The cache only keeps a limited amount of images (measured in bytes), and throws away the ones
+that haven't been used for the longest time when it's full.
+
+Colorized versions of images loaded by assets (and colorized versions of those, like the shadows of blocks) are kept on disk as well
+(see assetcache), so that they don't have to be colorized again the next time the game starts.
+
+"""
+
+class TintCache():
+
+	# Standard values. These will be used unless any other values are specified per instance of this class.
+	byte_budget = 8 * 1024 * 1024
+
+	def __init__(self, byte_budget = None):
+		# The maximum amount of bytes all the images in the cache may take up together.
+		if byte_budget is None:
+			self.byte_budget = TintCache.byte_budget
+		else:
+			self.byte_budget = byte_budget
+
+		# The amount of bytes that the images in the cache take up right now.
+		self.size = 0
+
+		# The images, stored with the key as key and (source, image, size) as value. The source image is stored as well, so that it
+		# stays alive as long as the entry does (otherwise another image could end up with the same id). The dictionary is ordered
+		# from the least recently used entry to the most recently used.
+		self.entries = collections.OrderedDict()
+
+		# The keys in the disk cache of the images in the cache, stored with the id of the image as key. Only images that can be traced
+		# back to an image loaded by assets have one.
+		self.disk_keys = {}
+
+	def __len__(self):
+		return len(self.entries)
+
+	def clear(self):
+		self.entries.clear()
+		self.disk_keys.clear()
+		self.size = 0
+
+	def colorize(self, source, color, blend_alpha = False, bgr = True, alpha = None, key = None):
+		# Returns a copy of source colorized with color (see useful.colorize_image). If alpha is given, the alpha value of the whole
+		# image is set to it as well. Images are identified by key, or by source itself if no key is given.
+		if key is None:
+			key = id(source)
+		entry_key = (key, tuple(color), blend_alpha, bgr, alpha)
+
+		entry = self.entries.pop(entry_key, None)
+		if entry is None:
+			# We don't have it, so we look for it on disk, or colorize a copy of the source if it isn't there either.
+			disk_key = self.get_disk_key(source)
+			if not disk_key is None:
+				disk_key = assetcache.get_tint_key(disk_key, color, blend_alpha, bgr)
+				image = assetcache.load(disk_key)
+			else:
+				image = None
+
+			if image is None:
+				image = source.copy()
+				useful.colorize_image(image, color, blend_alpha, bgr)
+				if not disk_key is None:
+					assetcache.save(disk_key, image)
+			else:
+				image = assets.convert(image)
+
+			if not disk_key is None:
+				self.disk_keys[id(image)] = disk_key
+			if not alpha is None:
+				image.set_alpha(alpha)
+
+			entry = (source, image, image.get_bytesize() * image.get_width() * image.get_height())
+			self.size += entry[2]
+
+		# (Re)insert the entry last, since it's now the most recently used.
+		self.entries[entry_key] = entry
+
+		# Throw away the least recently used images until we're within budget again. We never throw away the image we just made.
+		while self.size > self.byte_budget and len(self.entries) > 1:
+			_, (_, image, size) = self.entries.popitem(last = False)
+			self.disk_keys.pop(id(image), None)
+			self.size -= size
+
+		return entry[1]
+
+	def get_disk_key(self, source):
+		# Returns the key of source in the disk cache, or None if it doesn't have one.
+		key = assets.get_key(source)
+		if not key is None:
+			return assetcache.get_image_key(*key)
+		return self.disk_keys.get(id(source))
+
+# The cache used by the whole game.
+CACHE = TintCache()
+
+def colorize(source, color, blend_alpha = False, bgr = True, alpha = None, key = None):
+	return CACHE.colorize(source, color, blend_alpha, bgr, alpha, key)
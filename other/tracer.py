@@ -0,0 +1,194 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import os
+import json
+import time
+import thread
+import threading
+import functools
+import settings.settings as settings
+
+"""
+
+This module records a timeline of what the game is doing, so that we can look at every single frame instead of just the averages the
+profiler shows (a frame that takes 50 ms once a minute hardly moves the average, but it's still a hitch you can see).
+
+Everything that is recorded is a span: a name, a category and the time it started and ended. These are recorded:
+
+	* every frame of every scene, and the phases within it (see profiler, every mark() is also a span),
+	* setting up the things that take a while, like the game, the level and the help menu (see traced),
+	* loading every image and sound, on whatever thread it's loaded on (see assets.load_image_file).
+
+Recording a span has to be quick, or the tracing itself would cause the hitches we're looking for. So the spans are stored in lists
+that are allocated once, when the first span is recorded, and are used as a ring buffer: if more than Tracer.capacity spans are recorded
+before they're written, the oldest ones are overwritten. The spans are written to a file in TRACE_DIRECTORY every
+Tracer.flush_interval frames (see end_frame), so that only a few of them have to be written at a time and the buffer never runs full,
+and when a scene ends (see SceneManager.end_scene). Writing them is recorded as a span as well, so it's easy to tell apart from the
+hitches of the game itself.
+
+The file is in the Chrome trace event format, so it can be opened in chrome://tracing or Perfetto (https://ui.perfetto.dev). It's a
+JSON array that is appended to every time the spans are written, so it never gets the closing "]", but both of them are fine with that.
+
+Tracing is only done when settings.TRACING is True (set "tracing 1" in settings.txt, or run the headless mode with --trace).
+
+"""
+
+# The folder the traces are written to.
+TRACE_DIRECTORY = "metrics"
+
+# Every span is written as one of these. Filling in a string is a lot quicker than building a dictionary and dumping it with json.
+SPAN_FORMAT = '{"name": %s, "cat": "%s", "ph": "X", "pid": %d, "tid": %d, "ts": %.3f, "dur": %.3f}'
+
+class Tracer():
+
+	# Standard values. The number of spans we keep before the oldest ones are overwritten (about a minute of the game), and the number
+	# of frames between every time they're written (about a second).
+	capacity = 1 << 17
+	flush_interval = 60
+
+	def __init__(self, capacity = None):
+		if capacity is None:
+			self.capacity = Tracer.capacity
+		else:
+			self.capacity = capacity
+
+		# Every span is stored in the same slot of these lists. They're allocated when the first span is recorded (see allocate).
+		self.names = None
+		self.categories = None
+		self.start_times = None
+		self.end_times = None
+		self.threads = None
+
+		# The number of spans recorded so far, and the number of those that have been written (or overwritten before they could be).
+		self.recorded = 0
+		self.flushed = 0
+
+		# Assets are loaded on other threads, so the lists are only touched with this lock held.
+		self.lock = threading.Lock()
+
+		# The names of the threads that have recorded spans, with their id as key, and the ids of the ones we've written the name of.
+		self.thread_names = {}
+		self.named_threads = set()
+
+		# Every time in the file is relative to this.
+		self.start_time = time.time()
+
+		# The file the spans are written to. We pick one the first time we write anything.
+		self.filename = None
+
+		# The number of frames since the spans were last written.
+		self.frames = 0
+
+	def allocate(self):
+		self.names = [None] * self.capacity
+		self.categories = [None] * self.capacity
+		self.start_times = [0.0] * self.capacity
+		self.end_times = [0.0] * self.capacity
+		self.threads = [0] * self.capacity
+
+	def add_span(self, name, category, start_time, end_time):
+		# Records a span. The times are in seconds, as returned by time.time().
+		thread_id = thread.get_ident()
+		with self.lock:
+			if self.names is None:
+				self.allocate()
+			if not thread_id in self.thread_names:
+				self.thread_names[thread_id] = threading.current_thread().name
+
+			slot = self.recorded % self.capacity
+			self.names[slot] = name
+			self.categories[slot] = category
+			self.start_times[slot] = start_time
+			self.end_times[slot] = end_time
+			self.threads[slot] = thread_id
+			self.recorded += 1
+
+	def get_events(self):
+		# Returns every span that hasn't been written yet as a trace event (in JSON), and marks them as written. If some of them have
+		# been overwritten, we add an event that says how many, so that the gap in the timeline doesn't go unnoticed.
+		process_id = os.getpid()
+		events = []
+		with self.lock:
+			if self.recorded - self.flushed > self.capacity:
+				lost = self.recorded - self.capacity - self.flushed
+				self.flushed = self.recorded - self.capacity
+				events.append(json.dumps({"name": "%d spans lost" % lost, "ph": "i", "s": "g", "pid": process_id, "tid": thread.get_ident(),
+											"ts": (self.start_times[self.flushed % self.capacity] - self.start_time) * 1000000}))
+
+			for thread_id, thread_name in self.thread_names.iteritems():
+				if not thread_id in self.named_threads:
+					self.named_threads.add(thread_id)
+					events.append(json.dumps({"name": "thread_name", "ph": "M", "pid": process_id, "tid": thread_id, "args": {"name": thread_name}}))
+
+			for index in xrange(self.flushed, self.recorded):
+				slot = index % self.capacity
+				start_time = self.start_times[slot]
+				events.append(SPAN_FORMAT % (json.dumps(self.names[slot]), self.categories[slot], process_id, self.threads[slot],
+											(start_time - self.start_time) * 1000000, (self.end_times[slot] - start_time) * 1000000))
+			self.flushed = self.recorded
+		return events
+
+	def end_frame(self):
+		# Writes the spans every flush_interval frames. Call this once every frame.
+		self.frames += 1
+		if self.frames >= self.flush_interval:
+			self.flush()
+
+	def flush(self):
+		# Writes every span recorded since the last time to the file.
+		self.frames = 0
+		start_time = time.time()
+		events = self.get_events()
+		if len(events) == 0:
+			return
+
+		try:
+			if self.filename is None:
+				if not os.path.isdir(TRACE_DIRECTORY):
+					os.makedirs(TRACE_DIRECTORY)
+				self.filename = os.path.join(TRACE_DIRECTORY, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+				with open(self.filename, "w") as trace_file:
+					trace_file.write("[\n")
+
+			with open(self.filename, "a") as trace_file:
+				trace_file.write(",\n".join(events) + ",\n")
+		except (IOError, OSError):
+			# The trace is nice to have, but it's not worth crashing the game over.
+			print("Couldn't write the trace to " + str(self.filename) + ".")
+
+		self.add_span("tracer.flush", "tracer", start_time, time.time())
+
+# The tracer used by the whole game.
+TRACER = Tracer()
+
+def add_span(name, category, start_time, end_time):
+	if settings.TRACING:
+		TRACER.add_span(name, category, start_time, end_time)
+
+def end_frame():
+	if settings.TRACING:
+		TRACER.end_frame()
+
+def flush():
+	if settings.TRACING:
+		TRACER.flush()
+
+def traced(name, category = "setup"):
+	# A decorator that records a span with the given name for every call to the function it decorates, like this:
+	#
+	#	@tracer.traced("Level.__init__")
+	#	def __init__(self, ...):
+	def decorator(function):
+		@functools.wraps(function)
+		def traced_function(*args, **kwargs):
+			if not settings.TRACING:
+				return function(*args, **kwargs)
+
+			start_time = time.time()
+			try:
+				return function(*args, **kwargs)
+			finally:
+				TRACER.add_span(name, category, start_time, time.time())
+		return traced_function
+	return decorator
@@ -4,7 +4,9 @@ __license__ = "All Rights Reserved"
 import pygame
 from pygame.locals import *
 import math
+import numpy
 from itertools import chain
+import other.counters as counters
 
 """
 
@@ -94,6 +96,49 @@ def colorize_image(image, new_color, blend_alpha = False, bgr = True):
 	"""
 	Given an image and a new_color, this method colors the image with the new_color.
 	If the optional parameter blend_alpha is True, the alpha value is blended too.
+	The optional parameter bgr reverses the color order, see colorize_image_per_pixel for why.
+	"""
+	counters.add("colorize calls")
+	counters.add("colorized pixels", image.get_width() * image.get_height())
+
+	# Going through the image one pixel at a time is really slow, so if we can, we get the pixels as arrays and blend them all at
+	# once. This does exactly what blend_colors() does to every pixel. We can only do that with 24 and 32 bit images, though.
+	if not image.get_bitsize() in (24, 32):
+		colorize_image_per_pixel(image, new_color, blend_alpha, bgr)
+		return
+
+	# This array is a view of the pixels in the image, so changing it changes the image. The image stays locked as long as the
+	# array exists.
+	pixels = pygame.surfarray.pixels3d(image)
+	new_r = (pixels[..., 0] * (new_color.r / 255.0)).astype(numpy.uint8)
+	new_g = (pixels[..., 1] * (new_color.g / 255.0)).astype(numpy.uint8)
+	new_b = (pixels[..., 2] * (new_color.b / 255.0)).astype(numpy.uint8)
+
+	# See colorize_image_per_pixel() for why we might want to swap red and blue. When a color is put into a pixelarray of a 24 bit
+	# image that stores its pixels in BGR order (which is what most of our images are when they're loaded), the red and blue values
+	# end up swapped as well. We want the exact same result, so we swap them here too.
+	swap_red_and_blue = bgr
+	if image.get_bitsize() == 24 and image.get_masks()[0] == 0xff:
+		swap_red_and_blue = not swap_red_and_blue
+
+	if swap_red_and_blue:
+		pixels[..., 0] = new_b
+		pixels[..., 2] = new_r
+	else:
+		pixels[..., 0] = new_r
+		pixels[..., 2] = new_b
+	pixels[..., 1] = new_g
+	del pixels
+
+	# Images without per pixel alpha (no alpha mask) are opaque everywhere, and stay that way.
+	if blend_alpha and image.get_masks()[3] != 0:
+		alphas = pygame.surfarray.pixels_alpha(image)
+		alphas[...] = (alphas * (new_color.a / 255.0)).astype(numpy.uint8)
+		del alphas
+
+def colorize_image_per_pixel(image, new_color, blend_alpha = False, bgr = True):
+	"""
+	Does the same thing as colorize_image, but one pixel at a time. This works with images of any bit depth.
 	"""
 	# Lock the surface so we can colorize it.
 	image.lock()
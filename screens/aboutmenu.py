@@ -15,6 +15,7 @@ import gui.traversal as traversal
 import settings.settings as settings
 import settings.graphics as graphics
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 import screens
 
 """
@@ -148,9 +149,6 @@ class AboutMenu(scene.Scene):
 		self.transition.setup_single_item_transition(self.made_by_author, True, True, False, False)
 		self.transition.setup_single_item_transition(self.made_by_info, True, True, False, False)
 
-		# And finally, we start the gameloop!
-		self.gameloop()
-
 	def back(self, item):
 		# This simply ends this scene.
 		self.done = True
@@ -201,6 +199,6 @@ class AboutMenu(scene.Scene):
 	def on_exit(self):
 		if not self.next_screen is None:
 			# If there is a next screen set, start that.
-			self.next_screen(self.window_surface, self.main_clock)
+			scenemanager.replace(self.next_screen(self.window_surface, self.main_clock))
 		
 		# Else, we simply let this scene end.
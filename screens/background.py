@@ -2,6 +2,7 @@ __author__ = "Olof Karlsson"
 __license__ = "All Rights Reserved"
 
 import pygame
+import other.assets as assets
 import objects.camera as camera
 import settings.settings as settings
 import settings.graphics as graphics
@@ -11,43 +12,30 @@ import settings.graphics as graphics
 This class handles the background images in the game. It requires a folder_name, and in that folder it looks for a few images
 that is uses to build up the background. The images in the given folder must have names matching those below.
 
-In order to display the background images, simply call the draw method where you want to draw them.
+Nothing in the background ever changes during a round, so instead of drawing the floor, the walls and the corners one by one every
+frame, we draw all of them (together with the background color) onto one surface once, and then simply blit that surface every frame.
+The surface is only drawn again if graphics.BACKGROUND or the resolution changes.
+
+Since the walls are drawn first now, whatever is drawn inside the level afterwards should be clipped to the level (see get_level_rect),
+so that nothing ends up on top of the walls.
+
+In order to display the background, simply call the draw method at the start of the frame.
 
 """
 
 class Background:
 	
 	def __init__(self, folder_name):
-		# Setup the background surfaces.
-		self.floor_surface = pygame.image.load("res/background/" + folder_name + "/floor.png")
-		self.floor_surface = pygame.transform.scale(self.floor_surface, (self.floor_surface.get_width() * settings.GAME_SCALE, self.floor_surface.get_height() * settings.GAME_SCALE))
-		self.wall_vertical_left = pygame.image.load("res/background/" + folder_name + "/wall_vertical_left.png")
-		self.wall_vertical_left = pygame.transform.scale(self.wall_vertical_left, (self.wall_vertical_left.get_width() * settings.GAME_SCALE, self.wall_vertical_left.get_height() * settings.GAME_SCALE))
-		self.wall_vertical_right = pygame.image.load("res/background/" + folder_name + "/wall_vertical_right.png")
-		self.wall_vertical_right = pygame.transform.scale(self.wall_vertical_right, (self.wall_vertical_right.get_width() * settings.GAME_SCALE, self.wall_vertical_right.get_height() * settings.GAME_SCALE))
-		self.wall_horizontal_top = pygame.image.load("res/background/" + folder_name + "/wall_horizontal_top.png")
-		self.wall_horizontal_top = pygame.transform.scale(self.wall_horizontal_top, (self.wall_horizontal_top.get_width() * settings.GAME_SCALE, self.wall_horizontal_top.get_height() * settings.GAME_SCALE))
-		self.wall_horizontal_bottom = pygame.image.load("res/background/" + folder_name + "/wall_horizontal_bottom.png")
-		self.wall_horizontal_bottom = pygame.transform.scale(self.wall_horizontal_bottom, (self.wall_horizontal_bottom.get_width() * settings.GAME_SCALE, self.wall_horizontal_bottom.get_height() * settings.GAME_SCALE))
-		self.corner_top_left = pygame.image.load("res/background/" + folder_name + "/corner_top_left.png")
-		self.corner_top_left = pygame.transform.scale(self.corner_top_left, (self.corner_top_left.get_width() * settings.GAME_SCALE, self.corner_top_left.get_height() * settings.GAME_SCALE))
-		self.corner_bottom_right = pygame.image.load("res/background/" + folder_name + "/corner_bottom_right.png")
-		self.corner_bottom_right = pygame.transform.scale(self.corner_bottom_right, (self.corner_bottom_right.get_width() * settings.GAME_SCALE, self.corner_bottom_right.get_height() * settings.GAME_SCALE))
-		self.corner_top_right = pygame.image.load("res/background/" + folder_name + "/corner_top_right.png")
-		self.corner_top_right = pygame.transform.scale(self.corner_top_right, (self.corner_top_right.get_width() * settings.GAME_SCALE, self.corner_top_right.get_height() * settings.GAME_SCALE))
-		self.corner_bottom_left = pygame.image.load("res/background/" + folder_name + "/corner_bottom_left.png")
-		self.corner_bottom_left = pygame.transform.scale(self.corner_bottom_left, (self.corner_bottom_left.get_width() * settings.GAME_SCALE, self.corner_bottom_left.get_height() * settings.GAME_SCALE))
-
-		# Convert the surfaces, for performances sake.
-		self.floor_surface.convert()
-		self.wall_vertical_left.convert()
-		self.wall_vertical_right.convert()
-		self.wall_horizontal_top.convert()
-		self.wall_horizontal_bottom.convert()
-		self.corner_top_left.convert()
-		self.corner_top_right.convert()
-		self.corner_bottom_left.convert()
-		self.corner_bottom_right.convert()
+		# Setup the background surfaces. They are loaded (and scaled and converted) once, and shared by every background using the same folder.
+		self.floor_surface = assets.get_image("res/background/" + folder_name + "/floor.png")
+		self.wall_vertical_left = assets.get_image("res/background/" + folder_name + "/wall_vertical_left.png")
+		self.wall_vertical_right = assets.get_image("res/background/" + folder_name + "/wall_vertical_right.png")
+		self.wall_horizontal_top = assets.get_image("res/background/" + folder_name + "/wall_horizontal_top.png")
+		self.wall_horizontal_bottom = assets.get_image("res/background/" + folder_name + "/wall_horizontal_bottom.png")
+		self.corner_top_left = assets.get_image("res/background/" + folder_name + "/corner_top_left.png")
+		self.corner_bottom_right = assets.get_image("res/background/" + folder_name + "/corner_bottom_right.png")
+		self.corner_top_right = assets.get_image("res/background/" + folder_name + "/corner_top_right.png")
+		self.corner_bottom_left = assets.get_image("res/background/" + folder_name + "/corner_bottom_left.png")
 
 		# Setup the rects used to display a white border around the level if graphics.BACKGROUND is False.
 		self.wall_horizontal_top_rect = pygame.Rect(settings.LEVEL_X - self.wall_vertical_left.get_width(), settings.LEVEL_Y - self.wall_horizontal_top.get_height(), self.wall_horizontal_top.get_width() + (2 * self.wall_vertical_left.get_width()), self.wall_horizontal_top.get_height())
@@ -55,19 +43,48 @@ class Background:
 		self.wall_vertical_left_rect = pygame.Rect(settings.LEVEL_X - self.wall_vertical_left.get_width(), settings.LEVEL_Y, self.wall_vertical_left.get_width(), self.wall_vertical_left.get_height())
 		self.wall_vertical_right_rect = pygame.Rect(settings.LEVEL_MAX_X, settings.LEVEL_Y, self.wall_vertical_right.get_width(), self.wall_vertical_right.get_height())
 
-	def draw(self, surface):
+		# The surface with the whole background drawn on it, and the settings it was drawn with. Created the first time we draw.
+		self.surface = None
+		self.surface_key = None
+
+	def get_surface(self, size):
+		# Returns the surface with the whole background drawn on it, for a screen of the given size. If anything that changes what
+		# the background looks like has changed since the last time, we draw it again.
+		key = (graphics.BACKGROUND, size, settings.LEVEL_X, settings.LEVEL_Y, settings.LEVEL_MAX_X, settings.LEVEL_MAX_Y)
+		if self.surface is None or key != self.surface_key:
+			self.surface = pygame.Surface(size)
+			self.surface_key = key
+			self.compose(self.surface)
+		return self.surface
+
+	def compose(self, surface):
+		# Draws the whole background to the given surface.
+		surface.fill(settings.BACKGROUND_COLOR)
+
 		# We either blit the background images or fill the rects, depending on graphics.BACKGROUND.
 		if graphics.BACKGROUND:
-			surface.blit(self.wall_horizontal_top, (settings.LEVEL_X - camera.CAMERA.x, settings.LEVEL_Y - camera.CAMERA.y - self.wall_horizontal_top.get_height()))
-			surface.blit(self.wall_horizontal_bottom, (settings.LEVEL_X - camera.CAMERA.x, settings.LEVEL_MAX_Y - camera.CAMERA.y))
-			surface.blit(self.wall_vertical_left, (settings.LEVEL_X - camera.CAMERA.x - self.wall_vertical_left.get_width(), settings.LEVEL_Y - camera.CAMERA.y))
-			surface.blit(self.wall_vertical_right, (settings.LEVEL_MAX_X - camera.CAMERA.x, settings.LEVEL_Y - camera.CAMERA.y))
-			surface.blit(self.corner_top_left, (settings.LEVEL_X - camera.CAMERA.x - self.wall_vertical_left.get_width(), settings.LEVEL_Y - camera.CAMERA.y - self.wall_horizontal_top.get_height()))
-			surface.blit(self.corner_bottom_right, (settings.LEVEL_MAX_X - camera.CAMERA.x, settings.LEVEL_MAX_Y - camera.CAMERA.y))
-			surface.blit(self.corner_top_right, (settings.LEVEL_MAX_X - camera.CAMERA.x, settings.LEVEL_Y - camera.CAMERA.y - self.wall_horizontal_top.get_height()))
-			surface.blit(self.corner_bottom_left, (settings.LEVEL_X - camera.CAMERA.x - self.wall_vertical_left.get_width(), settings.LEVEL_MAX_Y - camera.CAMERA.y))
+			surface.blit(self.floor_surface, (settings.LEVEL_X, settings.LEVEL_Y))
+			surface.blit(self.wall_horizontal_top, (settings.LEVEL_X, settings.LEVEL_Y - self.wall_horizontal_top.get_height()))
+			surface.blit(self.wall_horizontal_bottom, (settings.LEVEL_X, settings.LEVEL_MAX_Y))
+			surface.blit(self.wall_vertical_left, (settings.LEVEL_X - self.wall_vertical_left.get_width(), settings.LEVEL_Y))
+			surface.blit(self.wall_vertical_right, (settings.LEVEL_MAX_X, settings.LEVEL_Y))
+			surface.blit(self.corner_top_left, (settings.LEVEL_X - self.wall_vertical_left.get_width(), settings.LEVEL_Y - self.wall_horizontal_top.get_height()))
+			surface.blit(self.corner_bottom_right, (settings.LEVEL_MAX_X, settings.LEVEL_MAX_Y))
+			surface.blit(self.corner_top_right, (settings.LEVEL_MAX_X, settings.LEVEL_Y - self.wall_horizontal_top.get_height()))
+			surface.blit(self.corner_bottom_left, (settings.LEVEL_X - self.wall_vertical_left.get_width(), settings.LEVEL_MAX_Y))
 		else:
-			surface.fill(settings.BORDER_COLOR, (self.wall_horizontal_top_rect.x - camera.CAMERA.x, self.wall_horizontal_top_rect.y - camera.CAMERA.y, self.wall_horizontal_top_rect.width, self.wall_horizontal_top_rect.height))
-			surface.fill(settings.BORDER_COLOR, (self.wall_horizontal_bottom_rect.x - camera.CAMERA.x, self.wall_horizontal_bottom_rect.y - camera.CAMERA.y, self.wall_horizontal_bottom_rect.width, self.wall_horizontal_bottom_rect.height))
-			surface.fill(settings.BORDER_COLOR, (self.wall_vertical_left_rect.x - camera.CAMERA.x, self.wall_vertical_left_rect.y - camera.CAMERA.y, self.wall_vertical_left_rect.width, self.wall_vertical_left_rect.height))
-			surface.fill(settings.BORDER_COLOR, (self.wall_vertical_right_rect.x - camera.CAMERA.x, self.wall_vertical_right_rect.y - camera.CAMERA.y, self.wall_vertical_right_rect.width, self.wall_vertical_right_rect.height))
+			surface.fill(settings.BORDER_COLOR, self.wall_horizontal_top_rect)
+			surface.fill(settings.BORDER_COLOR, self.wall_horizontal_bottom_rect)
+			surface.fill(settings.BORDER_COLOR, self.wall_vertical_left_rect)
+			surface.fill(settings.BORDER_COLOR, self.wall_vertical_right_rect)
+
+	def get_level_rect(self):
+		# Returns the area of the screen that the inside of the level is drawn to, with the camera in consideration.
+		return pygame.Rect(settings.LEVEL_X - camera.CAMERA.x, settings.LEVEL_Y - camera.CAMERA.y, settings.LEVEL_WIDTH, settings.LEVEL_HEIGHT)
+
+	def draw(self, surface):
+		# If the camera is moved (when the screen shakes), the background doesn't cover the whole screen, so we fill the rest first.
+		if camera.CAMERA.x != 0 or camera.CAMERA.y != 0:
+			surface.fill(settings.BACKGROUND_COLOR)
+
+		surface.blit(self.get_surface(surface.get_size()), (-camera.CAMERA.x, -camera.CAMERA.y))
@@ -49,8 +49,6 @@ class ConfirmationMenu(scene.Scene):
 		# Setup the menu transition.
 		self.setup_transition()
 
-		self.gameloop()
-
 	def setup_menu(self):
 		# Setup the textitem.
 		self.confirmation_text = textitem.TextItem("Are you sure?", pygame.Color(255, 255, 255))
@@ -98,14 +96,16 @@ class ConfirmationMenu(scene.Scene):
 		self.confirmation_menu.update(self.main_clock)
 
 	def draw(self):
-		# Begin every frame by blitting the background surface.
+		# Begin every frame by blitting the background surface. It looks the same every frame, so it's not part of the dirty rects.
 		self.window_surface.blit(self.background_surface, (0, 0))		
 
 		# Draw the confirmation text.
-		self.confirmation_text.draw(self.window_surface)
+		dirty_rects = [self.confirmation_text.draw(self.window_surface)]
 
 		# Draw the confirmation menu.
-		self.confirmation_menu.draw(self.window_surface)
+		dirty_rects.extend(self.confirmation_menu.draw(self.window_surface))
+
+		return dirty_rects
 
 	def on_exit(self):
 		# We're done, so we call the function_to_call if we should, otherwise we do nothing.
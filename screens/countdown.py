@@ -97,5 +97,6 @@ class Countdown:
 				self.function_to_call()
 
 	def draw(self, surface):
+		# Returns the rect of the screen that we've drawn to, or None if we're done (and haven't drawn anything).
 		if not self.done:
-			self.active_surface.draw(surface)
\ No newline at end of file
+			return self.active_surface.draw(surface)
\ No newline at end of file
@@ -6,7 +6,13 @@ import logging
 from pygame.locals import *
 import math
 import random
+import other.assets as assets
 import other.debug as debug
+import other.profiler as profiler
+import other.counters as counters
+import other.tracer as tracer
+import other.capture as capture
+import other.render as render
 import objects.ball as ball
 import objects.paddle as paddle
 import objects.player as player
@@ -21,19 +27,23 @@ import objects.powerups.enlarger as enlarger
 import objects.powerups.reducer as reducer
 import objects.effects.speed as speed
 import objects.effects.flash as flash
+import objects.effects.timeout as timeout
 import objects.effects.explosion as explosion
 import objects.blocks.block as block
 import objects.blocks.normal as block_normal
 import objects.blocks.strong as block_strong
 import objects.blocks.weak as block_weak
+import objects.blocks.blocklayer as blocklayer
 import objects.camera as camera
 import objects.groups as groups
+import objects.interpolator as interpolator
 import gui.textitem as textitem
 import settings.settings as settings
 import settings.graphics as graphics
 import screens.background as background
 import screens.level as level
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 
 # We import any needed game screens here.
 import screens.gameover as gameover
@@ -56,6 +66,10 @@ For each player, a list of all their currently active powerups are displayed in
 
 class Game(scene.Scene):
 
+	# The game is updated at a fixed rate, so that the physics behave the same no matter how fast the game is drawn.
+	fixed_timestep = True
+
+	@tracer.traced("Game.__init__")
 	def __init__(self, window_surface, main_clock, player_one, player_two, number_of_rounds, score, number_of_rounds_done = 0):
 		# Call the superconstructor.
 		scene.Scene.__init__(self, window_surface, main_clock)
@@ -69,6 +83,10 @@ class Game(scene.Scene):
 		# Keep track of the number of rounds we've done so far.
 		self.number_of_rounds_done = number_of_rounds_done
 
+		# If this is the first round, it's a new match, so the counters are written to new files (see counters).
+		if self.number_of_rounds_done == 0:
+			counters.reset()
+
 		# When this is true, the game will keep on running for game_over_time milliseconds.
 		self.game_over = False
 		self.game_over_time = 1000.0
@@ -77,21 +95,17 @@ class Game(scene.Scene):
 		# The score is kept to be sent to the gameover screen and also to be kept for "best-of" matches.
 		self.score = score
 
-		# Convert all the objects to a more efficient format. We do this here as a "preloading" sort of measure.
-		block_normal.convert()
-		block_strong.convert()
-		block_weak.convert()
-		paddle.convert()
-		ball.convert()
-		multiball.convert()
-		doublespeed.convert()
-		fire.convert()
-		frost.convert()
-		electricity.convert()
-		reducer.convert()
-		enlarger.convert()
-		rocket.convert()
-		explosion.convert()
+		# Load every image and sound the game objects use now, so that nothing has to be loaded in the middle of the round.
+		assets.prewarm()
+
+		# Colorize the images of everything that takes on the color of its player ahead of time, so that it doesn't have to happen
+		# while creating the level (or in the middle of the game).
+		for a_player in (player_one, player_two):
+			block_normal.prewarm(a_player.color)
+			block_strong.prewarm(a_player.color)
+			block_weak.prewarm(a_player.color)
+			ball.prewarm(a_player.color)
+			timeout.prewarm(a_player.color)
 
 		# Create and store the background. For now, we only have one background so we load that. In the future, the system supports
 		# drawing any sort of background as long as those graphics are setup in the same way as "planks" are.
@@ -106,6 +120,9 @@ class Game(scene.Scene):
 		# Create and store the level.
 		self.game_level = level.Level(self.player_one, self.player_two, 1, 1, 1)
 
+		# The blocks never move, so we draw them (and their shadows) once and keep them on a layer of their own.
+		self.block_layer = blocklayer.BlockLayer(groups.Groups.block_group)
+
 		# The list of available powerups to spawn.
 		self.powerup_list = [multiball.Multiball, doublespeed.DoubleSpeed, fire.Fire, frost.Frost, electricity.Electricity, rocket.Rocket, enlarger.Enlarger, reducer.Reducer]
 
@@ -147,6 +164,12 @@ class Game(scene.Scene):
 		# We setup and play music.
 		self.setup_music()
 
+		# Since we're updated at a fixed rate, we draw all moving objects in between their last two positions. The particle system
+		# does this by itself, so the particles aren't included here.
+		self.interpolator = interpolator.Interpolator([groups.Groups.ball_group, groups.Groups.paddle_group, groups.Groups.powerup_group,
+														groups.Groups.shadow_group, groups.Groups.trace_group, groups.Groups.effect_group,
+														groups.Groups.projectile_group])
+
 		# When this reaches powerup_spawn_rate, a powerup has a chance to spawn.
 		self.powerup_spawn_time = 0
 
@@ -156,15 +179,13 @@ class Game(scene.Scene):
 		# We start a countdown before the game starts. When the countdown finishes, it calls start_game.
 		self.countdown_screen = countdown.Countdown(self.main_clock, self.start_game)
 
-		# We also hide the cursor.
-		pygame.mouse.set_visible(False)
-
-		# And finally, start the gameloop!
-		self.gameloop()
+		# We also hide the cursor (unless we're running headless, then there's no cursor to hide).
+		if not settings.HEADLESS:
+			pygame.mouse.set_visible(False)
 
 	def setup_music(self):
 		# Set the music list.
-		self.__class__.music_list = settings.GAME_MUSIC
+		self.__class__.music_list = settings.get_music("game")
 		self.play_music()
 
 	def check_for_winner(self):
@@ -280,17 +301,19 @@ class Game(scene.Scene):
 		if (event.type == KEYDOWN and event.key == K_ESCAPE) or (event.type == JOYBUTTONDOWN and event.button == 9):
 			self.main_clock.time_scale = 1
 			pygame.mouse.set_visible(True)
-			pausemenu.PauseMenu(self.window_surface, self.main_clock)
-			pygame.mouse.set_visible(False)
+			scenemanager.push(pausemenu.PauseMenu(self.window_surface, self.main_clock))
 
 		if self.countdown_screen.done:
 			# Handle KEYUP, KEYDOWN events (not keys held down) for player paddles.
 			for player in groups.Groups.player_group:
 				player.event(event)
 			if settings.DEBUG_MODE:
-				debug.event(event, self.main_clock)
+				debug.event(event, self.main_clock, self)
 
 	def update(self):
+		# Remember where everything is before we move it, so we can draw things in between.
+		self.interpolator.store()
+
 		# First, we check if any player has won.
 		self.check_for_winner()
 
@@ -317,26 +340,36 @@ class Game(scene.Scene):
 		least_distance = self.calculate_time_dilation(groups.Groups.ball_group, least_distance)
 		least_distance = self.calculate_time_dilation(groups.Groups.projectile_group, least_distance)
 
+		# In debug mode, the time every part of the update takes is shown by the debug overlay (see profiler).
+		profiler.mark("update: game")
+
 		# Update the players.
 		groups.Groups.player_group.update(self.main_clock)
+		profiler.mark("update: players")
 
 		# Update the paddles.
 		groups.Groups.paddle_group.update(self.main_clock)
+		profiler.mark("update: paddles")
 
 		# Update the balls.
 		groups.Groups.ball_group.update(self.main_clock)
+		profiler.mark("update: balls")
 
 		# Update the blocks.
 		groups.Groups.block_group.update()
+		profiler.mark("update: blocks")
 
 		# Update the dummy objects.
 		groups.Groups.dummy_group.update(self.main_clock)
+		profiler.mark("update: dummies")
 
 		# Update the projectiles.
 		groups.Groups.projectile_group.update(self.main_clock)
+		profiler.mark("update: projectiles")
 
 		# Update the powerups.
 		groups.Groups.powerup_group.update(self.main_clock)
+		profiler.mark("update: powerups")
 
 		# Update the effects.
 		# First, we update the speed effects.
@@ -349,104 +382,151 @@ class Game(scene.Scene):
 		for effect in groups.Groups.effect_group:
 			if not effect.__class__ == speed.Speed:
 				effect.update(self.main_clock)
+		profiler.mark("update: effects")
+
+		# Now that all the balls have moved (including the ones with the speed effect), we let them bounce off each other.
+		ball.collide_balls(groups.Groups.ball_group)
+		profiler.mark("update: ball collisions")
 		
 		# Update the particles.
 		if graphics.PARTICLES:
-			groups.Groups.particle_group.update(self.main_clock)
+			groups.Groups.particle_system.update(self.main_clock)
+			profiler.mark("update: particles")
 
 		# Update the traces.
 		if graphics.TRACES:
 			groups.Groups.trace_group.update(self.main_clock)
+			profiler.mark("update: traces")
 		
 		# Update the shadows.
 		if graphics.SHADOWS:
 			groups.Groups.shadow_group.update(self.main_clock)
+			groups.Groups.particle_system.update_shadows(self.main_clock)
+			profiler.mark("update: shadows")
 
 		# Update the camera.
 		camera.CAMERA.update(self.main_clock)
 
 		# At last, we update the countdown_screen.
 		self.countdown_screen.update()
+		profiler.mark("update: game")
 
-	def blit_with_camera(self, group, surface):
-		for entity in group:
-			self.window_surface.blit(entity.image, (entity.rect.x - camera.CAMERA.x, entity.rect.y - camera.CAMERA.y))
+		# Every update is a frame as far as the counters are concerned (see counters).
+		counters.end_frame()
+
+	def draw_particles(self, surface):
+		groups.Groups.particle_system.draw(surface, self.main_clock.interpolation)
+
+	def draw_particle_shadows(self, surface):
+		groups.Groups.particle_system.draw_shadows(surface, self.main_clock.interpolation)
 
 	def draw(self):
-		# Begin a frame by blitting the background to the window_surface.
-		self.window_surface.fill(settings.BACKGROUND_COLOR)
-		if graphics.BACKGROUND:
-			self.window_surface.blit(self.game_background.floor_surface, (settings.LEVEL_X - camera.CAMERA.x, settings.LEVEL_Y - camera.CAMERA.y))
+		# Move everything to where it should be drawn, in between the last two updates.
+		self.interpolator.apply(self.main_clock.interpolation)
+
+		# Begin a frame by blitting the background (the floor and the walls) to the window_surface.
+		self.game_background.draw(self.window_surface)
+		profiler.mark("draw: background")
+
+		# The walls never change, so we keep track of the parts of the screen that do change (the inside of the level and the HUD
+		# around it) and only update those (see Scene.update_display).
+		dirty_rects = [self.game_background.get_level_rect()]
 
 		# Draw the players.
 		for player in groups.Groups.player_group:
-			player.draw(self.window_surface)
+			dirty_rects.append(player.draw(self.window_surface))
+		profiler.mark("draw: players")
+
+		# Everything in the level should be drawn beneath the walls, so we make sure that nothing is drawn outside the level.
+		self.window_surface.set_clip(self.game_background.get_level_rect())
 
-		# Draw the shadows.
+		# Everything in the level is added to a render queue, in the layer it belongs to, and the queue then draws the layers from the
+		# bottom up (see RenderQueue). Anything under the walls (or outside the screen) is skipped, since we've clipped to the level.
+		queue = render.RenderQueue()
+
+		# The shadows.
 		if graphics.SHADOWS:
+			queue.add_draw(self.block_layer.draw_shadows, render.SHADOW_LAYER)
 			for shadow in groups.Groups.shadow_group:
-				shadow.blit_to(self.window_surface)
+				queue.add(shadow)
+			queue.add_draw(self.draw_particle_shadows, render.SHADOW_LAYER)
 
-		# Draw the blocks.
-		self.blit_with_camera(groups.Groups.block_group, self.window_surface)
+		# The blocks.
+		queue.add_draw(self.block_layer.draw, render.BLOCK_LAYER)
 
-		# Draw the paddles.
-		self.blit_with_camera(groups.Groups.paddle_group, self.window_surface)
+		# The paddles.
+		queue.add_group(groups.Groups.paddle_group, render.PADDLE_LAYER)
 
-		# Draw the powerups.
+		# The powerups. The ones displayed next to the players are drawn later, since they're outside the level.
 		for powerup in groups.Groups.powerup_group:
-			if powerup.is_display:
-				self.window_surface.blit(powerup.image, powerup.rect)
-			else:
-				self.window_surface.blit(powerup.image, (powerup.rect.x - camera.CAMERA.x, powerup.rect.y - camera.CAMERA.y))
+			if not powerup.is_display:
+				queue.get_batch(render.POWERUP_LAYER).add(powerup.image, powerup.rect.x, powerup.rect.y)
 
-		# Draw the traces.
+		# The traces.
 		if graphics.TRACES:
 			for trace in groups.Groups.trace_group:
-				trace.blit_to(self.window_surface)
+				queue.add(trace)
 
-		# Draw debug information for AI.
+		# Debug information for AI.
 		if settings.DEBUG_MODE:
 			for paddle in groups.Groups.paddle_group:
-				paddle.debug_draw(self.window_surface)
+				queue.add_draw(paddle.debug_draw, render.DEBUG_LAYER)
 
-		# Draw the balls.
-		self.blit_with_camera(groups.Groups.ball_group, self.window_surface)
+		# The balls.
+		queue.add_group(groups.Groups.ball_group, render.BALL_LAYER)
 
-		# Draw the effects for which we don't care which order they are drawn in.
+		# The effects. Flashes are in a layer of their own, above the other effects.
 		for effect in groups.Groups.effect_group:
-			if not effect.__class__ == flash.Flash:
-				effect.draw(self.window_surface)
+			if graphics.FLASHES or not effect.__class__ == flash.Flash:
+				queue.add(effect)
 
-		# Draw the flash effects.
-		if graphics.FLASHES:
-			for effect in groups.Groups.effect_group:
-				if effect.__class__ == flash.Flash:
-					effect.draw(self.window_surface)
-
-		# Draw the particles.
+		# The particles.
 		if graphics.PARTICLES:
-			for particle in groups.Groups.particle_group:
-				particle.draw(self.window_surface)
+			queue.add_draw(self.draw_particles, render.PARTICLE_LAYER)
 
-		# Draw the projectiles.
+		# The projectiles.
 		for projectile in groups.Groups.projectile_group:
-			if not (projectile.x + projectile.width < settings.LEVEL_X or 
-					projectile.x > settings.LEVEL_MAX_X or 
-					projectile.y + projectile.height < settings.LEVEL_Y or 
-					projectile.y > settings.LEVEL_MAX_Y):
-				projectile.draw(self.window_surface)
+			queue.add(projectile)
 
-		# Draw the background walls and overlying area.	
-		self.game_background.draw(self.window_surface)
+		# Draw it all. Every layer is profiled on its own (see RenderQueue.submit).
+		profiler.mark("draw: render queue")
+		queue.submit(self.window_surface, (camera.CAMERA.x, camera.CAMERA.y))
+
+		# We're done drawing the level.
+		self.window_surface.set_clip(None)
+
+		# Draw the powerups displayed next to the players, along with their shadows and effects.
+		for powerup in groups.Groups.powerup_group:
+			if powerup.is_display:
+				if graphics.SHADOWS:
+					dirty_rects.append(powerup.shadow.blit_to(self.window_surface))
+				dirty_rects.append(self.window_surface.blit(powerup.image, powerup.rect))
+				for effect in powerup.effect_group:
+					if not effect.__class__ == flash.Flash or graphics.FLASHES:
+						# Not every effect tells us where it drew (animations don't), so then we update its whole rect.
+						effect_rect = effect.draw(self.window_surface)
+						if effect_rect is None:
+							effect_rect = effect.rect
+						dirty_rects.append(effect_rect)
 
 		# Draw the scores if we're playing more than one round.
 		if self.number_of_rounds > 1 and not self.done:
-			self.player_one_score_text.draw(self.window_surface)
-			self.player_two_score_text.draw(self.window_surface)
+			dirty_rects.append(self.player_one_score_text.draw(self.window_surface))
+			dirty_rects.append(self.player_two_score_text.draw(self.window_surface))
 
 		# Finally, draw the countdown screen. It doesn't draw itself if it is finished, so.
-		self.countdown_screen.draw(self.window_surface)
+		countdown_rect = self.countdown_screen.draw(self.window_surface)
+		if not countdown_rect is None:
+			dirty_rects.append(countdown_rect)
+		profiler.mark("draw: hud")
+
+		# Move everything back to where it actually is.
+		self.interpolator.restore()
+
+		# If the camera is shaking, the whole screen (walls and all) moves around, so the whole display has to be updated.
+		if camera.CAMERA.x != 0 or camera.CAMERA.y != 0:
+			return None
+		return dirty_rects
 
 	def on_exit(self):
 		# Restore the time scale.
@@ -484,28 +564,37 @@ class Game(scene.Scene):
 				groups.empty_after_round()
 				self.player_one.empty_groups()
 				self.player_two.empty_groups()
-				Game(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score)
+				scenemanager.replace(Game(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score))
+
+		if self.finish_round():
+			# If we've played the correct amount of rounds, or there's no point in continuing further:
+			capture.match_over()
+			scenemanager.replace(gameover.GameOver(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score, self.winner))
+		else:
+			scenemanager.replace(matchover.MatchOver(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score, self.number_of_rounds_done, self.winner))
+
+	def on_resume(self):
+		# We're back from the pause menu, so we hide the cursor again.
+		pygame.mouse.set_visible(False)
+
+	def finish_round(self):
+		# Cleans up after a round and returns True if the whole match is over. This is kept apart from on_exit so that the headless
+		# mode can finish a round without starting the next screen.
 
 		# We have to make sure to empty the players own groups, because their groups are not emptied by groups.empty_after_round().
 		self.player_one.empty_groups()
 		self.player_two.empty_groups()
 
-		# We decrement the number of rounds by 1 because we've just played one round.
+		# We increment the number of rounds done by 1 because we've just played one round.
 		self.number_of_rounds_done += 1
 
-		if (self.score[self.player_one] > self.number_of_rounds / 2 or 
-			self.score[self.player_two] > self.number_of_rounds / 2 or 
-			self.number_of_rounds_done == self.number_of_rounds):
-			# If we've played the correct amount of rounds, or there's no point in continuing further:
-			groups.empty_after_round()
-			gameover.GameOver(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score, self.winner)
-		else:
-			groups.empty_after_round()
-			matchover.MatchOver(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score, self.number_of_rounds_done, self.winner)
+		# Empty all the other groups as well.
+		groups.empty_after_round()
 
-		if not self.next_screen is None:
-			# The game is over so we empty all the groups.
-			groups.empty_all()
-			self.next_screen(self.window_surface, self.main_clock)
+		# Write down how often the expensive things happened this round (see counters).
+		counters.finish_round()
 
-		# Otherwise, we simply let this scene end.
+		# The match is over if we've played the correct amount of rounds, or if there's no point in continuing further.
+		return (self.score[self.player_one] > self.number_of_rounds / 2 or 
+				self.score[self.player_two] > self.number_of_rounds / 2 or 
+				self.number_of_rounds_done == self.number_of_rounds)
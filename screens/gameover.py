@@ -14,6 +14,7 @@ import gui.listmenu as listmenu
 import settings.settings as settings
 import settings.graphics as graphics
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 import screens
 
 """
@@ -82,8 +83,6 @@ class GameOver(scene.Scene):
 		# Setup and play music.
 		self.setup_music()
 
-		self.gameloop()
-
 	def setup_winner_text(self):
 		# Determine if there is a clear winner, or if there is a draw.
 		if not self.winner is None:
@@ -112,7 +111,7 @@ class GameOver(scene.Scene):
 
 	def setup_music(self):
 		# Set the music list.
-		self.__class__.music_list = settings.AFTER_GAME_MUSIC
+		self.__class__.music_list = settings.get_music("postgame")
 		self.play_music()
 
 	def quit(self, item):
@@ -149,8 +148,7 @@ class GameOver(scene.Scene):
 		for projectile in groups.Groups.projectile_group:
 			projectile.update(self.main_clock)
 
-		for particle in groups.Groups.particle_group:
-			particle.update(self.main_clock)
+		groups.Groups.particle_system.update(self.main_clock)
 
 		# Update the winning player text.
 		self.passed_time += self.main_clock.get_time()
@@ -198,8 +196,7 @@ class GameOver(scene.Scene):
 		for projectile in groups.Groups.projectile_group:
 			projectile.draw(self.window_surface)
 
-		for particle in groups.Groups.particle_group:
-			particle.draw(self.window_surface)
+		groups.Groups.particle_system.draw(self.window_surface)
 
 		# Draw the winning players name.
 		for letter_item in self.winning_player_text:
@@ -215,10 +212,10 @@ class GameOver(scene.Scene):
 			# If a rematch was selected, we reset the score and start a new instance of Game.
 			self.score[self.player_one] = 0
 			self.score[self.player_two] = 0
-			self.next_screen(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score)
+			scenemanager.replace(self.next_screen(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score))
 		elif not self.next_screen is None:
 			# If quit was selected, we empty all the groups and return to the main menu.
 			groups.empty_all()
-			self.next_screen(self.window_surface, self.main_clock)
+			scenemanager.reset(self.next_screen(self.window_surface, self.main_clock))
 
 		# Else, we simply let this scene end.
\ No newline at end of file
@@ -54,9 +54,6 @@ class GraphicsMenu(scene.Scene):
 		self.transition.setup_transition(self.graphics_menu_right, False, True, False, False)
 		self.transition.setup_transition(self.back_menu, True, True, False, False)
 
-		# And finally, start the gameloop!
-		self.gameloop()
-
 	def setup_graphics_menu(self):
 		self.graphics_menu_left = self.setup_menu_left()
 		self.graphics_menu_right = self.setup_menu_right()
@@ -147,10 +144,12 @@ class GraphicsMenu(scene.Scene):
 		# Every frame begins by filling the whole screen with the background color.
 		self.window_surface.fill(settings.BACKGROUND_COLOR)
 
-		# Draw the title logo.
-		self.title_logo.draw(self.window_surface)
+		# Draw the title logo. The background is a single color, so the logo and the menus are the only things that change on the screen.
+		dirty_rects = [self.title_logo.draw(self.window_surface)]
 
 		# If the logo is in place, draw the currently active menu to the screen.
 		if self.title_logo.x == self.logo_desired_position[0] and self.title_logo.y == self.logo_desired_position[1]:
 			for a_menu in self.menu_list:
-				a_menu.draw(self.window_surface)
\ No newline at end of file
+				dirty_rects.extend(a_menu.draw(self.window_surface))
+
+		return dirty_rects
\ No newline at end of file
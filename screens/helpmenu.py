@@ -5,13 +5,16 @@ import pygame, sys
 import os
 import json
 from pygame.locals import *
+import other.archive as archive
 import other.useful as useful
+import other.tracer as tracer
 import gui.textitem as textitem
 import gui.listmenu as listmenu
 import gui.gridmenu as gridmenu
 import gui.imageitem as imageitem
 import settings.settings as settings
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 
 """
 
@@ -71,7 +74,7 @@ class HelpMenu(scene.Scene):
 
 		# We setup and add all the necessary items to the help_menu.
 		root = "res/helpdata"
-		for file in os.listdir(root):
+		for file in archive.listdir(root):
 			if file.endswith(".json"):
 				self.setup_info(os.path.join(root, file))
 
@@ -90,9 +93,6 @@ class HelpMenu(scene.Scene):
 		if len(self.help_menu.items) > 0:
 			self.view_info(self.help_menu.items[0])
 
-		# And finally, we start the gameloop!
-		self.gameloop()
-
 	def view_info(self, item):
 		# Unless the chosen info is the same as the currently active info, set the active info to the one chosen by the user.
 		new_active_info = self.choose_active_info(item, self.help_menu)
@@ -122,17 +122,15 @@ class HelpMenu(scene.Scene):
 		# At last, return the matching information in the info dictionary.
 		return self.info[item]
 
+	@tracer.traced("HelpMenu.setup_info")
 	def setup_info(self, file_path):
 		texts = []
 
 		# Parse the JSON file.
-		json_file = open(file_path, "r")
 		try:
-			parsed_json = json.load(json_file)
+			parsed_json = json.loads(archive.read_file(file_path))
 		except IOError:
-			print("IOError when reading JSON file.")		
-		finally:
-			json_file.close()
+			print("IOError when reading JSON file.")
 
 
 		# We try to parse the image tag in the JSON file. If it isn't found, an error is raised.
@@ -278,6 +276,6 @@ class HelpMenu(scene.Scene):
 	def on_exit(self):
 		if not self.next_screen is None:
 			# If there is a next screen set, start that.
-			self.next_screen(self.window_surface, self.main_clock)
+			scenemanager.replace(self.next_screen(self.window_surface, self.main_clock))
 		
 		# Else, we simply let this scene end.
\ No newline at end of file
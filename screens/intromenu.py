@@ -8,6 +8,7 @@ import gui.textitem as textitem
 import gui.logo as logo
 import settings.settings as settings
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 
 # From the intromenu the only screen we can go to is the mainmenu, so we import it here.
 import screens.mainmenu as mainmenu
@@ -41,9 +42,6 @@ class IntroMenu(scene.Scene):
 		# Setup and play music.
 		self.setup_music()
 
-		# Start the gameloop, as usual!
-		self.gameloop()
-
 	def setup_title_logo(self):
 		# Loads the logo, positions it and then returns the logo object.
 		self.title_logo = logo.Logo()
@@ -82,7 +80,7 @@ class IntroMenu(scene.Scene):
 		self.version_message.y = settings.SCREEN_HEIGHT - self.version_message.get_height() - self.version_message.font_size
 
 	def setup_music(self):
-		self.__class__.music_list = settings.TITLE_MUSIC
+		self.__class__.music_list = settings.get_music("title")
 		self.play_music()
 
 	def event(self, event):
@@ -125,4 +123,4 @@ class IntroMenu(scene.Scene):
 
 	def on_exit(self):
 		# We're done, so continue to the main menu.
-		mainmenu.MainMenu(self.window_surface, self.main_clock, self.title_logo)
\ No newline at end of file
+		scenemanager.replace(mainmenu.MainMenu(self.window_surface, self.main_clock, self.title_logo))
\ No newline at end of file
@@ -7,6 +7,8 @@ import objects.blocks.block as block
 import objects.blocks.normal as normalblock
 import objects.blocks.strong as strongblock
 import objects.blocks.weak as weakblock
+import objects.groups as groups
+import other.tracer as tracer
 import settings.settings as settings
 
 """
@@ -19,6 +21,7 @@ The "level" generated by this class can be changed by passing different values t
 
 class Level:
 	
+	@tracer.traced("Level.__init__")
 	def __init__(self, player_one, player_two, amount_of_strong, amount_of_normal, amount_of_weak):
 		# These variables are used to construct the level out of blocks.
 		distance_to_blocks_from_left_wall = 0#block.Block.width * 2
@@ -28,6 +31,9 @@ class Level:
 		self.amount_of_weak = amount_of_weak
 		amount_of_rows = settings.LEVEL_HEIGHT / block.Block.height # - (block.Block.height * 2)
 
+		# The blocks are placed in a grid, so we tell the block group the size of the cells in that grid.
+		groups.Groups.block_group.set_cell_size(block.Block.width, block.Block.height)
+
 		# Create and place the given amount of strong blocks.
 		for x in range(0, amount_of_strong):
 			for y in range(0, amount_of_rows):
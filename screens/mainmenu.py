@@ -11,6 +11,7 @@ import gui.transition as transition
 import settings.settings as settings
 import settings.graphics as graphics
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 
 # These are the screens we can reach directly from the main menu, so we import them here.
 import screens.preparemenu as preparemenu
@@ -50,9 +51,6 @@ class MainMenu(scene.Scene):
 		# Setup and play music.
 		self.setup_music()
 
-		# And finally, start the gameloop!
-		self.gameloop()
-
 	def setup_main_menu(self):
 		self.main_menu = listmenu.ListMenu(settings.SCREEN_WIDTH / 2.0, settings.SCREEN_HEIGHT / 2.0)
 		self.main_menu.add(textitem.TextItem("Start"), self.start)
@@ -63,12 +61,10 @@ class MainMenu(scene.Scene):
 		self.menu_list.append(self.main_menu)
 
 	def options(self, item):
-		optionsmenu.OptionsMenu(self.window_surface, self.main_clock, self.title_logo)
-		self.transition.setup_odd_even_transition(self.main_menu, True, True, False, False)
+		scenemanager.push(optionsmenu.OptionsMenu(self.window_surface, self.main_clock, self.title_logo))
 
 	def help(self, item):
-		helpmenu.HelpMenu(self.window_surface, self.main_clock)
-		self.transition.setup_odd_even_transition(self.main_menu, True, True, False, False)
+		scenemanager.push(helpmenu.HelpMenu(self.window_surface, self.main_clock))
 
 	def setup_logo(self, title_logo):
 		if title_logo is None:
@@ -88,7 +84,7 @@ class MainMenu(scene.Scene):
 		self.logo_transition.speed = 120 * settings.GAME_SCALE
 
 	def setup_music(self):
-		self.__class__.music_list = settings.TITLE_MUSIC
+		self.__class__.music_list = settings.get_music("title")
 		if not pygame.mixer.music.get_busy():
 			# We only care about loading and playing the music if it isn't already playing.
 			self.play_music()
@@ -129,12 +125,14 @@ class MainMenu(scene.Scene):
 		# Every frame begins by filling the whole screen with the background color.
 		self.window_surface.fill(settings.BACKGROUND_COLOR)
 
-		# Draw the title logo.
-		self.title_logo.draw(self.window_surface)
+		# Draw the title logo. The background is a single color, so the logo and the menu are the only things that change on the screen.
+		dirty_rects = [self.title_logo.draw(self.window_surface)]
 
 		# If the logo is in place, draw the currently active menu to the screen.
 		if self.title_logo.x == self.logo_desired_position[0] and self.title_logo.y == self.logo_desired_position[1]:
-			self.main_menu.draw(self.window_surface)
+			dirty_rects.extend(self.main_menu.draw(self.window_surface))
+
+		return dirty_rects
 
 	def on_exit(self):
 		if self.next_screen is None:
@@ -143,13 +141,10 @@ class MainMenu(scene.Scene):
 			graphics.save()
 			pygame.quit()
 			sys.exit()
-		elif self.next_screen is helpmenu.HelpMenu:
-			# We start the help screen or the about screen and send them a reference to this instance, so they can return to it later.
-			# We also setup the transitions, so when they return they transition in.
-			self.transition.setup_odd_even_transition(self.main_menu, True, True, False, False)
-			self.next_screen(self.window_surface, self.main_clock, self)
-		elif not self.next_screen is None:
+		else:
 			# Else, we just start the next screen with the default parameters.
-			self.next_screen(self.window_surface, self.main_clock)
+			scenemanager.replace(self.next_screen(self.window_surface, self.main_clock))
 
-		# Otherwise we simply let this scene end.
\ No newline at end of file
+	def on_resume(self):
+		# We're back from the options or the help menu, so we let the menu transition in again.
+		self.transition.setup_odd_even_transition(self.main_menu, True, True, False, False)
\ No newline at end of file
@@ -12,6 +12,7 @@ import gui.listmenu as listmenu
 import settings.settings as settings
 import settings.graphics as graphics
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 import screens.confirmationmenu as confirmationmenu
 import screens
 
@@ -58,9 +59,6 @@ class MatchOver(scene.Scene):
 		# Setup and play music.
 		self.setup_music()
 
-		# And finally, start the gameloop!
-		self.gameloop()
-
 	def setup_menus(self):
 		# This is the distance from the screen edges to the GUI elements
 		item_side_padding = textitem.TextItem.font_size
@@ -140,14 +138,14 @@ class MatchOver(scene.Scene):
 
 	def setup_music(self):
 		# Set the music list.
-		self.__class__.music_list = settings.AFTER_MATCH_MUSIC
+		self.__class__.music_list = settings.get_music("postmatch")
 		self.play_music()
 
 	def maybe_quit(self, item):
 		# We ask the players if they REALLY want to quit, since they're in between matches. Also, we make sure that the confirmation
 		# menu gets a clean window_surface.
 		self.window_surface.blit(self.background_surface, (0, 0))
-		confirmationmenu.ConfirmationMenu(self.window_surface, self.main_clock, self.quit, item)
+		scenemanager.push(confirmationmenu.ConfirmationMenu(self.window_surface, self.main_clock, self.quit, item))
 
 	def quit(self, item):
 		# This is called if the players confirm the quit option.
@@ -207,8 +205,8 @@ class MatchOver(scene.Scene):
 	def on_exit(self):
 		if self.next_screen is screens.game.Game:
 			# Next match is selected, so we start Game.
-			self.next_screen(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score, self.number_of_rounds_done)
+			scenemanager.replace(self.next_screen(self.window_surface, self.main_clock, self.player_one, self.player_two, self.number_of_rounds, self.score, self.number_of_rounds_done))
 		elif self.next_screen is screens.mainmenu.MainMenu:
 			# Quit is selected, so we return to the main menu.
 			groups.empty_all()
-			self.next_screen(self.window_surface, self.main_clock)
\ No newline at end of file
+			scenemanager.reset(self.next_screen(self.window_surface, self.main_clock))
\ No newline at end of file
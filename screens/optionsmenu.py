@@ -9,6 +9,7 @@ import gui.listmenu as listmenu
 import gui.transition as transition
 import settings.settings as settings
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 
 # These are the screens we can reach directly from the main menu, so we import them here.
 import screens.aboutmenu as aboutmenu
@@ -48,9 +49,6 @@ class OptionsMenu(scene.Scene):
 		# Setup the menu transitions.
 		self.transition.setup_odd_even_transition(self.options_menu, True, True, False, False)
 
-		# And finally, start the gameloop!
-		self.gameloop()
-
 	def setup_options_menu(self):
 		self.options_menu = self.setup_menu()
 		self.options_menu.add(textitem.TextItem("Graphics"), self.graphics)
@@ -61,16 +59,13 @@ class OptionsMenu(scene.Scene):
 		self.menu_list.append(self.options_menu)
 
 	def graphics(self, item):
-		graphicsmenu.GraphicsMenu(self.window_surface, self.main_clock, self.title_logo)
-		self.transition.setup_odd_even_transition(self.options_menu, True, True, False, False)
+		scenemanager.push(graphicsmenu.GraphicsMenu(self.window_surface, self.main_clock, self.title_logo))
 
 	def sound(self, item):
-		soundmenu.SoundMenu(self.window_surface, self.main_clock, self.title_logo)
-		self.transition.setup_odd_even_transition(self.options_menu, True, True, False, False)
+		scenemanager.push(soundmenu.SoundMenu(self.window_surface, self.main_clock, self.title_logo))
 
 	def about(self, item):
-		aboutmenu.AboutMenu(self.window_surface, self.main_clock)
-		self.transition.setup_odd_even_transition(self.options_menu, True, True, False, False)
+		scenemanager.push(aboutmenu.AboutMenu(self.window_surface, self.main_clock))
 
 	def setup_logo(self, title_logo):
 		if title_logo == None:
@@ -114,18 +109,22 @@ class OptionsMenu(scene.Scene):
 		# Every frame begins by filling the whole screen with the background color.
 		self.window_surface.fill(settings.BACKGROUND_COLOR)
 
-		# Draw the title logo.
-		self.title_logo.draw(self.window_surface)
+		# Draw the title logo. The background is a single color, so the logo and the menu are the only things that change on the screen.
+		dirty_rects = [self.title_logo.draw(self.window_surface)]
 
 		# If the logo is in place, draw the currently active menu to the screen.
 		if self.title_logo.x == self.logo_desired_position[0] and self.title_logo.y == self.logo_desired_position[1]:
-			self.options_menu.draw(self.window_surface)
+			dirty_rects.extend(self.options_menu.draw(self.window_surface))
+
+		return dirty_rects
 
 	def on_exit(self):
 		if self.next_screen == aboutmenu.AboutMenu:
-			# We start the help screen or the about screen and send them a reference to this instance, so they can return to it later.
-			# We also setup the transitions, so when they return they transition in.
-			self.transition.setup_odd_even_transition(self.options_menu, True, True, False, False)
-			self.next_screen(self.window_surface, self.main_clock)
+			# We start the about screen instead of this one.
+			scenemanager.replace(self.next_screen(self.window_surface, self.main_clock))
+
+		# Else, we do nothing. This returns to the scene that created this scene.
 
-		# Else, we do nothing. This returns to the scene that created this scene.
\ No newline at end of file
+	def on_resume(self):
+		# We're back from one of the other option menus, so we let the menu transition in again.
+		self.transition.setup_odd_even_transition(self.options_menu, True, True, False, False)
\ No newline at end of file
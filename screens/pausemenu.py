@@ -10,6 +10,7 @@ import objects.groups as groups
 import settings.settings as settings
 import settings.graphics as graphics
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 import screens.confirmationmenu as confirmationmenu
 import screens.optionsmenu as optionsmenu
 import screens
@@ -44,9 +45,6 @@ class PauseMenu(scene.Scene):
 		# Setup the menu transition.
 		self.setup_transition()
 
-		# And finally, start the gameloop!
-		self.gameloop()
-
 	def setup_pause_menu(self):
 		# Creates and adds the items to the pause menu.
 		self.pause_menu = listmenu.ListMenu()
@@ -67,7 +65,7 @@ class PauseMenu(scene.Scene):
 		# Setup the transition so that if we return to the pause menu the items will transition.
 		self.setup_transition()
 
-		optionsmenu.OptionsMenu(self.window_surface, self.main_clock)
+		scenemanager.push(optionsmenu.OptionsMenu(self.window_surface, self.main_clock))
 
 	def maybe_quit(self, item):
 		# Setup the transition so that if we return to the pause menu the items will transition.
@@ -75,7 +73,7 @@ class PauseMenu(scene.Scene):
 
 		# Blit the background surface over the window surface, so that the confirmation menu display over clean background surface.
 		self.window_surface.blit(self.background_surface, (0, 0))
-		confirmationmenu.ConfirmationMenu(self.window_surface, self.main_clock, self.quit, item)
+		scenemanager.push(confirmationmenu.ConfirmationMenu(self.window_surface, self.main_clock, self.quit, item))
 
 	def quit(self, item):
 		# We quit to the main menu, so we stop the music and set the next screen to the main menu.
@@ -103,16 +101,17 @@ class PauseMenu(scene.Scene):
 		self.pause_menu.update(self.main_clock)
 
 	def draw(self):
-		# Begin every frame by blitting the background surface.
+		# Begin every frame by blitting the background surface. It looks the same every frame, so it's not part of the dirty rects.
 		self.window_surface.blit(self.background_surface, (0, 0))
 
-		# Draw the pause menu.
-		self.pause_menu.draw(self.window_surface)
+		# Draw the pause menu. It's the only thing that changes on the screen, so we return the rects it has drawn to.
+		return self.pause_menu.draw(self.window_surface)
 
 	def on_exit(self):
 		if not self.next_screen is None:
-			# Gameloop is over, and since we're going to return to the main menu so we clear all the groups of their contents.
+			# Gameloop is over, and since we're going to return to the main menu so we clear all the groups of their contents. The game
+			# we paused is thrown away as well.
 			groups.empty_all()
-			self.next_screen(self.window_surface, self.main_clock)
+			scenemanager.reset(self.next_screen(self.window_surface, self.main_clock))
 
 		# Else, we do nothing. This resume to the gameloop where this pause menu was created.
\ No newline at end of file
@@ -14,6 +14,7 @@ import gui.imageitem as imageitem
 import screens.toast as toast
 import settings.settings as settings
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 import screens.game as game
 import screens
 
@@ -142,9 +143,6 @@ class PrepareMenu(scene.Scene):
 		self.transition.setup_transition(self.back_menu, True, False, False, True)
 		self.transition.setup_transition(self.start_menu, False, True, False, True)
 
-		# And finally, we start the gameloop!
-		self.gameloop()
-
 	def setup_color_menu(self, function):
 		# Creates a gridmenu and adds all standard color items to that menu.
 		color_menu = gridmenu.GridMenu()
@@ -261,7 +259,7 @@ class PrepareMenu(scene.Scene):
 			self.done = True
 		else:
 			# If a player haven't picked his or hers color, we show a toast that informs the players of this.
-			toast.Toast(self.window_surface, self.main_clock, "Both players need to pick a color before the game can begin.")
+			scenemanager.push(toast.Toast(self.window_surface, self.main_clock, "Both players need to pick a color before the game can begin."))
 
 	def back(self, item = None):
 		# Simply moves back to the main menu.
@@ -328,10 +326,10 @@ class PrepareMenu(scene.Scene):
 			score[player_two] = 0
 
 			# And finally, we start the game!
-			self.next_screen(self.window_surface, self.main_clock, player_one, player_two, self.number_of_rounds, score)
+			scenemanager.replace(self.next_screen(self.window_surface, self.main_clock, player_one, player_two, self.number_of_rounds, score))
 		elif not self.next_screen is None:
-			# For any other screen we just call it using the normal variables.
-			self.next_screen(self.window_surface, self.main_clock)
+			# For any other screen (the main menu) we just call it using the normal variables.
+			scenemanager.reset(self.next_screen(self.window_surface, self.main_clock))
 
 		# Otherwise, we just let this scene end.
 
@@ -5,6 +5,10 @@ import pygame, sys
 from pygame.locals import *
 import random
 import other.debug as debug
+import other.display as display
+import other.profiler as profiler
+import other.capture as capture
+import other.tracer as tracer
 import gui.transition as transition
 import gui.traversal as traversal
 import settings.settings as settings
@@ -14,7 +18,8 @@ import objects.groups as groups
 """
 
 This is the base class of all screens / scenes in the game. It's very simple, it simply handles a few specific events and provides some
-"common ground". Implementing classes have to take care of starting the gameloop themselves.
+"common ground". Creating a scene doesn't run it, the scene manager does that (see scenemanager). It calls step() every frame until the
+scene is done, and then on_exit().
 
 """
 
@@ -23,6 +28,17 @@ class Scene:
 	# We use this list of music to randomly choose what track to play. It's empty here, but subclasses can add to it.
 	music_list = []
 
+	# If this is True, update() is called at the fixed rate of the clock (see GameClock.step) instead of once every frame. Scenes
+	# that do this can use main_clock.interpolation in draw() to draw things in between their last two updates.
+	fixed_timestep = False
+
+	# If the dirty rects of a frame cover more than this much of the screen (0.75 is three quarters), we update the whole display
+	# instead. It's cheaper to update the whole display than a lot of rects that together cover most of it anyway.
+	dirty_area_threshold = 0.75
+
+	# The scene that updated the display last. If this isn't the scene that is drawing, the display shows something else entirely.
+	last_drawn_scene = None
+
 	def __init__(self, window_surface, main_clock):
 		# Store the game variables.
 		self.window_surface = window_surface
@@ -35,6 +51,12 @@ class Scene:
 		# We also store a list of all menus, for use with the traversal code.
 		self.menu_list = []	
 
+		# This is set to True when the scene should end.
+		self.done = False
+
+		# The rects that were drawn to in the last frame, or None if the whole screen was (see update_display).
+		self.previous_dirty_rects = None
+
 		# We also set pygame to send an event every time a song ends, so that scenes can know and then restart the music.
 		pygame.mixer.music.set_endevent(settings.MUSIC_EVENT)
 
@@ -44,42 +66,97 @@ class Scene:
 			pygame.mixer.music.load(choice)
 		pygame.mixer.music.play()
 
-	def gameloop(self):
-		self.done = False
-		while not self.done:
-			# Constrain the game to a set maximum amount of FPS, and update the delta time value.
-			self.main_clock.tick(graphics.MAX_FPS)
-
-			# Check for any events.
-			for event in pygame.event.get():
-				if event.type == QUIT:
-					# If the window is closed, the game is shut down.
-					sys.exit()
-					pygame.quit()
-				elif (event.type == settings.MUSIC_EVENT):
-					self.play_music()
-
-				# Subclasses implementing this class should handle their events in self.event(event).
-				self.event(event)
-
-				# We try to traverse the menus, if there is any.
-				traversal.traverse_menus(event, self.menu_list)
-
-			# Call the update method. Implement the handling of all game logic in this method.
+	def step(self, render = True):
+		# Runs a single frame of the scene. The scene manager simply calls this until the scene is done, but it can also be called
+		# directly to drive a scene one frame at a time (this is what the headless mode does). If render is False, nothing is drawn.
+
+		# Every frame is profiled in debug mode, so we can see where the time goes (see profiler).
+		profiler.begin_frame(self.__class__.__name__ + ".step")
+		capture.begin_frame()
+		tracer.end_frame()
+
+		# Constrain the game to a set maximum amount of FPS, and update the delta time value. If we're being profiled with cProfile (see
+		# capture), the waiting isn't profiled, since it's not real work.
+		capture.pause()
+		self.main_clock.tick(graphics.MAX_FPS)
+		capture.resume()
+		profiler.mark("tick wait")
+
+		# Check for any events.
+		for event in pygame.event.get():
+			# If the game is scaled up to the window, mouse positions have to be scaled down to match what we draw.
+			event = display.convert_event(event)
+
+			if event.type == QUIT:
+				# If the window is closed, the game is shut down.
+				sys.exit()
+				pygame.quit()
+			elif (event.type == settings.MUSIC_EVENT):
+				self.play_music()
+
+			# Subclasses implementing this class should handle their events in self.event(event).
+			self.event(event)
+
+			# We try to traverse the menus, if there is any.
+			traversal.traverse_menus(event, self.menu_list)
+		profiler.mark("events")
+
+		# Call the update method. Implement the handling of all game logic in this method.
+		if self.__class__.fixed_timestep:
+			# We update as many times as the time that has passed allows. We stop if the scene ends, since there's no point in
+			# updating a scene that is done.
+			while not self.done and self.main_clock.step():
+				self.update()
+		else:
 			self.update()
 
-			# Call the draw method. Implement all drawing/blitting etc. in this method.
-			self.draw()
-
-			# Display various debug information, if debug mode is enabled.
-			if settings.DEBUG_MODE and not self.done:
-				debug.Debug.display(self.window_surface, self.main_clock)
-
-			# Finally, update the display.
-			pygame.display.update()
-
-		# The gameloop is over, so call the exit method.
-		self.on_exit()
+			# We don't use the accumulated time, so we throw it away. Otherwise a scene with a fixed timestep that we return to (like
+			# the game after the pause menu) would try to catch up on all the time spent in this scene.
+			self.main_clock.accumulator = 0
+		profiler.mark("update")
+
+		# Nothing more to do if we're not supposed to draw anything.
+		if not render:
+			return
+
+		# Call the draw method. Implement all drawing/blitting etc. in this method.
+		dirty_rects = self.draw()
+		profiler.mark("draw")
+
+		# Display various debug information, if debug mode is enabled.
+		if settings.DEBUG_MODE and not self.done:
+			debug.Debug.display(self.window_surface, self.main_clock)
+
+			# The debug information is drawn on top of everything else, so we simply update the whole display.
+			dirty_rects = None
+			profiler.mark("debug overlay")
+
+		# Finally, update the display.
+		self.update_display(dirty_rects)
+		profiler.mark("display.update")
+
+	def update_display(self, dirty_rects):
+		# Updates the parts of the display given by dirty_rects, or the whole display if dirty_rects is None.
+		#
+		# The parts that were drawn to in the last frame are updated as well, since whatever was drawn there might have moved away
+		# (and then that part of the screen has to be updated to show the background again).
+		if dirty_rects is None or self.previous_dirty_rects is None or not Scene.last_drawn_scene is self:
+			# Either something has changed all over the screen (in this frame or the last one), or this is the first frame we draw (or
+			# another scene has been drawn since our last frame, like a menu we just returned from). Either way, the whole display is
+			# out of date.
+			rects = None
+		else:
+			rects = display.merge_rects(dirty_rects + self.previous_dirty_rects)
+
+			# If most of the screen has changed anyway, it's cheaper to update all of it.
+			dirty_area = sum(rect.width * rect.height for rect in rects)
+			if dirty_area > self.__class__.dirty_area_threshold * settings.SCREEN_WIDTH * settings.SCREEN_HEIGHT:
+				rects = None
+
+		Scene.last_drawn_scene = self
+		self.previous_dirty_rects = dirty_rects
+
+		display.update(rects)
 
 	def event(self, event):
 		# Handle events in this method.
@@ -90,9 +167,14 @@ class Scene:
 		pass
 
 	def draw(self):
-		# Handle all drawing in this method.
+		# Handle all drawing in this method. If only some parts of the screen change from frame to frame, return a list of the rects that
+		# were drawn to (see update_display). Returning nothing means the whole screen might have changed.
 		pass
 
 	def on_exit(self):
-		# Handle what to do when the gameloop ends in this method.
+		# Handle what to do when the gameloop ends in this method. This is usually where the next scene is started (see scenemanager).
+		pass
+
+	def on_resume(self):
+		# Called when we return to this scene, after a scene that was started on top of it (see scenemanager.push) is done.
 		pass
\ No newline at end of file
@@ -0,0 +1,99 @@
+__author__ = "Olof Karlsson"
+__license__ = "All Rights Reserved"
+
+import other.tracer as tracer
+
+"""
+
+The scene manager runs the scenes of the game, one at a time.
+
+Scenes used to start their own gameloop when they were created, and start the next scene in their on_exit(). That meant that every
+scene ran inside the one before it, so every scene we had ever been to (with all of its surfaces and menus) was kept around until the
+game quit, and a long enough session would eventually hit the recursion limit.
+
+Now, creating a scene doesn't run it. Instead, scenes are kept on a stack, and the manager runs the scene on the top of the stack until
+it's done. Then it calls its on_exit(), throws it away, and continues with whatever is on the top of the stack. There are three ways to
+start a scene:
+
+	* push() puts a scene on top of the running one. When it's done, we return to the scene below it, which is told so with a call to
+	  on_resume(). This is what menus that return to where they were opened from (like the pause menu) use.
+	* replace() puts a scene where the running one is. This is normally called from on_exit(), to move on to the next screen (like from
+	  the splash screen to the intro menu).
+	* reset() throws away every scene on the stack and starts over with the given one (like when we quit to the main menu in the middle
+	  of a game).
+
+The one scene manager used by the whole game is stored in MANAGER, and the functions at the bottom of this module are shortcuts for it.
+The game pushes the splash screen and then calls run(), which returns once there are no scenes left.
+
+"""
+
+class SceneManager():
+
+	def __init__(self):
+		# The scenes that have been started but aren't done yet. The last one is the one that is running, the others are waiting for the
+		# scenes above them to be done.
+		self.stack = []
+
+	def __len__(self):
+		return len(self.stack)
+
+	def get_scene(self):
+		# Returns the running scene, or None if there isn't one.
+		if len(self.stack) == 0:
+			return None
+		return self.stack[-1]
+
+	def push(self, scene):
+		# Runs scene on top of the running scene. Once it's done, we return to the running scene.
+		self.stack.append(scene)
+
+	def replace(self, scene):
+		# Runs scene instead of the running scene. If this isn't called from on_exit(), the running scene is thrown away without being
+		# told.
+		if len(self.stack) > 0:
+			self.stack.pop()
+		self.stack.append(scene)
+
+	def reset(self, scene):
+		# Throws away every scene and runs scene.
+		self.stack = [scene]
+
+	def run(self):
+		# Runs the scenes on the stack until there are none left. Push the first scene before calling this (we don't take it as an
+		# argument, since then we would keep it around for as long as the game runs).
+		while len(self.stack) > 0:
+			if self.stack[-1].done:
+				self.end_scene()
+			else:
+				self.stack[-1].step()
+
+	def end_scene(self):
+		# Ends the running scene. Its on_exit() usually starts the next scene, so we keep it on the stack until then (so that replace()
+		# replaces it, and not the scene below it).
+		scene = self.stack[-1]
+		waiting = self.stack[:-1]
+		scene.on_exit()
+		if scene in self.stack:
+			self.stack.remove(scene)
+
+		# This is a good moment to write the timeline, since a short hitch between two scenes doesn't matter (see tracer).
+		tracer.flush()
+
+		# If we've returned to a scene that was waiting, we let it know.
+		if len(self.stack) > 0 and self.stack[-1] in waiting:
+			self.stack[-1].on_resume()
+
+# The scene manager used by the whole game.
+MANAGER = SceneManager()
+
+def push(scene):
+	MANAGER.push(scene)
+
+def replace(scene):
+	MANAGER.replace(scene)
+
+def reset(scene):
+	MANAGER.reset(scene)
+
+def run():
+	MANAGER.run()
@@ -57,9 +57,6 @@ class SoundMenu(scene.Scene):
 		self.transition.setup_transition(self.sound_volume_menu, False, True, False, False)
 		self.transition.setup_transition(self.back_menu, True, True, False, False)
 
-		# And finally, start the gameloop!
-		self.gameloop()
-
 	def setup_sound_menu(self):
 		self.music_item = textitem.TextItem("Music Volume:")
 		self.music_item.x = self.music_item.get_height()
@@ -174,12 +171,15 @@ class SoundMenu(scene.Scene):
 		# Every frame begins by filling the whole screen with the background color.
 		self.window_surface.fill(settings.BACKGROUND_COLOR)
 
-		# Draw the title logo.
-		self.title_logo.draw(self.window_surface)
+		# Draw the title logo. The background is a single color, so the logo, the items and the menus are the only things that change on
+		# the screen.
+		dirty_rects = [self.title_logo.draw(self.window_surface)]
 
 		# If the logo is in place, draw the currently active menu to the screen.
 		if self.title_logo.x == self.logo_desired_position[0] and self.title_logo.y == self.logo_desired_position[1]:
-			self.music_item.draw(self.window_surface)
-			self.sound_item.draw(self.window_surface)
+			dirty_rects.append(self.music_item.draw(self.window_surface))
+			dirty_rects.append(self.sound_item.draw(self.window_surface))
 			for a_menu in self.menu_list:
-				a_menu.draw(self.window_surface)
\ No newline at end of file
+				dirty_rects.extend(a_menu.draw(self.window_surface))
+
+		return dirty_rects
\ No newline at end of file
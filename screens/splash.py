@@ -3,9 +3,12 @@ __license__ = "All Rights Reserved"
 
 import pygame, sys
 from pygame.locals import *
+import other.archive as archive
+import other.assets as assets
 import settings.settings as settings
 import settings.graphics as graphics
 import screens.scene as scene
+import screens.scenemanager as scenemanager
 
 # We need to be able to proceed to the intromenu, so we import it.
 import screens.intromenu as intromenu
@@ -21,8 +24,9 @@ They cross once, and the second time they're supposed to cross the join to form
 
 class Splash(scene.Scene):
 
-	# The splash image is loaded, scaled so it fits the SCREEN_HEIGHT and then split into two halves.
-	splash = pygame.image.load("res/splash/splash_color.png")
+	# The splash image is loaded, scaled so it fits the SCREEN_HEIGHT and then split into two halves. This is the one image we need
+	# right away, so it's loaded here instead of along with everything else.
+	splash = pygame.image.load(archive.open_file("res/splash/splash_color.png"), "res/splash/splash_color.png")
 	splash = pygame.transform.scale(splash, (settings.SCREEN_HEIGHT, settings.SCREEN_HEIGHT))
 	splash_top_half = splash.subsurface(pygame.Rect((0, 0), (splash.get_width(), splash.get_height() / 2)))
 	splash_bottom_half = splash.subsurface(pygame.Rect((0, (splash.get_height()) / 2), (splash.get_width(), splash.get_height() / 2)))
@@ -61,9 +65,6 @@ class Splash(scene.Scene):
 		# Keeps track of how much time has passed.
 		self.time_passed = 0
 
-		# And finally we start the gameloop!
-		self.gameloop()
-
 	def event(self, event):
 		if ((event.type == KEYDOWN and event.key in [K_ESCAPE, K_RETURN]) or 
 		   (event.type == JOYBUTTONDOWN and event.button in settings.JOY_BUTTON_SKIP)):
@@ -112,5 +113,9 @@ class Splash(scene.Scene):
 			self.window_surface.blit(Splash.splash_bottom_half, (self.bottom_half_x, self.bottom_half_y))
 
 	def on_exit(self):
+		# Everything else has been loading in the background while the splash played (see mBreak.main), and the screens after this one
+		# use it, so we wait for it to finish.
+		assets.finish_loading()
+
 		# The gameloop is over, so we proceed to the intromenu!
-		intromenu.IntroMenu(self.window_surface, self.main_clock)
\ No newline at end of file
+		scenemanager.replace(intromenu.IntroMenu(self.window_surface, self.main_clock))
\ No newline at end of file
@@ -56,9 +56,6 @@ class Toast(scene.Scene):
 				self.transition.setup_single_item_transition(message, True, True, False, False)
 		self.transition.setup_single_item_transition(self.toast_menu.items[0], True, True, False, True)
 
-		# And finally, start the gameloop!
-		self.gameloop()
-
 	def setup_toast_menu(self):
 		# Creates and adds the items to the toast menu.
 		self.toast_menu = listmenu.ListMenu()
@@ -86,12 +83,15 @@ class Toast(scene.Scene):
 		self.toast_menu.update(self.main_clock)
 
 	def draw(self):
-		# Begin every frame by blitting the background surface.
+		# Begin every frame by blitting the background surface. It looks the same every frame, so it's not part of the dirty rects.
 		self.window_surface.blit(self.background_surface, (0, 0))
 
 		# Draw the toast message.
+		dirty_rects = []
 		for message in self.message:
-			message.draw(self.window_surface)
+			dirty_rects.append(message.draw(self.window_surface))
 
 		# Draw the toast menu.
-		self.toast_menu.draw(self.window_surface)
+		dirty_rects.extend(self.toast_menu.draw(self.window_surface))
+
+		return dirty_rects
@@ -20,6 +20,10 @@ BACKGROUND = True
 FULLSCREEN = False
 MAX_FPS = 60
 
+# If this is True, the game is drawn at its own (unscaled) resolution and then scaled up to fill the window, instead of drawing
+# everything scaled up. This is a lot faster on slow computers, but things look a bit blockier. See settings.set_game_scale().
+NATIVE_RENDER = False
+
 def load():
 	# Tries to load the graphics options from settings.txt.
 	global SHADOWS
@@ -29,6 +33,7 @@ def load():
 	global BACKGROUND
 	global FULLSCREEN
 	global MAX_FPS
+	global NATIVE_RENDER
 
 	# We have to make sure we always call settings.load() before graphics.load(), since settings.load()
 	# takes care of creating the .txt file. mBreak.py does it in this way.
@@ -51,6 +56,8 @@ def load():
 				FULLSCREEN = bool(int(line.strip("fullscreen").strip()))
 			elif "maxfps" in line:
 				MAX_FPS = int(line.strip("maxfps").strip())
+			elif "nativerender" in line:
+				NATIVE_RENDER = bool(int(line.strip("nativerender").strip()))
 	finally:
 		file.close()
 			
@@ -61,6 +68,7 @@ def save():
 	global TRACES
 	global BACKGROUND
 	global FULLSCREEN
+	global NATIVE_RENDER
 
 	# We use a temporary file to write to, so we don't corrupt our old file if the process fails.
 	temp_file = open("settings.txt.tmp", "w")
@@ -83,6 +91,8 @@ def save():
 				temp_file.write(line.replace(line.strip("fullscreen").strip(), str(int(FULLSCREEN))))
 			elif "maxfps" in line:
 				temp_file.write(line.replace(line.strip("maxfps").strip(), str(int(MAX_FPS))))
+			elif "nativerender" in line:
+				temp_file.write(line.replace(line.strip("nativerender").strip(), str(int(NATIVE_RENDER))))
 			else:
 				temp_file.write(line)
 	finally:		
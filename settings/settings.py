@@ -21,6 +21,14 @@ GAME_VERSION = "v0.9"
 # whatever you want, of course.
 GAME_SCALE = 3
 
+# The window is this many times bigger than what the game is drawn at. Normally this is 1, since the game is drawn already scaled by
+# GAME_SCALE, but if the game is drawn at its own resolution instead (see set_game_scale()), this is what it's scaled up by.
+WINDOW_SCALE = 1
+
+# The size of the window, if it isn't simply the size of the screen times WINDOW_SCALE. set_game_scale() sets this when the window
+# isn't an exact multiple of the new resolution, so that the window still gets the size it was supposed to have (see display.create()).
+WINDOW_SIZE = None
+
 # This is the amount of ticks that the game will be designed to work with. When the game runs at any other FPS than this, delta time calculations
 # will make sure that the game still plays as if the game ran at 60 FPS.
 GAME_FPS = 60
@@ -44,25 +52,9 @@ BORDER_COLOR = (200, 200, 200)
 # Music settings
 root = "res/music"
 
-TITLE_MUSIC = []
-for path in os.listdir(os.path.join(root, "title")):
-	TITLE_MUSIC.append(os.path.join(root, "title", path))
-
-ABOUT_MUSIC = []
-for path in os.listdir(os.path.join(root, "about")):
-	ABOUT_MUSIC.append(os.path.join(root, "about", path))
-
-GAME_MUSIC = []
-for path in os.listdir(os.path.join(root, "game")):
-	GAME_MUSIC.append(os.path.join(root, "game", path))
-
-AFTER_GAME_MUSIC = []
-for path in os.listdir(os.path.join(root, "postgame")):
-	AFTER_GAME_MUSIC.append(os.path.join(root, "postgame", path))
-
-AFTER_MATCH_MUSIC = []
-for path in os.listdir(os.path.join(root, "postmatch")):
-	AFTER_MATCH_MUSIC.append(os.path.join(root, "postmatch", path))
+# The paths of the music in every folder in root, stored with the name of the folder as key. A folder is only listed the first time its
+# music is asked for (see get_music).
+MUSIC = {}
 
 MUSIC_EVENT = pygame.locals.USEREVENT
 
@@ -93,9 +85,23 @@ JOY_BUTTON_SKIP = [2, 9]
 DEBUG_MODE = True
 DEBUG_FONT = "fonts/ADDLG___.TTF"
 
+# When this is true, the game counts how often the expensive things happen (like collision checks and colorized images) and writes
+# the numbers for every round to a file (see counters).
+COUNTERS = False
+
+# When this is true, the game records a timeline of every frame (and of loading and setting things up) and writes it to a file that can
+# be opened in chrome://tracing or Perfetto (see tracer).
+TRACING = False
+
+# When this is true, the game runs without a window, sound or player input. Scenes are then driven frame by frame by the caller
+# instead of running their own gameloop. This is set by the headless module, there's no reason to change it here.
+HEADLESS = False
+
 def load():
 	# Tries to load the settings from settings.txt.
 	global DEBUG_MODE
+	global COUNTERS
+	global TRACING
 	global PLAYER_ONE_NAME
 	global PLAYER_TWO_NAME
 
@@ -107,6 +113,8 @@ def load():
 		# If the file doesn't exist, fill it with the default values.
 		file = open("settings.txt", "w")
 		file.write("debugmode 	0\n")
+		file.write("counters 	0\n")
+		file.write("tracing 	0\n")
 		file.write("\n")
 		file.write("# PLAYER 1 SETTINGS\n")
 		file.write("p1name		" + PLAYER_ONE_NAME + "\n")
@@ -120,6 +128,7 @@ def load():
 		file.write("flashes 	1\n")
 		file.write("traces 		1\n")
 		file.write("background 	1\n")
+		file.write("nativerender	0\n")
 		file.write("resolution	855x480")
 		file.close()
 
@@ -130,6 +139,10 @@ def load():
 		for line in file:
 			if "debugmode" in line:
 				DEBUG_MODE = bool(int(line.strip("debugmode").strip()))
+			elif "counters" in line:
+				COUNTERS = bool(int(line.strip("counters").strip()))
+			elif "tracing" in line:
+				TRACING = bool(int(line.strip("tracing").strip()))
 			elif "p1name" in line:
 				PLAYER_ONE_NAME = line.strip("p1name").strip()
 			elif "p2name" in line:
@@ -157,6 +170,39 @@ def set_resolution(width, height):
 	LEVEL_MAX_X = LEVEL_X + LEVEL_WIDTH
 	LEVEL_MAX_Y = LEVEL_Y + LEVEL_HEIGHT
 
+def set_game_scale(game_scale):
+	# Changes GAME_SCALE, but keeps the size of the window. Whatever is drawn is then scaled by WINDOW_SCALE to fill the window. For
+	# example, setting this to 1 (when GAME_SCALE is 3) means that the game is drawn at its own resolution, and then scaled up three
+	# times. Since all the sizes and positions in the game are multiplied by GAME_SCALE, they work at any scale. This has to be called
+	# before any of the game objects are imported though, since they use GAME_SCALE when they're loaded.
+	global GAME_SCALE
+	global WINDOW_SCALE
+	global WINDOW_SIZE
+	global LEVEL_WIDTH
+	global LEVEL_HEIGHT
+
+	window_width, window_height = get_window_size()
+
+	WINDOW_SCALE = (WINDOW_SCALE * GAME_SCALE) / game_scale
+	GAME_SCALE = game_scale
+
+	LEVEL_WIDTH = 176 * GAME_SCALE
+	LEVEL_HEIGHT = 120 * GAME_SCALE
+	set_resolution(window_width / WINDOW_SCALE, window_height / WINDOW_SCALE)
+
+	# The window might not be an exact multiple of the new resolution (1366 / 3 leaves a pixel over, for example). In that case we
+	# keep the window as big as it was, and the game is centered in it.
+	if (SCREEN_WIDTH * WINDOW_SCALE, SCREEN_HEIGHT * WINDOW_SCALE) == (window_width, window_height):
+		WINDOW_SIZE = None
+	else:
+		WINDOW_SIZE = (window_width, window_height)
+
+def get_window_size():
+	# Returns the size of the window.
+	if WINDOW_SIZE is None:
+		return (SCREEN_WIDTH * WINDOW_SCALE, SCREEN_HEIGHT * WINDOW_SCALE)
+	return WINDOW_SIZE
+
 def save():
 	# Tries to save the settings to settings.txt.
 	global DEBUG_MODE
@@ -191,4 +237,9 @@ def save():
 		os.remove("settings.txt.backup")
 	except OSError:
 		print("Error renaming and removing temporary file at end of the procedure.")
-		
\ No newline at end of file
+
+def get_music(folder):
+	# Returns a list of the paths of all the music in the given folder of root (like "title" or "game").
+	if not folder in MUSIC:
+		MUSIC[folder] = [os.path.join(root, folder, path) for path in os.listdir(os.path.join(root, folder))]
+	return MUSIC[folder]
\ No newline at end of file